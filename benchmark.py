@@ -1,9 +1,261 @@
 #!/usr/bin/env python3
 import argparse
+import json
+import subprocess
+import sys
 import time
+from dataclasses import asdict
 
 from ingredient_parser import parse_ingredient
 
+
+def benchmark_serialisation(sentences: list[str], iterations: int):
+    """Compare ParsedIngredient.to_json with dataclasses.asdict and json.dumps.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Sentences to parse and serialise.
+    iterations : int
+        Number of times to serialise each parsed sentence.
+    """
+    parsed = [parse_ingredient(sent) for sent in sentences]
+    total = iterations * len(parsed)
+
+    benchmarks = {
+        "asdict + json.dumps": lambda p: json.dumps(asdict(p), default=str),
+        "to_json": lambda p: p.to_json(),
+        "to_json (compact)": lambda p: p.to_json(compact=True),
+    }
+    for name, func in benchmarks.items():
+        start = time.time()
+        for _ in range(iterations):
+            for p in parsed:
+                func(p)
+        duration = time.time() - start
+        print(f"{name}: {1e6 * duration / total:.2f} us/sentence")
+
+
+def benchmark_pos_tag(sentences: list[str], iterations: int):
+    """Compare part of speech tagging using NLTK with IngredientPOSTagger.
+
+    NLTK's tagger is loaded from the JSON files found by find_pos_tagger, so the
+    comparison is skipped if the tagger has only been bundled as a .npz file.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Sentences to tokenize and tag.
+    iterations : int
+        Number of times to tag each sentence.
+    """
+    from ingredient_parser.en import PreProcessor
+    from ingredient_parser.en._loaders import (
+        find_pos_tagger,
+        load_ingredient_pos_tagger,
+        load_ingredient_tagdict,
+        load_nltk_pos_tagger,
+    )
+    from ingredient_parser.en._utils import tokenize
+
+    tokens = [tokenize(PreProcessor._normalise(sent)) for sent in sentences]
+    total = iterations * len(tokens)
+    tagger = load_ingredient_pos_tagger()
+
+    benchmarks = {
+        "IngredientPOSTagger.tag": lambda: [tagger.tag(t) for t in tokens],
+        "IngredientPOSTagger.tag_many": lambda: tagger.tag_many(tokens),
+    }
+    try:
+        nltk_tagger = load_nltk_pos_tagger(find_pos_tagger())
+        nltk_tagger.tagdict.update(load_ingredient_tagdict())
+        benchmarks = {
+            "nltk PerceptronTagger.tag": lambda: [nltk_tagger.tag(t) for t in tokens],
+            **benchmarks,
+        }
+    except FileNotFoundError:
+        print("NLTK part of speech tagger JSON files not found, skipping NLTK.")
+
+    for name, func in benchmarks.items():
+        start = time.time()
+        for _ in range(iterations):
+            func()
+        duration = time.time() - start
+        print(f"{name}: {1e6 * duration / total:.2f} us/sentence")
+
+
+def benchmark_fdc_match(sentences: list[str], iterations: int):
+    """Compare foundation food matching for each ingredient name, calculating the
+    uSIF and fuzzy document distances to each FDC ingredient in turn, with the
+    vectorised calculations.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Sentences to parse and match the ingredient names of.
+    iterations : int
+        Number of times to match each ingredient name.
+    """
+    import numpy as np
+
+    from ingredient_parser.en._foundationfoods import (
+        FDCIngredientMatch,
+        get_fuzzy_matcher,
+        get_usif_matcher,
+        normalise_spelling,
+    )
+    from ingredient_parser.en._utils import prepare_embeddings_tokens, tokenize
+
+    names = [
+        normalise_spelling(prepare_embeddings_tokens(tuple(tokenize(name.text))))
+        for sent in sentences
+        for name in parse_ingredient(sent).name
+    ]
+    names = [tokens for tokens in names if tokens]
+    total = iterations * len(names)
+    matcher = get_usif_matcher()
+
+    def find_candidate_matches_loop(tokens: list[str], n: int):
+        vec = matcher._embed(prepare_embeddings_tokens(tuple(tokens)))
+        candidates = []
+        for idx, fdc_vec in enumerate(matcher.fdc_vectors):
+            score = 1 - float(
+                np.dot(vec, fdc_vec) / (np.linalg.norm(vec) * np.linalg.norm(fdc_vec))
+            )
+            candidates.append(
+                FDCIngredientMatch(fdc=matcher.fdc_ingredients[idx], score=score)
+            )
+        return sorted(candidates, key=lambda x: x.score)[:n]
+
+    benchmarks = {
+        "uSIF loop": find_candidate_matches_loop,
+        "uSIF vectorised": matcher.find_candidate_matches,
+    }
+    for name, func in benchmarks.items():
+        start = time.time()
+        for _ in range(iterations):
+            for tokens in names:
+                func(tokens, 50)
+        duration = time.time() - start
+        print(f"{name}: {1e6 * duration / total:.2f} us/name")
+
+    fuzzy = get_fuzzy_matcher()
+    candidates = [
+        [m.fdc for m in matcher.find_candidate_matches(tokens, 50)] for tokens in names
+    ]
+
+    def find_best_match_loop(tokens: list[str], fdc_ingredients: list):
+        scored = [
+            FDCIngredientMatch(
+                fdc=fdc, score=fuzzy._fuzzy_document_distance(tokens, fdc.tokens)
+            )
+            for fdc in fdc_ingredients
+        ]
+        return sorted(scored, key=lambda x: x.score)[0]
+
+    benchmarks = {
+        "fuzzy loop": find_best_match_loop,
+        "fuzzy vectorised": fuzzy.find_best_match,
+    }
+    for name, func in benchmarks.items():
+        start = time.time()
+        for _ in range(iterations):
+            for tokens, fdc_ingredients in zip(names, candidates):
+                func(list(tokens), fdc_ingredients)
+        duration = time.time() - start
+        print(f"{name}: {1e6 * duration / total:.2f} us/name")
+
+
+def benchmark_fdc_ann(sentences: list[str], iterations: int, n_probes: list[int]):
+    """Compare the recall and speed of finding candidate FDC ingredient matches with
+    an approximate nearest neighbour index against the exact search.
+
+    Recall is the fraction of the exact best 50 candidates that are also found using
+    the index.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Sentences to parse and match the ingredient names of.
+    iterations : int
+        Number of times to match each ingredient name.
+    n_probes : list[int]
+        Number of lists for the index to search.
+    """
+    from ingredient_parser.en._ann import IVFIndex
+    from ingredient_parser.en._foundationfoods import (
+        get_usif_matcher,
+        normalise_spelling,
+    )
+    from ingredient_parser.en._utils import prepare_embeddings_tokens, tokenize
+
+    matcher = get_usif_matcher()
+    # Use the FDC ingredient descriptions as well as the example sentences, so the
+    # recall is measured over a wide range of names.
+    names = [
+        normalise_spelling(prepare_embeddings_tokens(tuple(tokenize(name.text))))
+        for sent in sentences
+        for name in parse_ingredient(sent).name
+    ]
+    names = [tokens for tokens in names if tokens]
+    names += [fdc.tokens for fdc in matcher.fdc_ingredients[::50]]
+    total = iterations * len(names)
+
+    def time_search() -> tuple[list[list[int]], float]:
+        start = time.time()
+        for _ in range(iterations):
+            matches = [matcher.find_candidate_matches(tokens, 50) for tokens in names]
+        duration = time.time() - start
+        return [[m.fdc.fdc_id for m in ms] for ms in matches], duration
+
+    start = time.time()
+    index = IVFIndex.build(matcher.fdc_unit_vectors)
+    print(
+        f"Built index of {len(index)} FDC ingredients in {index.n_lists} lists: "
+        f"{time.time() - start:.2f} s"
+    )
+
+    matcher.set_ann_index(None)
+    exact, duration = time_search()
+    print(f"exact: recall 1.000, {1e6 * duration / total:.2f} us/name")
+
+    for n_probe in n_probes:
+        index.n_probe = n_probe
+        matcher.set_ann_index(index)
+        approx, duration = time_search()
+        recall = sum(
+            len(set(a) & set(e)) / len(e) for a, e in zip(approx, exact)
+        ) / len(exact)
+        print(
+            f"n_probe={n_probe}: recall {recall:.3f}, "
+            f"{1e6 * duration / total:.2f} us/name"
+        )
+    matcher.set_ann_index(None)
+
+
+def benchmark_import(iterations: int):
+    """Measure time to import ingredient_parser in a new interpreter.
+
+    Parameters
+    ----------
+    iterations : int
+        Number of times to import the library.
+    """
+    code = (
+        "import time; start = time.perf_counter(); import ingredient_parser; "
+        "print(time.perf_counter() - start)"
+    )
+    durations = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(iterations)
+    ]
+    print(f"Import time: {1e3 * min(durations):.0f} ms (best of {iterations})")
+
+
 if __name__ == "__main__":
     sentences = [
         ("&frac12; cup warm water (105°F)", "0.5 cup warm water (105°F)"),
@@ -50,8 +302,64 @@ if __name__ == "__main__":
     parser.add_argument(
         "--foundationfoods", "-ff", action="store_true", help="Enable foundation foods."
     )
+    parser.add_argument(
+        "--serialisation",
+        "-s",
+        action="store_true",
+        help="Benchmark serialisation of parsed sentences instead of parsing.",
+    )
+    parser.add_argument(
+        "--pos-tag",
+        action="store_true",
+        help="Benchmark part of speech tagging instead of parsing.",
+    )
+    parser.add_argument(
+        "--fdc-match",
+        action="store_true",
+        help="Benchmark foundation food matching instead of parsing.",
+    )
+    parser.add_argument(
+        "--fdc-ann",
+        action="store_true",
+        help="Benchmark recall and speed of approximate FDC matching against exact "
+        "matching instead of parsing.",
+    )
+    parser.add_argument(
+        "--n-probe",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16, 32],
+        help="Number of lists searched by the approximate FDC matching index.",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="Benchmark time to import the library.",
+    )
     args = parser.parse_args()
 
+    if args.import_time:
+        benchmark_import(min(args.iterations, 10))
+        raise SystemExit
+
+    if args.pos_tag:
+        benchmark_pos_tag([sent for sent, _ in sentences], args.iterations)
+        raise SystemExit
+
+    if args.fdc_match:
+        benchmark_fdc_match([sent for sent, _ in sentences], min(args.iterations, 10))
+        raise SystemExit
+
+    if args.fdc_ann:
+        benchmark_fdc_ann(
+            [sent for sent, _ in sentences], min(args.iterations, 10), args.n_probe
+        )
+        raise SystemExit
+
+    if args.serialisation:
+        benchmark_serialisation([sent for sent, _ in sentences], args.iterations)
+        raise SystemExit
+
     start = time.time()
     for i in range(args.iterations):
         for sent, _ in sentences:
@@ -1,12 +1,74 @@
+from typing import TYPE_CHECKING, Any
+
+from ._cache import ParseCache, SQLiteParseCache, get_parse_cache, set_parse_cache
 from ._common import SUPPORTED_LANGUAGES, show_model_card
-from .parsers import inspect_parser, parse_ingredient, parse_multiple_ingredients
+from .en._loaders import set_pos_tagger_path
+from .en.parser import TagCache, get_tag_cache, set_tag_cache
+from .parsers import (
+    aparse_ingredient,
+    aparse_many,
+    inspect_parser,
+    iter_parse,
+    parse_ingredient,
+    parse_multiple_ingredients,
+    warmup,
+)
+
+if TYPE_CHECKING:
+    from .en._foundationfoods import (
+        FoundationFoodCache,
+        fuzzy_matcher_cache_info,
+        get_foundation_food_cache,
+        set_fdc_ann_index,
+        set_foundation_food_cache,
+        set_fuzzy_matcher_cache_sizes,
+    )
+
+# Names imported from the foundation foods module the first time they are used, so
+# the foundation food matching code is not imported unless it is needed.
+_FOUNDATION_FOODS_NAMES = {
+    "FoundationFoodCache",
+    "fuzzy_matcher_cache_info",
+    "get_foundation_food_cache",
+    "set_fdc_ann_index",
+    "set_foundation_food_cache",
+    "set_fuzzy_matcher_cache_sizes",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _FOUNDATION_FOODS_NAMES:
+        from .en import _foundationfoods
+
+        return getattr(_foundationfoods, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "SUPPORTED_LANGUAGES",
+    "FoundationFoodCache",
+    "ParseCache",
+    "SQLiteParseCache",
+    "TagCache",
+    "aparse_ingredient",
+    "aparse_many",
+    "fuzzy_matcher_cache_info",
+    "get_foundation_food_cache",
+    "get_parse_cache",
+    "get_tag_cache",
     "inspect_parser",
+    "iter_parse",
     "parse_ingredient",
     "parse_multiple_ingredients",
+    "set_fdc_ann_index",
+    "set_foundation_food_cache",
+    "set_fuzzy_matcher_cache_sizes",
+    "set_parse_cache",
+    "set_pos_tagger_path",
+    "set_tag_cache",
     "show_model_card",
+    "warmup",
 ]
 
 __version__ = "2.4.0"
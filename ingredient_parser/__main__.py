@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TextIO
+
+from . import SUPPORTED_LANGUAGES, iter_parse
+from .dataclasses import ParsedIngredient
+
+# Number of sentences between each progress update.
+PROGRESS_INTERVAL = 1000
+
+
+def read_sentences(
+    file: TextIO, input_format: str, column: str, field: str
+) -> Iterator[str]:
+    """Lazily read sentences from file.
+
+    Each sentence is yielded in turn, so the file is never read into memory in its
+    entirety. For CSV and JSONL input, a record without a sentence yields an empty
+    string so that it is still counted by the line numbers reported by iter_parse. For
+    JSONL input, a field that is missing or null is treated as an empty string.
+
+    Parameters
+    ----------
+    file : TextIO
+        File object to read sentences from.
+    input_format : str
+        Format of file: txt, csv or jsonl.
+    column : str
+        Name of column containing sentences, for csv input.
+    field : str
+        Name of field containing sentences, for jsonl input.
+
+    Yields
+    ------
+    str
+        Sentence.
+
+    Raises
+    ------
+    ValueError
+        Raised if column is not in CSV header, or if a JSONL line is not a JSON object
+        or the field is not a string.
+    """
+    match input_format:
+        case "txt":
+            yield from file
+        case "csv":
+            reader = csv.DictReader(file)
+            if reader.fieldnames is None or column not in reader.fieldnames:
+                raise ValueError(f'Column "{column}" not found in CSV header.')
+            for row in reader:
+                yield row[column] or ""
+        case "jsonl":
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    yield ""
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+
+                if not isinstance(record, dict):
+                    raise ValueError(f"Line {line_number} is not a JSON object.")
+
+                sentence = record.get(field)
+                if sentence is not None and not isinstance(sentence, str):
+                    raise ValueError(
+                        f'Field "{field}" on line {line_number} is not a string.'
+                    )
+                yield sentence or ""
+
+
+def detect_format(path: str) -> str:
+    """Detect input format from file extension.
+
+    Parameters
+    ----------
+    path : str
+        Path to input file.
+
+    Returns
+    -------
+    str
+        Input format: csv, jsonl or txt.
+    """
+    match Path(path).suffix.lower():
+        case ".csv":
+            return "csv"
+        case ".jsonl" | ".ndjson":
+            return "jsonl"
+        case _:
+            return "txt"
+
+
+def write_records(
+    results: Iterable[tuple[int, ParsedIngredient]],
+    output: TextIO,
+    compact: bool,
+    progress: bool,
+) -> int:
+    """Write each parsed result to output as a JSON record on its own line.
+
+    Parameters
+    ----------
+    results : Iterable[tuple[int, ParsedIngredient]]
+        Iterable of line number and ParsedIngredient tuples.
+    output : TextIO
+        File object to write records to.
+    compact : bool
+        If True, leave out fields that are None, empty or have default values.
+    progress : bool
+        If True, write progress updates to stderr.
+
+    Returns
+    -------
+    int
+        Number of records written.
+    """
+    start = time.perf_counter()
+    count = 0
+    for line_number, parsed in results:
+        record = {"line": line_number, **parsed.to_dict(compact)}
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+
+        if progress and count % PROGRESS_INTERVAL == 0:
+            rate = count / (time.perf_counter() - start)
+            print(
+                f"\rParsed {count} sentences ({rate:.0f} sentences/s)",
+                end="",
+                file=sys.stderr,
+                flush=True,
+            )
+
+    return count
+
+
+def parse_command(args: argparse.Namespace) -> None:
+    """Parse sentences from file or stdin and write JSONL records to stdout.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments.
+    """
+    if args.input == "-":
+        input_file = sys.stdin
+        input_format = args.format or "txt"
+    else:
+        input_file = open(args.input, encoding="utf-8", newline="")
+        input_format = args.format or detect_format(args.input)
+
+    start = time.perf_counter()
+    try:
+        results = iter_parse(
+            read_sentences(input_file, input_format, args.column, args.field),
+            lang=args.lang,
+            string_units=args.string_units,
+            imperial_units=args.imperial_units,
+            foundation_foods=args.foundation_foods,
+            threads=args.threads,
+            workers=args.workers,
+            ordered=not args.unordered,
+        )
+        count = write_records(
+            results,
+            sys.stdout,
+            compact=args.compact,
+            progress=not args.quiet and sys.stderr.isatty(),
+        )
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+    if not args.quiet:
+        duration = time.perf_counter() - start
+        rate = count / duration if duration > 0 else 0
+        print(
+            f"\rParsed {count} sentences in {duration:.2f} s ({rate:.0f} sentences/s).",
+            file=sys.stderr,
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run command line interface.
+
+    Parameters
+    ----------
+    argv : list[str] | None, optional
+        Command line arguments.
+        Default is None, which uses sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ingredient_parser",
+        description="Parse structured information from recipe ingredient sentences.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parse_parser = subparsers.add_parser(
+        "parse",
+        help="Parse sentences and write a JSON record for each sentence to stdout.",
+        description="Parse sentences from a file or stdin and write a JSON record "
+        "for each sentence to stdout, one record per line. Each record contains the "
+        "line number of the sentence in the input. For CSV input, this is the record "
+        "number excluding the header.",
+    )
+    parse_parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="File to read sentences from. Default is stdin.",
+    )
+    parse_parser.add_argument(
+        "--format",
+        choices=["txt", "csv", "jsonl"],
+        help="Input format. Default is detected from the file extension, "
+        "or txt for stdin.",
+    )
+    parse_parser.add_argument(
+        "--column",
+        default="sentence",
+        help="Column containing sentences, for csv input. Default is sentence.",
+    )
+    parse_parser.add_argument(
+        "--field",
+        default="sentence",
+        help="Field containing sentences, for jsonl input. Default is sentence.",
+    )
+    parse_parser.add_argument(
+        "--lang",
+        choices=sorted(SUPPORTED_LANGUAGES),
+        default="en",
+        help="Language of sentences. Default is en.",
+    )
+    parse_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes. 0 uses one per CPU. "
+        "Default is to parse in a single process.",
+    )
+    parse_parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help="Number of threads, if not using worker processes. Default is 0.",
+    )
+    parse_parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Write records as soon as they are parsed, instead of in input order.",
+    )
+    parse_parser.add_argument(
+        "--foundation-foods",
+        action="store_true",
+        help="Extract foundation foods from ingredient names.",
+    )
+    parse_parser.add_argument(
+        "--string-units",
+        action="store_true",
+        help="Return units as strings instead of pint units.",
+    )
+    parse_parser.add_argument(
+        "--imperial-units",
+        action="store_true",
+        help="Use imperial units instead of US customary units.",
+    )
+    parse_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Leave out fields that are None, empty or have default values.",
+    )
+    parse_parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Do not write progress and summary to stderr.",
+    )
+    parse_parser.set_defaults(func=parse_command)
+
+    args = parser.parse_args(argv)
+    try:
+        args.func(args)
+    except BrokenPipeError:
+        # Output was closed early, e.g. piped to head. Redirect remaining output to
+        # devnull to avoid another BrokenPipeError when the interpreter exits.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        message = "\n".join([str(e), *getattr(e, "__notes__", [])])
+        parser.exit(1, f"{parser.prog}: error: {message}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from importlib.resources import files
+from pathlib import Path
+from typing import Any, Hashable, NamedTuple, Self
+
+from .dataclasses import ParsedIngredient
+
+logger = logging.getLogger("ingredient-parser")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a parse cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that returned a cached result.
+    misses : int
+        Number of lookups that did not return a cached result.
+    maxsize : int
+        Maximum number of entries in cache.
+    currsize : int
+        Current number of entries in cache.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Thread safe, size bounded, least recently used cache.
+
+    When the cache is full, adding a new entry evicts the least recently used entry.
+    The number of hits and misses are recorded.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of entries in cache.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """Initialise.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries in cache.
+            Default is 4096.
+
+        Raises
+        ------
+        ValueError
+            Raised if maxsize is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxsize={self.maxsize})"
+
+    def __reduce__(self):
+        # The entries are not pickled, so a cache sent to a worker process is empty.
+        return (self.__class__, (self.maxsize,))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value for key, if present.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key.
+        default : Any, optional
+            Value to return if key is not in cache.
+            Default is None.
+
+        Returns
+        -------
+        Any
+            Cached value, or default if key is not in cache.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Add value to cache.
+
+        If the cache is full, the least recently used entry is evicted.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key.
+        value : Any
+            Value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from cache and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            Cache hits, misses, maximum size and current size.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+
+class ParseCache(LRUCache):
+    """In-memory cache of parsed ingredient sentences.
+
+    The cache is keyed on the sentence and all of the options that affect the parsed
+    output. When the cache is full, the least recently used entry is evicted.
+
+    ParsedIngredient objects are mutable, so the cache stores a copy of each object
+    added to it and returns a new copy for each hit. This means modifying a
+    ParsedIngredient object returned by the parser never modifies the cached entry.
+
+    The cache is safe to use from multiple threads.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of entries in cache.
+    """
+
+    def get(self, key: Hashable, default: Any = None) -> ParsedIngredient | None:
+        """Return copy of cached ParsedIngredient for key, if present.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key.
+        default : Any, optional
+            Value to return if key is not in cache.
+            Default is None.
+
+        Returns
+        -------
+        ParsedIngredient | None
+            Copy of cached ParsedIngredient, or default if key is not in cache.
+        """
+        parsed = super().get(key)
+        if parsed is None:
+            return default
+
+        return copy.deepcopy(parsed)
+
+    def set(self, key: Hashable, value: ParsedIngredient) -> None:
+        """Add copy of ParsedIngredient to cache.
+
+        If the cache is full, the least recently used entry is evicted.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key.
+        value : ParsedIngredient
+            ParsedIngredient to cache.
+        """
+        super().set(key, copy.deepcopy(value))
+
+
+@lru_cache
+def model_hash(lang: str) -> str:
+    """Return hash of the parser model file for the given language.
+
+    Parameters
+    ----------
+    lang : str
+        Language of parser model.
+
+    Returns
+    -------
+    str
+        SHA256 hash of parser model file.
+    """
+    model = files(__package__) / lang / f"data/model.{lang}.crfsuite"
+    return hashlib.sha256(model.read_bytes()).hexdigest()
+
+
+class SQLiteParseCache(ParseCache):
+    """Persistent cache of parsed ingredient sentences, stored in an SQLite database.
+
+    Entries are held in an in-memory least recently used cache in front of the
+    database, so that frequently parsed sentences do not need to be read from disk.
+    Entries not found in memory are read from the database, and new entries are
+    written to both.
+
+    The database is keyed on the cache key, the version of this library and a hash of
+    the parser model, so entries created by a different version of the library or model
+    are never returned. These entries are left in the database, so a database shared by
+    different versions of the library can be used by all of them.
+
+    Entries are stored as JSON, using ParsedIngredient.to_dict, so reading a database
+    never executes code, even if it was written by someone else.
+
+    The database uses write-ahead logging, so it can be read and written concurrently
+    by multiple threads and processes, e.g. each worker in a process pool. Each thread
+    in each process uses its own connection to the database. The connections are closed
+    by close(), or when the cache is used as a context manager and the block exits.
+
+    Attributes
+    ----------
+    directory : Path
+        Directory containing the database.
+    maxsize : int
+        Maximum number of entries in the in-memory cache.
+    """
+
+    DATABASE_NAME = "parse_cache.sqlite3"
+
+    def __init__(self, directory: str | os.PathLike, maxsize: int = 4096):
+        """Initialise.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            Directory to store database in. Created if it does not exist.
+        maxsize : int, optional
+            Maximum number of entries in the in-memory cache.
+            Default is 4096.
+        """
+        super().__init__(maxsize=maxsize)
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        # Connections opened by every thread, with the ID of the process that opened
+        # them, so they can be closed by close().
+        self._connections: list[tuple[int, sqlite3.Connection]] = []
+        self._initialise_database()
+
+    def __repr__(self) -> str:
+        return f"SQLiteParseCache(directory={self.directory}, maxsize={self.maxsize})"
+
+    def __reduce__(self):
+        return (self.__class__, (self.directory, self.maxsize))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connections opened by every thread in this process.
+
+        The entries in the in-memory cache are kept. If the cache is used again, new
+        connections are opened.
+        """
+        pid = os.getpid()
+        with self._lock:
+            # Connections inherited across a fork belong to the parent process, so are
+            # left for the parent to close.
+            connections = [c for p, c in self._connections if p == pid]
+            self._connections.clear()
+            self._local = threading.local()
+
+        for connection in connections:
+            connection.close()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Return database connection for the current thread and process.
+
+        Connections cannot be shared between threads or across a fork, so a new
+        connection is opened for each thread in each process. Each connection is only
+        used by the thread that opened it, but can be closed by any thread.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Database connection.
+        """
+        pid = os.getpid()
+        local = self._local
+        if getattr(local, "pid", None) != pid:
+            connection = sqlite3.connect(
+                self.directory / self.DATABASE_NAME,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                self._connections.append((pid, connection))
+            local.connection = connection
+            local.pid = pid
+
+        return local.connection
+
+    def _initialise_database(self) -> None:
+        """Create database table if it does not exist."""
+        self._connection.execute(
+            """CREATE TABLE IF NOT EXISTS parsed (
+                key TEXT PRIMARY KEY,
+                version TEXT NOT NULL,
+                model_hash TEXT NOT NULL,
+                value TEXT NOT NULL
+            )"""
+        )
+
+    def _model_hashes(self) -> list[str]:
+        """Return hashes of the parser models for all supported languages.
+
+        Returns
+        -------
+        list[str]
+            List of model hashes.
+        """
+        from ._common import SUPPORTED_LANGUAGES
+
+        return [model_hash(lang) for lang in SUPPORTED_LANGUAGES]
+
+    def _database_key(self, key: Hashable) -> tuple[str, str, str]:
+        """Return key used to store entry in database.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key. The first element must be the language of the sentence.
+
+        Returns
+        -------
+        tuple[str, str, str]
+            Digest of key, library version and model hash.
+        """
+        from . import __version__
+
+        lang = key[0] if isinstance(key, tuple) else "en"
+        _model_hash = model_hash(lang)
+        digest = hashlib.blake2b(
+            repr((key, __version__, _model_hash)).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return digest, __version__, _model_hash
+
+    def get(self, key: Hashable, default: Any = None) -> ParsedIngredient | None:
+        """Return copy of cached ParsedIngredient for key, if present.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key.
+        default : Any, optional
+            Value to return if key is not in cache.
+            Default is None.
+
+        Returns
+        -------
+        ParsedIngredient | None
+            Copy of cached ParsedIngredient, or default if key is not in cache.
+        """
+        # Checking the in-memory cache records a miss if not found, which we undo if
+        # the entry is found in the database.
+        if (parsed := super().get(key)) is not None:
+            return parsed
+
+        digest, version, _model_hash = self._database_key(key)
+        row = self._connection.execute(
+            "SELECT value FROM parsed WHERE key = ? AND version = ? AND model_hash = ?",
+            (digest, version, _model_hash),
+        ).fetchone()
+        if row is None:
+            return default
+
+        try:
+            parsed = ParsedIngredient.from_dict(json.loads(row[0]))
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            # Entries that cannot be decoded, e.g. written in an older format, are
+            # treated as missing and replaced when the sentence is parsed again.
+            logger.debug(f"Ignoring invalid parse cache entry: {e}")
+            return default
+
+        super().set(key, parsed)
+        with self._lock:
+            self._misses -= 1
+            self._hits += 1
+
+        return parsed
+
+    def set(self, key: Hashable, value: ParsedIngredient) -> None:
+        """Add ParsedIngredient to cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key.
+        value : ParsedIngredient
+            ParsedIngredient to cache.
+        """
+        super().set(key, value)
+        digest, version, _model_hash = self._database_key(key)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?)",
+            (
+                digest,
+                version,
+                _model_hash,
+                json.dumps(value.to_dict(), ensure_ascii=False),
+            ),
+        )
+
+    def clear(self) -> None:
+        """Remove all entries from cache, including the database, and reset
+        statistics.
+
+        Only entries created by this version of the library and parser models are
+        removed from the database. Entries created by other versions are kept.
+        """
+        from . import __version__
+
+        super().clear()
+        model_hashes = self._model_hashes()
+        self._connection.execute(
+            "DELETE FROM parsed WHERE version = ? AND model_hash IN ({})".format(
+                ",".join("?" for _ in model_hashes)
+            ),
+            (__version__, *model_hashes),
+        )
+
+
+# Cache used by the parsers. Caching is disabled when this is None.
+_PARSE_CACHE: ParseCache | None = None
+
+
+def set_parse_cache(cache: ParseCache | None) -> None:
+    """Set the cache used to store parsed sentences.
+
+    Caching is disabled by default. Once a cache is set, the result of parsing a
+    sentence is stored in the cache and parsing the same sentence again with the same
+    options returns a copy of the cached result.
+
+    Parameters
+    ----------
+    cache : ParseCache | None
+        Cache to use. If None, caching is disabled.
+
+    Examples
+    --------
+    >>> from ingredient_parser import ParseCache, set_parse_cache
+    >>> set_parse_cache(ParseCache(maxsize=10000))
+
+    >>> from ingredient_parser import SQLiteParseCache, set_parse_cache
+    >>> set_parse_cache(SQLiteParseCache("~/.cache/ingredient-parser"))
+    """
+    global _PARSE_CACHE
+    _PARSE_CACHE = cache
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Return the cache used to store parsed sentences.
+
+    Returns
+    -------
+    ParseCache | None
+        Cache in use, or None if caching is disabled.
+    """
+    return _PARSE_CACHE
@@ -6,18 +6,75 @@ import os
 import platform
 import re
 import subprocess
+import threading
 from importlib.resources import as_file, files
 from itertools import groupby, islice
 from operator import itemgetter
-from typing import Generator, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Iterator
 
-import nltk
-import pint
+import numpy as np
 
-UREG = pint.UnitRegistry()
-with as_file(files(__package__) / "density_context.txt") as p:
-    # Load pint context that defines transformations between mass and volume
-    UREG.load_definitions(p)
+if TYPE_CHECKING:
+    import pint
+
+# The unit registry is created on first use by get_unit_registry, because importing
+# pint and creating the registry is slow and not needed if only string units are used.
+_UREG: "pint.UnitRegistry | None" = None
+_UREG_LOCK = threading.Lock()
+
+
+def get_unit_registry() -> "pint.UnitRegistry":
+    """Return the pint unit registry used by this library, creating it if necessary.
+
+    The registry includes the context that defines transformations between mass and
+    volume using density.
+
+    Returns
+    -------
+    pint.UnitRegistry
+        Unit registry.
+    """
+    global _UREG
+    if _UREG is None:
+        # Lock to guarantee only one registry is ever created. Units created by
+        # different registries cannot be compared or combined.
+        with _UREG_LOCK:
+            if _UREG is None:
+                import pint
+
+                ureg = pint.UnitRegistry()
+                with as_file(files(__package__) / "density_context.txt") as p:
+                    # Load pint context that defines transformations between mass
+                    # and volume
+                    ureg.load_definitions(p)
+                _UREG = ureg
+
+    return _UREG
+
+
+class _LazyUnitRegistry:
+    """Proxy for the library's pint unit registry.
+
+    The registry is created by get_unit_registry the first time the proxy is used.
+    Calls, attribute access and membership tests are passed to the registry, so this
+    can be used in place of a pint.UnitRegistry.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_unit_registry(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return get_unit_registry()(*args, **kwargs)
+
+    def __contains__(self, item: str) -> bool:
+        return item in get_unit_registry()
+
+    def __repr__(self) -> str:
+        return repr(get_unit_registry())
+
+
+UREG: Any = _LazyUnitRegistry()
 
 SUPPORTED_LANGUAGES = ["en"]
 
@@ -28,6 +85,38 @@ logger.addHandler(logging.NullHandler())
 # Regex pattern for matching a numeric range e.g. 1-2, 2-3, #1$2-1#3$4.
 RANGE_PATTERN = re.compile(r"^[\d\#\$]+\s*[\-][\d\#\$]+$")
 
+# Environment variable that can be set to the directory used to store files created by
+# this library, such as the converted part of speech tagger.
+CACHE_DIR_ENV = "INGREDIENT_PARSER_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+    """Return directory used to store files created by this library.
+
+    This is the directory set by the INGREDIENT_PARSER_CACHE_DIR environment variable
+    if given, otherwise the ingredient_parser directory in the platform's user cache
+    directory: %LOCALAPPDATA% on Windows, ~/Library/Caches on macOS and
+    $XDG_CACHE_HOME or ~/.cache on other platforms.
+
+    The directory is not created by this function.
+
+    Returns
+    -------
+    Path
+        Cache directory.
+    """
+    if env_path := os.environ.get(CACHE_DIR_ENV):
+        return Path(env_path).expanduser()
+
+    if platform.system() == "Windows":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    elif platform.system() == "Darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+    return base / "ingredient_parser"
+
 
 def consume(iterator: Iterator, n: int | None) -> None:
     """Advance the `iterator` n-steps ahead. If `n` is none, consume entirely.
@@ -118,21 +207,59 @@ def show_model_card(lang: str = "en") -> None:
             subprocess.call(("xdg-open", p))
 
 
-def download_nltk_resources() -> None:
-    """Check if required nltk resources can be found and if not, download them."""
-    try:
-        nltk.data.find(
-            "taggers/averaged_perceptron_tagger_eng/averaged_perceptron_tagger_eng.classes.json"
-        )
-        nltk.data.find(
-            "taggers/averaged_perceptron_tagger_eng/averaged_perceptron_tagger_eng.tagdict.json"
-        )
-        nltk.data.find(
-            "taggers/averaged_perceptron_tagger_eng/averaged_perceptron_tagger_eng.weights.json"
-        )
-    except LookupError:
-        print("Downloading required NLTK resource: averaged_perceptron_tagger_eng")
-        nltk.download("averaged_perceptron_tagger_eng")
+def encode_strings(strings: Iterable[str]) -> np.ndarray:
+    """Encode strings as a single array of UTF-8 bytes, with each string terminated by
+    a newline.
+
+    Terminating each string, rather than separating them, means that an empty list and
+    a list containing an empty string have different encodings.
+
+    Parameters
+    ----------
+    strings : Iterable[str]
+        Strings to encode. The strings must not contain newlines.
+
+    Returns
+    -------
+    np.ndarray
+        Array of UTF-8 bytes.
+
+    Raises
+    ------
+    ValueError
+        Raised if any string contains a newline.
+    """
+    strings = list(strings)
+    if any("\n" in string for string in strings):
+        raise ValueError("Strings must not contain newlines.")
+    return np.frombuffer(
+        "".join(f"{string}\n" for string in strings).encode("utf-8"), dtype=np.uint8
+    )
+
+
+def decode_strings(array: np.ndarray) -> list[str]:
+    """Decode strings encoded by encode_strings.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Array of UTF-8 bytes.
+
+    Returns
+    -------
+    list[str]
+        Decoded strings.
+
+    Raises
+    ------
+    ValueError
+        Raised if the array is not empty and does not end with a newline, e.g. because
+        it was not created by encode_strings.
+    """
+    encoded = array.tobytes().decode("utf-8")
+    if encoded and not encoded.endswith("\n"):
+        raise ValueError("Encoded strings must end with a newline.")
+    return encoded.split("\n")[:-1]
 
 
 def is_float(value: str) -> bool:
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+
+import logging
+import math
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from functools import partial
+from itertools import islice
+from typing import Any, Callable
+
+from ._cache import ParseCache, get_parse_cache, set_parse_cache
+from ._common import UREG
+from .dataclasses import CompositeIngredientAmount, ParsedIngredient
+from .en._loaders import load_models
+
+logger = logging.getLogger("ingredient-parser")
+
+# Batches smaller than this, per worker, are parsed in the calling process because the
+# overhead of sending work to a pool outweighs any benefit.
+MIN_SENTENCES_PER_WORKER = 16
+# Upper limit on the number of sentences sent to a worker in a single task.
+MAX_CHUNKSIZE = 256
+# Number of sentences sent to a worker process in a single task when streaming.
+STREAM_CHUNKSIZE = 32
+
+
+def initialise_worker(
+    lang: str, foundation_foods: bool, cache: ParseCache | None = None
+) -> None:
+    """Load the models required for parsing in a pool worker process.
+
+    This is used as the initializer for process pools so that each worker loads the
+    models once when it starts, rather than on the first sentence it parses.
+
+    Parameters
+    ----------
+    lang : str
+        Language of the sentences the worker will parse.
+    foundation_foods : bool
+        If True, also load the models used for foundation food matching.
+    cache : ParseCache | None, optional
+        Parse cache for the worker to use.
+        Default is None, which disables caching in the worker.
+    """
+    set_parse_cache(cache)
+
+    match lang:
+        case "en":
+            load_models(foundation_foods)
+
+
+def calculate_chunksize(n_sentences: int, n_workers: int) -> int:
+    """Calculate the number of sentences to send to a worker in each task.
+
+    The chunk size is selected to give each worker approximately four tasks, so work
+    is balanced across workers without the overhead of sending each sentence as a
+    separate task.
+
+    Parameters
+    ----------
+    n_sentences : int
+        Number of sentences to parse.
+    n_workers : int
+        Number of workers in pool.
+
+    Returns
+    -------
+    int
+        Chunk size.
+
+    Examples
+    --------
+    >>> calculate_chunksize(100, 4)
+    7
+
+    >>> calculate_chunksize(100000, 4)
+    256
+    """
+    chunksize = math.ceil(n_sentences / (4 * max(n_workers, 1)))
+    return max(1, min(chunksize, MAX_CHUNKSIZE))
+
+
+def rebind_units(parsed: ParsedIngredient) -> ParsedIngredient:
+    """Rebind pint.Unit objects in parsed ingredient to the library's unit registry.
+
+    pint.Unit objects are unpickled into pint's application registry rather than the
+    registry they were created in. This means the units of a ParsedIngredient returned
+    from a worker process will not have the density context required for conversions
+    between mass and volume.
+
+    Parameters
+    ----------
+    parsed : ParsedIngredient
+        Parsed ingredient returned from worker process.
+
+    Returns
+    -------
+    ParsedIngredient
+        Parsed ingredient, with units bound to UREG.
+    """
+    for amount in parsed.amount:
+        amounts = (
+            amount.amounts
+            if isinstance(amount, CompositeIngredientAmount)
+            else [amount]
+        )
+        for a in amounts:
+            if not isinstance(a.unit, str):
+                a.unit = UREG.Unit(str(a.unit))
+
+    return parsed
+
+
+def parallel_map(
+    func: Callable[..., ParsedIngredient],
+    batch_func: Callable[..., list[ParsedIngredient]],
+    sentences: list[str],
+    lang: str,
+    workers: int | None,
+    executor: Executor | None,
+    **kwargs: Any,
+) -> list[ParsedIngredient]:
+    """Apply parsing function to each sentence using a pool of worker processes.
+
+    Results are returned in the same order as the input sentences.
+
+    Parameters
+    ----------
+    func : Callable[..., ParsedIngredient]
+        Function that parses a single sentence. Must be picklable.
+    batch_func : Callable[..., list[ParsedIngredient]]
+        Function that parses a list of sentences in the calling process, used when the
+        batch is too small to benefit from a worker pool.
+    sentences : list[str]
+        List of sentences to parse.
+    lang : str
+        Language of sentences.
+    workers : int | None
+        Number of worker processes to use.
+        If None or less than 1, use the number of CPUs.
+    executor : Executor | None
+        Existing executor to submit work to. If provided, workers is only used to
+        calculate the chunk size and the executor is not shut down.
+    **kwargs : Any
+        Keyword arguments passed to func and batch_func.
+
+    Returns
+    -------
+    list[ParsedIngredient]
+        List of ParsedIngredient objects, in the same order as sentences.
+    """
+    parse = partial(func, lang=lang, **kwargs)
+
+    n_workers = workers if workers and workers > 0 else os.cpu_count() or 1
+
+    if executor is not None:
+        chunksize = calculate_chunksize(len(sentences), n_workers)
+        results = executor.map(parse, sentences, chunksize=chunksize)
+        return [rebind_units(p) for p in results]
+
+    if n_workers <= 1 or len(sentences) < n_workers * MIN_SENTENCES_PER_WORKER:
+        logger.debug(
+            f"Parsing {len(sentences)} sentences in calling process "
+            "because batch is too small to benefit from worker pool."
+        )
+        return batch_func(sentences, lang=lang, **kwargs)
+
+    chunksize = calculate_chunksize(len(sentences), n_workers)
+    logger.debug(
+        f"Parsing {len(sentences)} sentences using {n_workers} worker processes "
+        f"with chunk size {chunksize}."
+    )
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=initialise_worker,
+        initargs=(lang, kwargs.get("foundation_foods", False), get_parse_cache()),
+    ) as pool:
+        results = pool.map(parse, sentences, chunksize=chunksize)
+        return [rebind_units(p) for p in results]
+
+
+def parse_numbered(
+    func: Callable[[str], ParsedIngredient], batch: list[tuple[int, str]]
+) -> list[tuple[int, ParsedIngredient]]:
+    """Parse batch of numbered sentences.
+
+    If parsing a sentence raises an exception, the line number and sentence are added
+    to the exception as a note.
+
+    Parameters
+    ----------
+    func : Callable[[str], ParsedIngredient]
+        Function that parses a single sentence.
+    batch : list[tuple[int, str]]
+        List of line number and sentence tuples.
+
+    Returns
+    -------
+    list[tuple[int, ParsedIngredient]]
+        List of line number and ParsedIngredient tuples.
+    """
+    results = []
+    for line_number, sentence in batch:
+        try:
+            results.append((line_number, func(sentence)))
+        except Exception as e:
+            e.add_note(f"Raised whilst parsing line {line_number}: {sentence!r}")
+            raise
+    return results
+
+
+def stream_map(
+    func: Callable[[str], ParsedIngredient],
+    numbered_sentences: Iterable[tuple[int, str]],
+    executor: Executor,
+    chunksize: int,
+    max_pending: int,
+    ordered: bool = True,
+) -> Iterator[tuple[int, ParsedIngredient]]:
+    """Lazily apply parsing function to numbered sentences using an executor.
+
+    Sentences are submitted to the executor in batches of chunksize. No more than
+    max_pending batches are submitted ahead of the results being yielded, so memory use
+    is bounded regardless of the number of sentences.
+
+    Parameters
+    ----------
+    func : Callable[[str], ParsedIngredient]
+        Function that parses a single sentence. Must be picklable if executor is a
+        ProcessPoolExecutor.
+    numbered_sentences : Iterable[tuple[int, str]]
+        Iterable of line number and sentence tuples.
+    executor : Executor
+        Executor to submit batches to.
+    chunksize : int
+        Number of sentences in each batch.
+    max_pending : int
+        Maximum number of batches submitted to the executor that have not been yielded.
+    ordered : bool, optional
+        If True, yield results in the same order as the input. If False, yield results
+        as soon as each batch is complete.
+        Default is True.
+
+    Yields
+    ------
+    tuple[int, ParsedIngredient]
+        Line number and ParsedIngredient object for each sentence.
+    """
+    rebind = isinstance(executor, ProcessPoolExecutor)
+    numbered_sentences = iter(numbered_sentences)
+    pending: deque[Future] = deque()
+
+    def results(future: Future) -> Iterator[tuple[int, ParsedIngredient]]:
+        for line_number, parsed in future.result():
+            yield line_number, rebind_units(parsed) if rebind else parsed
+
+    def pop_completed() -> list[Future]:
+        if ordered:
+            return [pending.popleft()]
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+        return list(done)
+
+    while batch := list(islice(numbered_sentences, chunksize)):
+        pending.append(executor.submit(parse_numbered, func, batch))
+        if len(pending) >= max_pending:
+            for future in pop_completed():
+                yield from results(future)
+
+    while pending:
+        for future in pop_completed():
+            yield from results(future)
@@ -1,18 +1,111 @@
 #!/usr/bin/env python3
 
 import copy
+import json
 import operator
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from fractions import Fraction
-from functools import reduce
+from functools import lru_cache, reduce
 from statistics import mean
-from typing import Any
+from typing import TYPE_CHECKING, Any, Self
 
-import pint
 import pycrfsuite
 
 from ._common import UREG
 
+if TYPE_CHECKING:
+    import pint
+
+
+def _encode_quantity(quantity: Fraction | str | float) -> str | float:
+    """Encode quantity as a JSON serialisable value.
+
+    Parameters
+    ----------
+    quantity : Fraction | str | float
+        Quantity to encode.
+
+    Returns
+    -------
+    str | float
+        Fractions are encoded as strings, e.g. "3/2". Any other value is returned
+        unchanged.
+    """
+    if isinstance(quantity, Fraction):
+        return str(quantity)
+    return quantity
+
+
+def _decode_quantity(value: str | float, quantity_type: str) -> Fraction | str | float:
+    """Decode quantity encoded by _encode_quantity.
+
+    Parameters
+    ----------
+    value : str | float
+        Encoded quantity.
+    quantity_type : str
+        Type of quantity: "fraction", "str" or "number".
+
+    Returns
+    -------
+    Fraction | str | float
+        Decoded quantity.
+    """
+    if quantity_type == "fraction" and isinstance(value, str):
+        return Fraction(value)
+    return value
+
+
+@lru_cache(maxsize=512)
+def _unit_name(unit: "pint.Unit") -> str:
+    """Return name of pint unit.
+
+    Formatting a pint.Unit is slow compared to the rest of serialisation, and parsed
+    sentences use a small number of different units, so the names are cached.
+
+    Parameters
+    ----------
+    unit : pint.Unit
+        Unit.
+
+    Returns
+    -------
+    str
+        Unit name, e.g. "cup".
+    """
+    return str(unit)
+
+
+def _quantity_type(quantity: Fraction | str | float) -> str:
+    """Return name of type of quantity, as used in the serialised schema.
+
+    Parameters
+    ----------
+    quantity : Fraction | str | float
+        Quantity.
+
+    Returns
+    -------
+    str
+        "fraction", "str" or "number".
+    """
+    if isinstance(quantity, Fraction):
+        return "fraction"
+    if isinstance(quantity, str):
+        return "str"
+    return "number"
+
+
+# Boolean flags of IngredientAmount, which default to False.
+_AMOUNT_FLAGS = [
+    "APPROXIMATE",
+    "SINGULAR",
+    "RANGE",
+    "MULTIPLIER",
+    "PREPARED_INGREDIENT",
+]
+
 
 @dataclass
 class TokenFeatures:
@@ -113,7 +206,7 @@ class IngredientAmount:
 
     quantity: Fraction | str
     quantity_max: Fraction | str
-    unit: str | pint.Unit
+    unit: "str | pint.Unit"
     text: str
     confidence: float
     starting_index: int
@@ -123,6 +216,95 @@ class IngredientAmount:
     MULTIPLIER: bool = False
     PREPARED_INGREDIENT: bool = False
 
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        """Return dict representation of object that can be serialised to JSON.
+
+        Fractions are encoded as strings, e.g. "3/2", and pint.Unit objects are encoded
+        as the unit name. The ``quantity_type`` and ``unit_type`` fields record the
+        original types so they can be restored by ``from_dict``.
+
+        Parameters
+        ----------
+        compact : bool, optional
+            If True, leave out fields with default values: flags that are False,
+            quantity_max if it is the same as quantity, quantity_type if "fraction" and
+            unit_type if "pint".
+            Default is False.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dict representation of object.
+        """
+        quantity_type = _quantity_type(self.quantity)
+        if isinstance(self.unit, str):
+            unit, unit_type = self.unit, "str"
+        else:
+            unit, unit_type = _unit_name(self.unit), "pint"
+        d = {
+            "quantity": _encode_quantity(self.quantity),
+            "quantity_max": _encode_quantity(self.quantity_max),
+            "quantity_type": quantity_type,
+            "unit": unit,
+            "unit_type": unit_type,
+            "text": self.text,
+            "confidence": self.confidence,
+            "starting_index": self.starting_index,
+            "APPROXIMATE": self.APPROXIMATE,
+            "SINGULAR": self.SINGULAR,
+            "RANGE": self.RANGE,
+            "MULTIPLIER": self.MULTIPLIER,
+            "PREPARED_INGREDIENT": self.PREPARED_INGREDIENT,
+        }
+        if not compact:
+            return d
+
+        if self.quantity_max == self.quantity:
+            del d["quantity_max"]
+        if quantity_type == "fraction":
+            del d["quantity_type"]
+        if unit_type == "pint":
+            del d["unit_type"]
+        for flag in _AMOUNT_FLAGS:
+            if not d[flag]:
+                del d[flag]
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> Self:
+        """Create object from dict returned by ``to_dict``.
+
+        Parameters
+        ----------
+        d : dict[str, Any]
+            Dict representation of object, in normal or compact form.
+
+        Returns
+        -------
+        Self
+            IngredientAmount object.
+        """
+        quantity_type = d.get("quantity_type", "fraction")
+        quantity = _decode_quantity(d["quantity"], quantity_type)
+        quantity_max = (
+            _decode_quantity(d["quantity_max"], quantity_type)
+            if "quantity_max" in d
+            else quantity
+        )
+        unit = d["unit"]
+        if d.get("unit_type", "pint") == "pint":
+            unit = UREG.Unit(unit)
+
+        return cls(
+            quantity=quantity,
+            quantity_max=quantity_max,
+            unit=unit,
+            text=d["text"],
+            confidence=d["confidence"],
+            starting_index=d["starting_index"],
+            **{flag: d.get(flag, False) for flag in _AMOUNT_FLAGS},
+        )
+
     def _copy(self):
         """Return deepcopy of current object.
 
@@ -133,7 +315,7 @@ class IngredientAmount:
         """
         return copy.deepcopy(self)
 
-    def convert_to(self, unit: str, density: pint.Quantity = 1000 * UREG("kg/m^3")):
+    def convert_to(self, unit: str, density: "pint.Quantity | None" = None):
         """Convert units of IngredientAmount object to given unit.
 
         Conversion is only possible if none of the quantity, quantity_max and unit are
@@ -152,9 +334,9 @@ class IngredientAmount:
         ----------
         unit : str
             Unit to convert to.
-        density : pint.Quantity, optional
+        density : pint.Quantity | None, optional
             Density used for conversion between volume and mass.
-            Default is the density of water.
+            Default is None, which uses the density of water.
 
         Returns
         -------
@@ -173,6 +355,9 @@ class IngredientAmount:
         ):
             raise TypeError("Cannot convert where quantity or unit is a string.")
 
+        if density is None:
+            density = 1000 * UREG("kg/m^3")
+
         q: pint.Quantity = self.quantity * self.unit  # type: ignore
         q_max: pint.Quantity = self.quantity_max * self.unit  # type: ignore
 
@@ -245,7 +430,54 @@ class CompositeIngredientAmount:
         # composite amount.
         self.confidence = mean(amount.confidence for amount in self.amounts)
 
-    def combined(self) -> pint.Quantity:
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        """Return dict representation of object that can be serialised to JSON.
+
+        Parameters
+        ----------
+        compact : bool, optional
+            If True, leave out fields with default values from the amounts, and the
+            text, confidence and starting_index fields that are calculated from the
+            amounts.
+            Default is False.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dict representation of object.
+        """
+        d = {
+            "amounts": [amount.to_dict(compact) for amount in self.amounts],
+            "join": self.join,
+            "subtractive": self.subtractive,
+        }
+        if not compact:
+            d["text"] = self.text
+            d["confidence"] = self.confidence
+            d["starting_index"] = self.starting_index
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> Self:
+        """Create object from dict returned by ``to_dict``.
+
+        Parameters
+        ----------
+        d : dict[str, Any]
+            Dict representation of object, in normal or compact form.
+
+        Returns
+        -------
+        Self
+            CompositeIngredientAmount object.
+        """
+        return cls(
+            amounts=[IngredientAmount.from_dict(amount) for amount in d["amounts"]],
+            join=d["join"],
+            subtractive=d["subtractive"],
+        )
+
+    def combined(self) -> "pint.Quantity":
         """Return the combined amount in a single unit for the composite amount.
 
         The amounts that comprise the composite amount are combined according to whether
@@ -267,7 +499,7 @@ class CompositeIngredientAmount:
         for amount in self.amounts:
             if not (
                 isinstance(amount.quantity, Fraction)
-                and isinstance(amount.unit, pint.Unit)
+                and not isinstance(amount.unit, str)
             ):
                 q_type = type(amount.quantity).__name__
                 u_type = type(amount.unit).__name__
@@ -288,7 +520,7 @@ class CompositeIngredientAmount:
             (amount.quantity * amount.unit for amount in self.amounts),  # type: ignore
         )
 
-    def convert_to(self, unit: str, density: pint.Quantity = 1000 * UREG("kg/m^3")):
+    def convert_to(self, unit: str, density: "pint.Quantity | None" = None):
         """Convert units of the combined CompositeIngredientAmount object to given unit.
 
         Conversion is only possible if none of the quantity, quantity_max and unit are
@@ -307,15 +539,18 @@ class CompositeIngredientAmount:
         ----------
         unit : str
             Unit to convert to.
-        density : pint.Quantity, optional
+        density : pint.Quantity | None, optional
             Density used for conversion between volume and mass.
-            Default is the density of water.
+            Default is None, which uses the density of water.
 
         Returns
         -------
         pint.Quantity
             Combined amount converted to given units.
         """
+        if density is None:
+            density = 1000 * UREG("kg/m^3")
+
         # Apply density context for conversion.
         # This is only relevant if converting between mass <-> volume.
         with UREG.context("density", p=density):
@@ -342,6 +577,46 @@ class IngredientText:
     confidence: float
     starting_index: int
 
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        """Return dict representation of object that can be serialised to JSON.
+
+        Parameters
+        ----------
+        compact : bool, optional
+            Has no effect, because all fields are required.
+            Default is False.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dict representation of object.
+        """
+        return {
+            "text": self.text,
+            "confidence": self.confidence,
+            "starting_index": self.starting_index,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> Self:
+        """Create object from dict returned by ``to_dict``.
+
+        Parameters
+        ----------
+        d : dict[str, Any]
+            Dict representation of object.
+
+        Returns
+        -------
+        Self
+            IngredientText object.
+        """
+        return cls(
+            text=d["text"],
+            confidence=d["confidence"],
+            starting_index=d["starting_index"],
+        )
+
 
 @dataclass
 class FoundationFood:
@@ -379,10 +654,76 @@ class FoundationFood:
     def __eq__(self, other):
         return isinstance(other, FoundationFood) and self.fdc_id == other.fdc_id
 
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        """Return dict representation of object that can be serialised to JSON.
+
+        Parameters
+        ----------
+        compact : bool, optional
+            If True, leave out the url field, which is calculated from the fdc_id.
+            Default is False.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dict representation of object.
+        """
+        d = {
+            "text": self.text,
+            "confidence": self.confidence,
+            "fdc_id": self.fdc_id,
+            "category": self.category,
+            "data_type": self.data_type,
+            "url": self.url,
+            "name_index": self.name_index,
+        }
+        if compact:
+            del d["url"]
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> Self:
+        """Create object from dict returned by ``to_dict``.
+
+        Parameters
+        ----------
+        d : dict[str, Any]
+            Dict representation of object, in normal or compact form.
+
+        Returns
+        -------
+        Self
+            FoundationFood object.
+        """
+        return cls(
+            text=d["text"],
+            confidence=d["confidence"],
+            fdc_id=d["fdc_id"],
+            category=d["category"],
+            data_type=d["data_type"],
+            name_index=d["name_index"],
+        )
+
     def __hash__(self):
         return hash(self.fdc_id)
 
 
+def _text_from_dict(d: dict[str, Any] | None) -> IngredientText | None:
+    """Create IngredientText object from dict, if not None.
+
+    Parameters
+    ----------
+    d : dict[str, Any] | None
+        Dict representation of IngredientText object, or None.
+
+    Returns
+    -------
+    IngredientText | None
+        IngredientText object, or None.
+    """
+    return IngredientText.from_dict(d) if d else None
+
+
 @dataclass
 class ParsedIngredient:
     """Dataclass for holding the parsed values for an input sentence.
@@ -462,6 +803,147 @@ class ParsedIngredient:
                 else:
                     amount.PREPARED_INGREDIENT = True
 
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        """Return dict representation of object that can be serialised to JSON.
+
+        This is much faster than ``dataclasses.asdict``, because no objects are copied,
+        and the returned dict can be passed directly to ``json.dumps``.
+        CompositeIngredientAmount objects in the amount list are identified by their
+        ``amounts`` field.
+
+        Parameters
+        ----------
+        compact : bool, optional
+            If True, leave out fields that are None or empty and fields with default
+            values in nested objects.
+            Default is False.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dict representation of object.
+        """
+        d = {
+            "name": [name.to_dict(compact) for name in self.name],
+            "size": self.size.to_dict(compact) if self.size else None,
+            "amount": [amount.to_dict(compact) for amount in self.amount],
+            "preparation": (
+                self.preparation.to_dict(compact) if self.preparation else None
+            ),
+            "comment": self.comment.to_dict(compact) if self.comment else None,
+            "purpose": self.purpose.to_dict(compact) if self.purpose else None,
+            "foundation_foods": [ff.to_dict(compact) for ff in self.foundation_foods],
+            "sentence": self.sentence,
+        }
+        if compact:
+            return {key: value for key, value in d.items() if value}
+        return d
+
+    def to_json(self, compact: bool = False) -> str:
+        """Return JSON representation of object.
+
+        Parameters
+        ----------
+        compact : bool, optional
+            If True, leave out fields that are None, empty or have default values, and
+            do not include whitespace between JSON elements.
+            Default is False.
+
+        Returns
+        -------
+        str
+            JSON string.
+        """
+        if compact:
+            return json.dumps(
+                self.to_dict(compact=True), ensure_ascii=False, separators=(",", ":")
+            )
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> Self:
+        """Create object from dict returned by ``to_dict``.
+
+        Parameters
+        ----------
+        d : dict[str, Any]
+            Dict representation of object, in normal or compact form.
+
+        Returns
+        -------
+        Self
+            ParsedIngredient object.
+        """
+        return cls(
+            name=[IngredientText.from_dict(name) for name in d.get("name", [])],
+            size=_text_from_dict(d.get("size")),
+            amount=[
+                CompositeIngredientAmount.from_dict(amount)
+                if "amounts" in amount
+                else IngredientAmount.from_dict(amount)
+                for amount in d.get("amount", [])
+            ],
+            preparation=_text_from_dict(d.get("preparation")),
+            comment=_text_from_dict(d.get("comment")),
+            purpose=_text_from_dict(d.get("purpose")),
+            foundation_foods=[
+                FoundationFood.from_dict(ff) for ff in d.get("foundation_foods", [])
+            ],
+            sentence=d.get("sentence", ""),
+        )
+
+
+class ParsedIngredientList(list):
+    """List of ParsedIngredient objects returned when parsing multiple sentences.
+
+    This behaves exactly like a list, with additional attributes describing how the
+    sentences were parsed.
+
+    Attributes
+    ----------
+    total_sentences : int
+        Number of input sentences.
+    unique_sentences : int
+        Number of sentences that were parsed. If duplicate sentences were removed
+        before parsing, this is the number of unique sentences, otherwise it is the
+        same as total_sentences.
+    """
+
+    def __init__(
+        self,
+        parsed: Iterable[ParsedIngredient] = (),
+        unique_sentences: int | None = None,
+    ):
+        """Initialise.
+
+        Parameters
+        ----------
+        parsed : Iterable[ParsedIngredient], optional
+            ParsedIngredient objects.
+        unique_sentences : int | None, optional
+            Number of sentences that were parsed.
+            Default is None, which sets it to the number of ParsedIngredient objects.
+        """
+        super().__init__(parsed)
+        self.total_sentences = len(self)
+        self.unique_sentences = (
+            len(self) if unique_sentences is None else unique_sentences
+        )
+
+    @property
+    def dedupe_ratio(self) -> float:
+        """Return fraction of input sentences that were duplicates and not parsed.
+
+        Returns
+        -------
+        float
+            Dedupe ratio, between 0 and 1.
+        """
+        if self.total_sentences == 0:
+            return 0.0
+
+        return 1 - self.unique_sentences / self.total_sentences
+
 
 @dataclass
 class ParserDebugInfo:
@@ -484,3 +966,34 @@ class ParserDebugInfo:
     PreProcessor: Any
     PostProcessor: Any
     tagger: pycrfsuite.Tagger  # type: ignore
+
+
+@dataclass
+class WarmupReport:
+    """Dataclass for the time taken to load each resource used for parsing sentences.
+
+    Attributes
+    ----------
+    timings : dict[str, float]
+        Time, in seconds, taken to load each resource. A resource that was already
+        loaded takes almost no time.
+    """
+
+    timings: dict[str, float]
+
+    @property
+    def total(self) -> float:
+        """Return total time taken to load all resources.
+
+        Returns
+        -------
+        float
+            Total time, in seconds.
+        """
+        return sum(self.timings.values())
+
+    def __str__(self) -> str:
+        width = max((len(name) for name in self.timings), default=0)
+        lines = [f"{name:<{width}}  {t:8.3f} s" for name, t in self.timings.items()]
+        lines.append(f"{'total':<{width}}  {self.total:8.3f} s")
+        return "\n".join(lines)
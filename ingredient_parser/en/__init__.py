@@ -1,4 +1,12 @@
-from .parser import inspect_parser_en, parse_ingredient_en
+from .parser import (
+    TagCache,
+    dedupe_key_en,
+    get_tag_cache,
+    inspect_parser_en,
+    parse_ingredient_en,
+    parse_ingredients_en,
+    set_tag_cache,
+)
 from .postprocess import PostProcessor
 from .preprocess import FeatureDict, PreProcessor
 
@@ -6,6 +14,11 @@ __all__ = [
     "FeatureDict",
     "PostProcessor",
     "PreProcessor",
+    "TagCache",
+    "dedupe_key_en",
+    "get_tag_cache",
     "inspect_parser_en",
     "parse_ingredient_en",
+    "parse_ingredients_en",
+    "set_tag_cache",
 ]
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+import logging
+import math
+import os
+from dataclasses import dataclass
+from importlib.resources import as_file
+from importlib.resources.abc import Traversable
+from typing import Self
+
+import numpy as np
+
+logger = logging.getLogger("ingredient-parser.foundation-foods")
+
+# Number of vectors assigned to lists at a time when building the index, to limit the
+# size of the vectors x centroids similarity matrix.
+_ASSIGN_CHUNKSIZE = 65536
+
+
+@dataclass
+class IVFIndex:
+    """Inverted file index for approximate nearest neighbour search of unit vectors by
+    cosine distance.
+
+    The vectors are clustered into lists using spherical k-means, with each list
+    represented by the centroid of the vectors in it. A search only calculates the
+    distance to the vectors in the n_probe lists with the centroids closest to the
+    query vector, instead of to every vector.
+
+    Increasing n_probe increases the chance of finding the true nearest neighbours
+    (the recall) at the expense of calculating the distance to more vectors. If
+    n_probe is the same as the number of lists, the search is exact.
+
+    Attributes
+    ----------
+    centroids : np.ndarray
+        Unit length centroid of each list, with a row for each list.
+    list_offsets : np.ndarray
+        Offsets into list_ids of the start of each list, with the end of the last list
+        as the last element.
+    list_ids : np.ndarray
+        Row indices of the indexed vectors, grouped by list and in ascending order
+        within each list.
+    n_probe : int
+        Number of lists to search for each query vector. More lists are searched if
+        these do not contain enough vectors to return the number requested.
+    """
+
+    centroids: np.ndarray
+    list_offsets: np.ndarray
+    list_ids: np.ndarray
+    n_probe: int = 8
+
+    def __len__(self) -> int:
+        return len(self.list_ids)
+
+    @property
+    def n_lists(self) -> int:
+        """Return number of lists.
+
+        Returns
+        -------
+        int
+            Number of lists.
+        """
+        return len(self.centroids)
+
+    @classmethod
+    def build(
+        cls,
+        unit_vectors: np.ndarray,
+        n_lists: int | None = None,
+        n_probe: int = 8,
+        n_iter: int = 20,
+        seed: int = 0,
+    ) -> Self:
+        """Build index from unit length vectors.
+
+        Parameters
+        ----------
+        unit_vectors : np.ndarray
+            Unit length vectors to index, with a row for each.
+        n_lists : int | None, optional
+            Number of lists to cluster the vectors into.
+            Default is None, which uses the square root of the number of vectors.
+        n_probe : int, optional
+            Number of lists to search for each query vector.
+            Default is 8.
+        n_iter : int, optional
+            Number of iterations of k-means.
+            Default is 20.
+        seed : int, optional
+            Seed for the random selection of the initial centroids.
+            Default is 0.
+
+        Returns
+        -------
+        Self
+
+        Raises
+        ------
+        ValueError
+            Raised if there are no vectors to index.
+        """
+        n_vectors = len(unit_vectors)
+        if n_vectors == 0:
+            raise ValueError("Cannot build index without any vectors.")
+
+        if n_lists is None:
+            n_lists = round(math.sqrt(n_vectors))
+        n_lists = max(1, min(n_lists, n_vectors))
+
+        rng = np.random.default_rng(seed)
+        centroids = unit_vectors[rng.choice(n_vectors, n_lists, replace=False)]
+        for _ in range(n_iter):
+            assignments = _assign(unit_vectors, centroids)
+            sums = np.stack(
+                [
+                    np.bincount(assignments, weights=column, minlength=n_lists)
+                    for column in unit_vectors.T
+                ],
+                axis=1,
+            )
+            norms = np.linalg.norm(sums, axis=1)
+
+            # Move the centroid of any empty list to a random vector.
+            empty = np.flatnonzero(norms == 0)
+            sums[empty] = unit_vectors[rng.choice(n_vectors, len(empty))]
+            norms[empty] = 1
+            centroids = sums / norms[:, None]
+
+        assignments = _assign(unit_vectors, centroids)
+        list_ids = np.argsort(assignments, kind="stable").astype(np.int64)
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=n_lists), out=list_offsets[1:])
+        logger.debug(f"Built IVF index of {n_vectors} vectors in {n_lists} lists.")
+
+        return cls(centroids, list_offsets, list_ids, n_probe)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike | Traversable, n_probe: int = 8) -> Self:
+        """Load from .npz file created by save.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | Traversable
+            Path to .npz file.
+        n_probe : int, optional
+            Number of lists to search for each query vector.
+            Default is 8.
+
+        Returns
+        -------
+        Self
+        """
+        if not isinstance(path, str | os.PathLike):
+            with as_file(path) as p:
+                return cls.load(p, n_probe)
+
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["centroids"], data["list_offsets"], data["list_ids"], n_probe
+            )
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save to compressed .npz file.
+
+        n_probe is not saved, so it can be chosen each time the index is loaded.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path to save .npz file to.
+        """
+        np.savez_compressed(
+            path,
+            centroids=self.centroids,
+            list_offsets=self.list_offsets,
+            list_ids=self.list_ids,
+        )
+
+    def search(self, unit_vector: np.ndarray, n: int) -> np.ndarray:
+        """Return row indices of the indexed vectors to calculate the distance to for
+        query vector.
+
+        The lists are searched from the closest centroid to the query vector. At least
+        n_probe lists are searched, and more if they contain fewer than n vectors.
+
+        Parameters
+        ----------
+        unit_vector : np.ndarray
+            Unit length query vector.
+        n : int
+            Number of nearest neighbours that will be selected.
+
+        Returns
+        -------
+        np.ndarray
+            Row indices of the vectors in the searched lists, in ascending order.
+        """
+        # np.einsum gives the same similarities however many centroids or query vectors
+        # are calculated together, so the same lists are searched for the query vector
+        # whether it is searched for on its own or in a batch.
+        similarities = np.einsum("j,kj->k", unit_vector, self.centroids)
+        order = np.argsort(-similarities, kind="stable")
+
+        sizes = np.diff(self.list_offsets)[order]
+        n_searched = max(self.n_probe, int(np.searchsorted(np.cumsum(sizes), n)) + 1)
+        lists = order[:n_searched]
+
+        ids = np.concatenate(
+            [
+                self.list_ids[start:end]
+                for start, end in zip(
+                    self.list_offsets[lists].tolist(),
+                    self.list_offsets[lists + 1].tolist(),
+                )
+            ]
+        )
+        return np.sort(ids)
+
+
+def _assign(unit_vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Return index of the closest centroid to each vector.
+
+    Parameters
+    ----------
+    unit_vectors : np.ndarray
+        Unit length vectors, with a row for each.
+    centroids : np.ndarray
+        Unit length centroids, with a row for each.
+
+    Returns
+    -------
+    np.ndarray
+        Index of the closest centroid to each vector.
+    """
+    return np.concatenate(
+        [
+            np.argmax(unit_vectors[start : start + _ASSIGN_CHUNKSIZE] @ centroids.T, 1)
+            for start in range(0, len(unit_vectors), _ASSIGN_CHUNKSIZE)
+        ]
+    )
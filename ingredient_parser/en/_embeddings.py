@@ -1,23 +1,42 @@
 #!/usr/bin/env python3
 
 import gzip
+from collections.abc import Iterable
+from functools import cached_property
 from importlib.resources import as_file, files
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+# Label for each value of a binarized vector element, indexed by the value.
+_BINARIZED_LABELS = {-1: "VNEG", 0: "V0", 1: "VPOS"}
+
 
 class GloVeModel:
     """Class to interact with GloVe embeddings.
 
+    The vectors are stored as the rows of a single matrix, with a dict mapping each
+    token to the index of its row.
+
     Attributes
     ----------
-    binarized_vectors : dict[str, list[str]]
-        Dict of word: binarized_vector pairs.
+    binarized_vectors : np.ndarray
+        int8 matrix of binarized vectors, calculated when first used.
+    dimension : int
+        Dimension of vectors.
+    index : dict[str, int]
+        Dict of token: row index pairs.
+    matrix : np.ndarray
+        float32 matrix of vectors, with a row for each token.
+    norms : np.ndarray
+        Euclidean norm of each row of matrix, calculated when first used.
     vec_file : str
         Path to GloVe embeddings file.
-    vectors : dict[str, np.ndarray]
-        Dict of word: vector pairs.
+    vocab : list[str]
+        Token for each row of matrix.
+    vocab_size : int
+        Number of tokens.
     """
 
     def __init__(self, vec_file: str):
@@ -26,11 +45,18 @@ class GloVeModel:
         Parameters
         ----------
         vec_file : str
-            Path to GloVe embeddings file.
+            Path to GloVe embeddings file, relative to this package. If the path ends
+            with .npy, the embeddings are loaded from the binary format written by
+            train/data/convert_embeddings.py, otherwise from the gzipped text format.
         """
         self.vec_file = vec_file
-        self._load_vectors_from_file(vec_file)
-        self._binarize_vectors()
+        if vec_file.endswith(".npy"):
+            self.vocab, self.matrix = self._load_vectors_from_npy(vec_file)
+        else:
+            self.vocab, self.matrix = self._load_vectors_from_file(vec_file)
+
+        self.vocab_size, self.dimension = self.matrix.shape
+        self.index = {token: i for i, token in enumerate(self.vocab)}
 
     def __repr__(self) -> str:
         return f"GloVeModel(vec_file={self.vec_file})"
@@ -42,32 +68,59 @@ class GloVeModel:
         return self.vocab_size
 
     def __contains__(self, token: str) -> bool:
-        return token in self.vectors
+        return token in self.index
 
     def __getitem__(self, token: str) -> np.ndarray:
-        return self.vectors[token]
+        return self.matrix[self.index[token]]
 
     def get(self, token: str, default: Any) -> Any:
-        """If token in vector keys, return vector, otherwise return default.
+        """If token in vocabulary, return vector, otherwise return default.
 
         Parameters
         ----------
         token : str
             Token to return vector for.
         default : Any
-            Default value if token not in vector keys.
+            Default value if token not in vocabulary.
 
         Returns
         -------
         Any
             Vector, or default value.
         """
-        if token in self.vectors:
-            return self.vectors[token]
+        if (row := self.index.get(token)) is not None:
+            return self.matrix[row]
         else:
             return default
 
-    def _load_vectors_from_file(self, vec_file: str) -> None:
+    def rows_for(self, tokens: Iterable[str]) -> np.ndarray:
+        """Return row index in matrix of each token.
+
+        Parameters
+        ----------
+        tokens : Iterable[str]
+            Tokens to return row indices for.
+
+        Returns
+        -------
+        np.ndarray
+            Row index of each token, or -1 if the token is not in the vocabulary.
+        """
+        index = self.index
+        return np.array([index.get(token, -1) for token in tokens], dtype=np.intp)
+
+    @cached_property
+    def norms(self) -> np.ndarray:
+        """Return euclidean norm of each vector.
+
+        Returns
+        -------
+        np.ndarray
+            Norm of each row of matrix.
+        """
+        return np.linalg.norm(self.matrix, axis=1)
+
+    def _load_vectors_from_file(self, vec_file: str) -> tuple[list[str], np.ndarray]:
         """Load vectors from gzipped txt file in word2vec format.
 
         The first line of the file contains the header which is the vocabulary size
@@ -80,34 +133,92 @@ class GloVeModel:
         ----------
         vec_file : str
             Path to GloVe embeddings file.
+
+        Returns
+        -------
+        tuple[list[str], np.ndarray]
+            Token for each row of matrix, and matrix of vectors.
         """
-        self.vectors = {}
+        vocab, vectors = [], []
         with as_file(files(__package__) / vec_file) as p:
             with gzip.open(p, "rt") as f:
-                # Read first line as header
-                header = f.readline().rstrip()
-                self.vocab_size, self.dimension = map(int, header.split())
+                # Skip header, the size of the matrix is determined from the vectors
+                f.readline()
 
                 # Read remaining lines and load vectors
                 for line in f:
                     parts = line.rstrip().split()
-                    token = parts[0]
-                    vector = np.array([float(v) for v in parts[1:]], dtype=np.float32)
-                    self.vectors[token] = vector
+                    vocab.append(parts[0])
+                    vectors.append([float(v) for v in parts[1:]])
+
+        return vocab, np.array(vectors, dtype=np.float32)
+
+    def _load_vectors_from_npy(self, vec_file: str) -> tuple[list[str], np.ndarray]:
+        """Load vectors from binary .npy file and vocabulary file.
+
+        The .npy file contains a float32 matrix with a row for each token. The
+        vocabulary file has the same name as the .npy file, with the suffix .vocab.txt
+        instead of .npy, and contains each token on its own line, in the same order as
+        the rows of the matrix.
+
+        The matrix is memory mapped instead of read, so loading is almost instant and
+        processes that load the same file share the same memory.
+
+        Parameters
+        ----------
+        vec_file : str
+            Path to .npy file.
 
-    def _binarize_vectors(self):
+        Returns
+        -------
+        tuple[list[str], np.ndarray]
+            Token for each row of matrix, and matrix of vectors.
+
+        Raises
+        ------
+        ValueError
+            Raised if the number of tokens and vectors are not the same.
+        """
+        npy_file = files(__package__) / vec_file
+        vocab_file = files(__package__) / vec_file.replace(".npy", ".vocab.txt")
+        vocab = vocab_file.read_text(encoding="utf-8").splitlines()
+
+        if isinstance(npy_file, Path):
+            matrix = np.asarray(np.load(npy_file, mmap_mode="r"))
+        else:
+            # The package is not installed as files on disk (e.g. it is in a zip
+            # file), so the matrix cannot be memory mapped.
+            with as_file(npy_file) as p:
+                matrix = np.load(p)
+
+        if len(vocab) != matrix.shape[0]:
+            raise ValueError(
+                f"{vocab_file} contains {len(vocab)} tokens, "
+                f"but {npy_file} contains {matrix.shape[0]} vectors."
+            )
+
+        return vocab, matrix
+
+    @cached_property
+    def binarized_vectors(self) -> np.ndarray:
         """Binarize vectors by converting continuous values into discrete values [1].
 
         For each word vector, calculate the average value of the positive elements and
         the negative elements. Replace each element of each word vector according to:
         if value < negative_average:
-            "VNEG"
+            -1 (VNEG)
         elif value > positive_average
-            "VPOS"
+            1 (VPOS)
         else
-            "V0"
+            0 (V0)
+
+        The binarized vectors are calculated the first time this attribute is accessed.
+        Use binarized_vector to get the binarized vector for a token as labels.
 
-        The resulting word vectors are stored in the binarized_vectors attribute.
+        Returns
+        -------
+        np.ndarray
+            int8 matrix with the binarized vector for each row of matrix.
 
         References
         ----------
@@ -117,18 +228,37 @@ class GloVeModel:
            Association for Computational Linguistics, 2014, pp. 110–120.
            doi: 10.3115/v1/D14-1012.
         """
-        self.binarized_vectors = {}
-        for word, vec in self.vectors.items():
-            positive_avg = np.mean(vec[vec > 0])
-            negative_avg = np.mean(vec[vec < 0])
-
-            binarised_vec = []
-            for value in vec:
-                if value < negative_avg:
-                    binarised_vec.append("VNEG")
-                elif value > positive_avg:
-                    binarised_vec.append("VPOS")
-                else:
-                    binarised_vec.append("V0")
-
-            self.binarized_vectors[word] = binarised_vec
+        matrix = self.matrix
+        positive = matrix > 0
+        negative = matrix < 0
+        # A vector without any positive or negative elements has an average of NaN,
+        # so none of its elements are compared as greater or less than the average.
+        with np.errstate(invalid="ignore", divide="ignore"):
+            positive_avg = np.where(positive, matrix, 0).sum(axis=1) / positive.sum(1)
+            negative_avg = np.where(negative, matrix, 0).sum(axis=1) / negative.sum(1)
+
+        binarized = np.zeros(matrix.shape, dtype=np.int8)
+        binarized[matrix > positive_avg[:, None]] = 1
+        binarized[matrix < negative_avg[:, None]] = -1
+        return binarized
+
+    def binarized_vector(self, token: str) -> list[str]:
+        """Return binarized vector for token as labels.
+
+        Parameters
+        ----------
+        token : str
+            Token to return binarized vector for.
+
+        Returns
+        -------
+        list[str]
+            Binarized vector, with each element as one of VNEG, V0 or VPOS.
+
+        Raises
+        ------
+        KeyError
+            Raised if token is not in the vocabulary.
+        """
+        row = self.index[token]
+        return [_BINARIZED_LABELS[v] for v in self.binarized_vectors[row].tolist()]
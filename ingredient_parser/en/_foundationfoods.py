@@ -2,17 +2,26 @@
 
 import csv
 import gzip
+import hashlib
+import json
 import logging
+import os
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import lru_cache
 from importlib.resources import as_file, files
+from importlib.resources.abc import Traversable
+from itertools import chain
+from pathlib import Path
+from typing import Self
 
 import numpy as np
 
-from ingredient_parser._common import consume
+from ingredient_parser._common import consume, decode_strings, encode_strings
 
+from .._cache import CacheInfo, LRUCache
 from ..dataclasses import FoundationFood
+from ._ann import IVFIndex
 from ._embeddings import GloVeModel
 from ._loaders import load_embeddings_model
 from ._utils import prepare_embeddings_tokens, tokenize
@@ -143,6 +152,9 @@ NON_RAW_FOOD_VERB_STEMS = {
 # Also include "raw" so we don't add if again if already present
 NON_RAW_FOOD_VERB_STEMS.add("raw")
 
+# Path to FDC index created by train/data/create_fdc_index.py, relative to this package.
+FDC_INDEX_FILE = "data/fdc_index.npz"
+
 
 @dataclass
 class FDCIngredient:
@@ -163,9 +175,100 @@ class FDCIngredientMatch:
     score: float
 
 
-@lru_cache
-def load_fdc_ingredients() -> list[FDCIngredient]:
-    """Cached function for loading FDC ingredients from CSV.
+@dataclass
+class FDCIndex:
+    """Dataclass for the FDC ingredients and the uSIF data calculated from them.
+
+    Everything in the index is calculated from fdc_ingredients.csv.gz and the
+    embeddings, so it can be calculated once and saved alongside them, instead of
+    being calculated whenever the foundation food matchers are loaded.
+    """
+
+    fdc_ingredients: list[FDCIngredient]
+    token_prob: dict[str, float]
+    a: float
+    vectors: np.ndarray
+
+    @classmethod
+    def load(cls, path: str | os.PathLike | Traversable) -> Self:
+        """Load from .npz file created by save.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | Traversable
+            Path to .npz file.
+
+        Returns
+        -------
+        Self
+        """
+        if not isinstance(path, str | os.PathLike):
+            with as_file(path) as p:
+                return cls.load(p)
+
+        with np.load(path, allow_pickle=False) as data:
+            tokens = decode_strings(data["tokens"])
+            token_offsets = data["token_offsets"].tolist()
+            fdc_ingredients = [
+                FDCIngredient(
+                    fdc_id=fdc_id,
+                    data_type=data_type,
+                    description=description,
+                    category=category,
+                    tokens=tokens[start:end],
+                )
+                for fdc_id, data_type, description, category, start, end in zip(
+                    data["fdc_id"].tolist(),
+                    decode_strings(data["data_type"]),
+                    decode_strings(data["description"]),
+                    decode_strings(data["category"]),
+                    token_offsets[:-1],
+                    token_offsets[1:],
+                    strict=True,
+                )
+            ]
+            token_prob = dict(
+                zip(
+                    decode_strings(data["prob_tokens"]),
+                    data["probs"].tolist(),
+                    strict=True,
+                )
+            )
+            return cls(fdc_ingredients, token_prob, float(data["a"]), data["vectors"])
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save to compressed .npz file.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path to save .npz file to.
+        """
+        token_offsets = np.zeros(len(self.fdc_ingredients) + 1, dtype=np.uint32)
+        np.cumsum(
+            [len(fdc.tokens) for fdc in self.fdc_ingredients], out=token_offsets[1:]
+        )
+        np.savez_compressed(
+            path,
+            fdc_id=np.array(
+                [fdc.fdc_id for fdc in self.fdc_ingredients], dtype=np.int64
+            ),
+            data_type=encode_strings(fdc.data_type for fdc in self.fdc_ingredients),
+            description=encode_strings(fdc.description for fdc in self.fdc_ingredients),
+            category=encode_strings(fdc.category for fdc in self.fdc_ingredients),
+            tokens=encode_strings(
+                token for fdc in self.fdc_ingredients for token in fdc.tokens
+            ),
+            token_offsets=token_offsets,
+            prob_tokens=encode_strings(self.token_prob.keys()),
+            probs=np.array(list(self.token_prob.values()), dtype=np.float64),
+            a=np.float64(self.a),
+            vectors=self.vectors,
+        )
+
+
+def read_fdc_ingredients_csv() -> list[FDCIngredient]:
+    """Read FDC ingredients from CSV and prepare their tokens for the embeddings.
 
     Returns
     -------
@@ -195,10 +298,44 @@ def load_fdc_ingredients() -> list[FDCIngredient]:
                     )
                 )
 
-    logger.debug(f"Loaded {len(foundation_foods)} FDC ingredients.")
     return foundation_foods
 
 
+@lru_cache
+def load_fdc_index() -> FDCIndex:
+    """Cached function for loading FDC index.
+
+    The index is loaded from fdc_index.npz if it is bundled with the package,
+    otherwise it is calculated from fdc_ingredients.csv.gz.
+
+    Returns
+    -------
+    FDCIndex
+        FDC ingredients and uSIF data calculated from them.
+    """
+    index_file = files(__package__) / FDC_INDEX_FILE
+    if index_file.is_file():
+        logger.debug(f"Loading FDC index: '{FDC_INDEX_FILE}'.")
+        index = FDCIndex.load(index_file)
+    else:
+        index = uSIF(load_embeddings_model(), read_fdc_ingredients_csv()).to_index()
+
+    logger.debug(f"Loaded {len(index.fdc_ingredients)} FDC ingredients.")
+    return index
+
+
+@lru_cache
+def load_fdc_ingredients() -> list[FDCIngredient]:
+    """Cached function for loading FDC ingredients.
+
+    Returns
+    -------
+    list[FDCIngredient]
+        List of FDC ingredients.
+    """
+    return load_fdc_index().fdc_ingredients
+
+
 class uSIF:
     """Modified implementation of Unsupervised Smooth Inverse Frequency [1]_ weighting
     scheme for calculation of sentence embedding vectors.
@@ -217,14 +354,19 @@ class uSIF:
     ----------
     a : float
         'a' parameter.
+    ann_index : IVFIndex | None
+        Approximate nearest neighbour index of fdc_unit_vectors used to find candidate
+        matches, or None to calculate the distance to every FDC ingredient.
     embeddings : GloVeModel
         GloVe embeddings model.
     embeddings_dimension : int
         Dimension of embeddings model.
     fdc_ingredients : dict[str, list[FDCIngredient]]
         Lists of FDC ingredients.
-    fdc_vectors : dict[str, list[FDCIngredient]]
-        Lists of embedding vectors for FDC ingredients, grouped by data type.
+    fdc_vectors : np.ndarray
+        Matrix of embedding vectors for FDC ingredients, with a row for each.
+    fdc_unit_vectors : np.ndarray
+        fdc_vectors scaled to unit length.
     min_prob : float
         Minimum token probability.
     token_prob : dict[str, float]
@@ -252,6 +394,46 @@ class uSIF:
         self.a: float = self._calculate_a_factor()
 
         self.fdc_vectors = self._embed_fdc_ingredients()
+        self.fdc_unit_vectors = self._normalise_fdc_vectors()
+        self.ann_index: IVFIndex | None = None
+
+    @classmethod
+    def from_index(cls, embeddings: GloVeModel, index: FDCIndex) -> Self:
+        """Create from FDC index, without calculating anything from the FDC
+        ingredients.
+
+        Parameters
+        ----------
+        embeddings : GloVeModel
+            GloVe embeddings model used to create the index.
+        index : FDCIndex
+            FDC ingredients and uSIF data calculated from them.
+
+        Returns
+        -------
+        Self
+        """
+        usif = cls.__new__(cls)
+        usif.embeddings = embeddings
+        usif.embeddings_dimension = embeddings.dimension
+        usif.fdc_ingredients = index.fdc_ingredients
+        usif.token_prob = index.token_prob
+        usif.min_prob = min(index.token_prob.values())
+        usif.a = index.a
+        usif.fdc_vectors = index.vectors
+        usif.fdc_unit_vectors = usif._normalise_fdc_vectors()
+        usif.ann_index = None
+        return usif
+
+    def to_index(self) -> FDCIndex:
+        """Return FDC index with the data calculated from the FDC ingredients.
+
+        Returns
+        -------
+        FDCIndex
+            FDC ingredients and uSIF data calculated from them.
+        """
+        return FDCIndex(self.fdc_ingredients, self.token_prob, self.a, self.fdc_vectors)
 
     def _estimate_token_probability(
         self, fdc_ingredients: list[FDCIngredient]
@@ -327,15 +509,15 @@ class uSIF:
         """
         return self.a / (0.5 * self.a + self.token_prob.get(token, self.min_prob))
 
-    def _embed_fdc_ingredients(self) -> list[np.ndarray]:
+    def _embed_fdc_ingredients(self) -> np.ndarray:
         """Calculate embedding vectors for all FDC ingredients.
 
         Returns
         -------
-        list[np.ndarray]
-            List of embedding vectors for FDC ingredients.
+        np.ndarray
+            Matrix of embedding vectors for FDC ingredients, with a row for each.
         """
-        return [self._embed(fdc.tokens) for fdc in self.fdc_ingredients]
+        return np.array([self._embed(fdc.tokens) for fdc in self.fdc_ingredients])
 
     def _embed(self, tokens: list[str]) -> np.ndarray:
         """Return single embedding vector for input tokens calculated from the weighted
@@ -351,81 +533,257 @@ class uSIF:
         np.ndarray
             Embedding vector for input.
         """
-        tokens_in_vocab = [t for t in tokens if t in self.embeddings]
+        rows = self.embeddings.rows_for(tokens)
+        in_vocab = rows >= 0
 
-        if not tokens_in_vocab:
+        if not in_vocab.any():
             return np.zeros(self.embeddings_dimension) + self.a
         else:
-            token_vectors = np.array(
-                [self.embeddings[token] for token in tokens_in_vocab]
-            )
+            token_vectors = self.embeddings.matrix[rows[in_vocab]]
             normalised = token_vectors * (1.0 / np.linalg.norm(token_vectors, axis=0))
-            weighted = np.array(
-                [
-                    self._weight(token) * normalised[i, :]
-                    for i, token in enumerate(tokens_in_vocab)
-                ]
+            weights = np.array(
+                [self._weight(token) for token, keep in zip(tokens, in_vocab) if keep],
+                dtype=normalised.dtype,
             )
-            return np.mean(weighted, axis=0)
+            return np.mean(weights[:, None] * normalised, axis=0)
+
+    def _normalise_fdc_vectors(self) -> np.ndarray:
+        """Return FDC ingredient embedding vectors scaled to unit length.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of unit length embedding vectors for FDC ingredients.
+        """
+        vectors = self.fdc_vectors.astype(np.float64)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
 
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Return cosine similarity score for input vectors.
+    def _unit_vectors(self, token_lists: list[list[str]]) -> np.ndarray:
+        """Return unit length embedding vector for each list of input tokens.
 
         Parameters
         ----------
-        vec1 : np.ndarray
-            Input vector 1.
-        vec2 : np.ndarray
-            Input vector 2.
+        token_lists : list[list[str]]
+            List of lists of input tokens.
 
         Returns
         -------
-        float
-            Cosine similarity score.
+        np.ndarray
+            Matrix of unit length embedding vectors, with a row for each list of tokens.
+        """
+        vectors = [
+            self._embed(prepare_embeddings_tokens(tuple(tokens)))
+            for tokens in token_lists
+        ]
+        return np.array(
+            [vec / np.linalg.norm(vec) for vec in vectors], dtype=np.float64
+        ).reshape(len(token_lists), self.embeddings_dimension)
+
+    def set_ann_index(self, ann_index: IVFIndex | None) -> None:
+        """Set approximate nearest neighbour index used to find candidate matches.
+
+        With an index, the cosine distance is only calculated to the FDC ingredients in
+        the lists searched by the index, instead of to every FDC ingredient. This makes
+        finding candidate matches much faster when there are a very large number of FDC
+        ingredients, but the best candidates might be missed. The trade-off between the
+        two is set by the n_probe attribute of the index.
+
+        Use set_fdc_ann_index to set the index of the matcher used when parsing, which
+        also clears the foundation food cache.
+
+        Parameters
+        ----------
+        ann_index : IVFIndex | None
+            Index of fdc_unit_vectors, e.g. created by IVFIndex.build. If None, the
+            distance to every FDC ingredient is calculated.
+
+        Raises
+        ------
+        ValueError
+            Raised if the index does not have the same number of vectors as there are
+            FDC ingredients.
         """
-        return 1 - float(
-            np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+        if ann_index is not None and len(ann_index) != len(self.fdc_ingredients):
+            raise ValueError(
+                f"Index contains {len(ann_index)} vectors, "
+                f"but there are {len(self.fdc_ingredients)} FDC ingredients."
+            )
+        self.ann_index = ann_index
+
+    def _shortlist(self, approx_distances: np.ndarray, n: int) -> np.ndarray:
+        """Return indices of FDC ingredients that could be in the best n, from the
+        approximate cosine distance to each FDC ingredient.
+
+        The distances calculated by matrix multiplication can differ in the last bits
+        depending on how many vectors are multiplied together, so the shortlist
+        includes every FDC ingredient within a small tolerance of the nth best.
+
+        Parameters
+        ----------
+        approx_distances : np.ndarray
+            Approximate cosine distance to each FDC ingredient.
+        n : int
+            Number of best candidates that will be selected.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of shortlisted FDC ingredients, in ascending order.
+        """
+        if 0 < n < len(approx_distances):
+            nth = approx_distances[np.argpartition(approx_distances, n - 1)[n - 1]]
+            return np.flatnonzero(approx_distances <= nth + 1e-9)
+        else:
+            return np.arange(len(approx_distances))
+
+    def _select_candidates(
+        self, unit_vector: np.ndarray, shortlist: np.ndarray, n: int
+    ) -> list[FDCIngredientMatch]:
+        """Select best n candidate matches from shortlisted FDC ingredients.
+
+        The distances to the shortlisted FDC ingredients are calculated using
+        np.einsum, which gives the same values however many vectors are calculated
+        together, and the best n are selected from these.
+
+        Ties at the nth best are broken by order in the FDC ingredients list.
+
+        Parameters
+        ----------
+        unit_vector : np.ndarray
+            Unit length embedding vector for input tokens.
+        shortlist : np.ndarray
+            Indices of shortlisted FDC ingredients, in ascending order.
+        n : int
+            Number of best candidates to return.
+
+        Returns
+        -------
+        list[FDCIngredientMatch]
+            List of best n candidate matching FDC ingredients.
+        """
+        distances = 1 - np.einsum(
+            "j,kj->k", unit_vector, self.fdc_unit_vectors[shortlist]
         )
+        if 0 < n < len(distances):
+            nth = distances[np.argpartition(distances, n - 1)[n - 1]]
+            selected = np.flatnonzero(distances <= nth)
+        else:
+            selected = np.arange(len(distances))
+        best = selected[np.argsort(distances[selected], kind="stable")][:n]
+
+        return [
+            FDCIngredientMatch(
+                fdc=self.fdc_ingredients[shortlist[idx]], score=float(distances[idx])
+            )
+            for idx in best.tolist()
+        ]
 
     def find_candidate_matches(
         self, tokens: list[str], n: int
     ) -> list[FDCIngredientMatch]:
-        """Find best candidate matches between input token and FDC ingredients with a
-        cosine similarity of no more than cutoff.
+        """Find best n candidate matches between input tokens and FDC ingredients,
+        using the cosine distance between their embedding vectors.
+
+        The distances to all FDC ingredients are calculated together, and only the
+        best n are sorted and returned. If an approximate nearest neighbour index is
+        set, the distances are only calculated to the FDC ingredients in the lists it
+        searches.
 
         Parameters
         ----------
         tokens : list[str]
             List of tokens.
         n : int
-            Number of matches to return, sorted by best score.
+            Number of best candidates to return.
 
         Returns
         -------
         list[FDCIngredientMatch]
             List of best n candidate matching FDC ingredients.
         """
-        prepared_tokens = prepare_embeddings_tokens(tuple(tokens))
-        input_token_vector = self._embed(prepared_tokens)
-
-        candidates = []
-        for idx, vec in enumerate(self.fdc_vectors):
-            score = self._cosine_similarity(input_token_vector, vec)
-            candidates.append(
-                FDCIngredientMatch(
-                    fdc=self.fdc_ingredients[idx],
-                    score=score,
+        return self.find_candidate_matches_batch([tokens], n)[0]
+
+    def find_candidate_matches_batch(
+        self, token_lists: list[list[str]], n: int
+    ) -> list[list[FDCIngredientMatch]]:
+        """Find best n candidate matches between each list of input tokens and FDC
+        ingredients.
+
+        This gives the same results as calling find_candidate_matches for each list of
+        tokens, but the distances to all FDC ingredients are calculated for all lists
+        of tokens in a single matrix-matrix product. If an approximate nearest
+        neighbour index is set, it is searched for each list of tokens instead.
+
+        Parameters
+        ----------
+        token_lists : list[list[str]]
+            List of lists of tokens.
+        n : int
+            Number of best candidates to return for each list of tokens.
+
+        Returns
+        -------
+        list[list[FDCIngredientMatch]]
+            List of best n candidate matching FDC ingredients for each list of tokens.
+        """
+        unit_vectors = self._unit_vectors(token_lists)
+        if self.ann_index is not None:
+            return [
+                self._select_candidates(
+                    unit_vector, self.ann_index.search(unit_vector, n), n
                 )
-            )
+                for unit_vector in unit_vectors
+            ]
+
+        approx_distances = 1 - unit_vectors @ self.fdc_unit_vectors.T
+        return [
+            self._select_candidates(unit_vector, self._shortlist(distances, n), n)
+            for unit_vector, distances in zip(unit_vectors, approx_distances)
+        ]
+
 
-        sorted_candidates = sorted(candidates, key=lambda x: x.score)
-        return sorted_candidates[:n]
+def _pairwise_token_similarity(
+    vectors1: np.ndarray, vectors2: np.ndarray
+) -> np.ndarray:
+    """Calculate similarity between each pair of vectors at the same index in vectors1
+    and vectors2.
+
+    This gives the same values as FuzzyEmbeddingMatcher._token_similarity. The squared
+    euclidean distance between each pair of vectors is calculated using a stacked
+    matrix multiplication, which uses the same dot product as np.linalg.norm so the
+    distances are identical.
+
+    Parameters
+    ----------
+    vectors1 : np.ndarray
+        Matrix of vectors.
+    vectors2 : np.ndarray
+        Matrix of vectors, the same shape as vectors1.
+
+    Returns
+    -------
+    np.ndarray
+        float32 similarity between each pair of vectors.
+    """
+    diff = vectors1 - vectors2
+    euclidean_dist = np.sqrt((diff[:, None, :] @ diff[:, :, None])[:, 0, 0])
+
+    with np.errstate(divide="ignore"):
+        sigmoid = 1 / (1 + np.exp(-1 / euclidean_dist))
+    sigmoid[euclidean_dist == 0] = 1
+    sigmoid[euclidean_dist == np.inf] = 0
+    return sigmoid
 
 
 class FuzzyEmbeddingMatcher:
     """Implementation of fuzzy document distance metric [1]_ used to determine the most
     similar FDC ingredient to a given ingredient name.
 
+    The similarity between every pair of tokens in the FDC ingredient descriptions is
+    calculated when the matcher is created, because there are only a few thousand of
+    these tokens. Similarities involving other tokens are calculated when needed and
+    stored in a cache owned by the matcher.
+
     References
     ----------
     .. [1] Morales-Garzón, A., Gómez-Romero, J., Martin-Bautista, M.J. (2020). A Word
@@ -439,24 +797,103 @@ class FuzzyEmbeddingMatcher:
     ----------
     embeddings : GloVeModel
         GloVe embeddings model.
+    fdc_token_idx : dict[str, int]
+        Dict of FDC ingredient token: index in fdc_token_similarity pairs.
+    fdc_token_similarity : np.ndarray
+        float32 matrix of similarities between every pair of FDC ingredient tokens.
+    max_token_similarity_cache : LRUCache
+        Cache of maximum similarity of token to FDC ingredient description tokens.
+    token_similarity_cache : LRUCache
+        Cache of similarity between pairs of tokens not in fdc_token_similarity.
     """
 
-    def __init__(self, embeddings: GloVeModel):
+    def __init__(
+        self,
+        embeddings: GloVeModel,
+        fdc_ingredients: list[FDCIngredient] | None = None,
+        token_similarity_cache_size: int = 65536,
+        max_token_similarity_cache_size: int = 65536,
+    ):
         """Initialize.
 
         Parameters
         ----------
         embeddings : GloVeModel
             GloVe embeddings model.
+        fdc_ingredients : list[FDCIngredient] | None, optional
+            FDC ingredients to calculate the similarity between every pair of tokens
+            for. Default is None, which does not calculate any similarities in advance.
+        token_similarity_cache_size : int, optional
+            Maximum number of token similarities to cache.
+            Default is 65536.
+        max_token_similarity_cache_size : int, optional
+            Maximum number of maximum token similarities to FDC ingredient
+            descriptions to cache.
+            Default is 65536.
         """
         self.embeddings = embeddings
+        self.token_similarity_cache = LRUCache(token_similarity_cache_size)
+        self.max_token_similarity_cache = LRUCache(max_token_similarity_cache_size)
+
+        fdc_tokens = dict.fromkeys(
+            t for fdc in fdc_ingredients or [] for t in fdc.tokens
+        )
+        self.fdc_token_idx = {token: i for i, token in enumerate(fdc_tokens)}
+        self.fdc_token_similarity = self._calculate_fdc_token_similarity()
+
+    def _calculate_fdc_token_similarity(self) -> np.ndarray:
+        """Calculate the similarity between every pair of FDC ingredient tokens.
+
+        The similarities are calculated a block of rows at a time to limit the memory
+        used, and only for the columns on or above the diagonal of the block because
+        the matrix is symmetric.
+
+        Returns
+        -------
+        np.ndarray
+            float32 matrix of similarities between every pair of FDC ingredient tokens.
+        """
+        n = len(self.fdc_token_idx)
+        vectors = self.embeddings.matrix[
+            [self.embeddings.index[t] for t in self.fdc_token_idx]
+        ]
+        similarity = np.empty((n, n), dtype=np.float32)
+        block_size = 64
+        for start in range(0, n, block_size):
+            end = min(start + block_size, n)
+            rows = np.repeat(np.arange(start, end), n - start)
+            cols = np.tile(np.arange(start, n), end - start)
+            block = _pairwise_token_similarity(
+                np.take(vectors, rows, axis=0), np.take(vectors, cols, axis=0)
+            )
+            similarity[rows, cols] = block
+            similarity[cols, rows] = block
+
+        return similarity
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Return statistics for the caches owned by this matcher.
+
+        Returns
+        -------
+        dict[str, CacheInfo]
+            Cache hits, misses, maximum size and current size for the
+            "token_similarity" and "max_token_similarity" caches.
+        """
+        return {
+            "token_similarity": self.token_similarity_cache.info(),
+            "max_token_similarity": self.max_token_similarity_cache.info(),
+        }
+
+    def clear_caches(self) -> None:
+        """Remove all entries from the caches owned by this matcher and reset their
+        statistics."""
+        self.token_similarity_cache.clear()
+        self.max_token_similarity_cache.clear()
 
-    @lru_cache
     def _get_vector(self, token: str) -> np.ndarray:
         """Get embedding vector for token.
 
-        This function exists solely so this operation can be LRU cached.
-
         Parameters
         ----------
         token : str
@@ -469,7 +906,6 @@ class FuzzyEmbeddingMatcher:
         """
         return self.embeddings[token]
 
-    @lru_cache(maxsize=512)
     def _token_similarity(self, token1: str, token2: str) -> float:
         """Calculate similarity between two word embeddings.
 
@@ -478,6 +914,36 @@ class FuzzyEmbeddingMatcher:
         1 indicates an exact match (i.e. token1 and token2 are the same).
         0 indicates no match whatsoever.
 
+        If both tokens are FDC ingredient tokens, the precalculated similarity is
+        returned, otherwise the similarity is cached.
+
+        Parameters
+        ----------
+        token1 : str
+            First token.
+        token2 : str
+            Second token.
+
+        Returns
+        -------
+        float
+            Value between 0 and 1.
+        """
+        idx1 = self.fdc_token_idx.get(token1)
+        idx2 = self.fdc_token_idx.get(token2)
+        if idx1 is not None and idx2 is not None:
+            return float(self.fdc_token_similarity[idx1, idx2])
+
+        if (similarity := self.token_similarity_cache.get((token1, token2))) is None:
+            similarity = self._calculate_token_similarity(token1, token2)
+            self.token_similarity_cache.set((token1, token2), similarity)
+
+        return similarity
+
+    def _calculate_token_similarity(self, token1: str, token2: str) -> float:
+        """Calculate similarity between two word embeddings, without using the
+        precalculated similarities or cache.
+
         Parameters
         ----------
         token1 : str
@@ -502,7 +968,6 @@ class FuzzyEmbeddingMatcher:
             sigmoid = 1 / (1 + np.exp(-1 / euclidean_dist))
             return float(sigmoid)
 
-    @lru_cache(maxsize=512)
     def _max_token_similarity(
         self, token: str, fdc_ingredient_tokens: tuple[str, ...]
     ) -> float:
@@ -527,7 +992,14 @@ class FuzzyEmbeddingMatcher:
         float
             Membership score between 0 and 1, where 1 indicates exact match.
         """
-        return max(self._token_similarity(token, t) for t in fdc_ingredient_tokens)
+        key = (token, fdc_ingredient_tokens)
+        if (similarity := self.max_token_similarity_cache.get(key)) is None:
+            similarity = max(
+                self._token_similarity(token, t) for t in fdc_ingredient_tokens
+            )
+            self.max_token_similarity_cache.set(key, similarity)
+
+        return similarity
 
     def _fuzzy_document_distance(
         self,
@@ -580,6 +1052,123 @@ class FuzzyEmbeddingMatcher:
 
         return 1 - res
 
+    def _token_similarity_matrix(self, tokens: list[str]) -> np.ndarray:
+        """Calculate similarity between every pair of tokens.
+
+        This gives the same values as _token_similarity for each pair. Similarities
+        between FDC ingredient tokens are taken from the precalculated similarities
+        and the similarities for the other tokens are calculated together.
+
+        Parameters
+        ----------
+        tokens : list[str]
+            List of unique tokens.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of similarities between each pair of tokens.
+        """
+        fdc_idx = np.array([self.fdc_token_idx.get(t, -1) for t in tokens])
+        in_fdc = np.flatnonzero(fdc_idx >= 0)
+        not_in_fdc = np.flatnonzero(fdc_idx < 0)
+
+        similarity = np.empty((len(tokens), len(tokens)))
+        similarity[np.ix_(in_fdc, in_fdc)] = self.fdc_token_similarity[
+            np.ix_(fdc_idx[in_fdc], fdc_idx[in_fdc])
+        ]
+
+        if not_in_fdc.size > 0:
+            vectors = self.embeddings.matrix[[self.embeddings.index[t] for t in tokens]]
+            rows = np.repeat(not_in_fdc, len(tokens))
+            cols = np.tile(np.arange(len(tokens)), len(not_in_fdc))
+            pairs = _pairwise_token_similarity(
+                np.take(vectors, rows, axis=0), np.take(vectors, cols, axis=0)
+            )
+            similarity[rows, cols] = pairs
+            similarity[cols, rows] = pairs
+
+        return similarity
+
+    def _fuzzy_document_distances(
+        self,
+        ingredient_name_tokens: list[str],
+        fdc_ingredients: list[FDCIngredient],
+    ) -> np.ndarray:
+        """Calculate fuzzy document distance metric between ingredient name and each
+        FDC ingredient description.
+
+        This gives the same values as _fuzzy_document_distance for each FDC
+        ingredient, calculated together from the similarities between every pair of
+        tokens in the ingredient name and FDC ingredient descriptions.
+
+        Parameters
+        ----------
+        ingredient_name_tokens : list[str]
+            Tokens for ingredient name.
+        fdc_ingredients : list[FDCIngredient]
+            List of FDC ingredients.
+
+        Returns
+        -------
+        np.ndarray
+            Fuzzy document distance for each FDC ingredient.
+            Smaller values mean closer match.
+        """
+        tokens = list(
+            dict.fromkeys(
+                chain(ingredient_name_tokens, *(f.tokens for f in fdc_ingredients))
+            )
+        )
+        token_idx = {token: i for i, token in enumerate(tokens)}
+        # The similarity matrix has an extra row and column of zeros at the end for
+        # padding the token lists below to the same length.
+        pad_idx = len(tokens)
+        similarity = np.zeros((len(tokens) + 1, len(tokens) + 1))
+        similarity[:-1, :-1] = self._token_similarity_matrix(tokens)
+
+        # The token union for each FDC ingredient is iterated in the same order as
+        # _fuzzy_document_distance, and the scores are summed one at a time by cumsum,
+        # so the floating point results are identical.
+        ingredient_name_set = set(ingredient_name_tokens)
+        unions = [
+            [token_idx[t] for t in ingredient_name_set | set(fdc.tokens)]
+            for fdc in fdc_ingredients
+        ]
+        union_len = max(len(union) for union in unions)
+        union_idx = np.array(
+            [union + [pad_idx] * (union_len - len(union)) for union in unions]
+        )
+        # The FDC ingredient tokens are padded by repeating the first token, which does
+        # not change the maximum similarity to them.
+        fdc_tokens = [[token_idx[t] for t in fdc.tokens] for fdc in fdc_ingredients]
+        fdc_len = max(len(fdc) for fdc in fdc_tokens)
+        fdc_token_idx = np.array(
+            [fdc + fdc[:1] * (fdc_len - len(fdc)) for fdc in fdc_tokens]
+        )
+
+        # Maximum similarity of each token in each union to the ingredient name tokens
+        # and to the FDC ingredient tokens.
+        name_idx = [token_idx[t] for t in ingredient_name_tokens]
+        token_ingred_scores = similarity[:, name_idx].max(axis=1)[union_idx]
+        token_fdc_scores = similarity[
+            union_idx[:, :, None], fdc_token_idx[:, None, :]
+        ].max(axis=2)
+
+        union_membership = np.cumsum(token_ingred_scores * token_fdc_scores, axis=1)
+        ingred_membership = np.cumsum(token_ingred_scores, axis=1)
+        fdc_membership = np.cumsum(token_fdc_scores, axis=1)
+
+        union_membership = union_membership[:, -1]
+        denominator = (
+            ingred_membership[:, -1] + fdc_membership[:, -1] - union_membership
+        )
+        # Protect against divide by zero errors
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res = np.where(denominator > 0, union_membership / denominator, 0)
+
+        return 1 - res
+
     def find_best_match(
         self, ingredient_name_tokens: list[str], fdc_ingredients: list[FDCIngredient]
     ) -> FDCIngredientMatch:
@@ -608,13 +1197,9 @@ class FuzzyEmbeddingMatcher:
         if len(set(ingredient_name_tokens) & NON_RAW_FOOD_VERB_STEMS) == 0:
             ingredient_name_tokens.append("raw")
 
-        scored: list[FDCIngredientMatch] = []
-        for fdc in fdc_ingredients:
-            score = self._fuzzy_document_distance(ingredient_name_tokens, fdc.tokens)
-            scored.append(FDCIngredientMatch(fdc=fdc, score=score))
-
-        sorted_matches = sorted(scored, key=lambda x: x.score)
-        return sorted_matches[0]
+        scores = self._fuzzy_document_distances(ingredient_name_tokens, fdc_ingredients)
+        best = int(np.argmin(scores))
+        return FDCIngredientMatch(fdc=fdc_ingredients[best], score=float(scores[best]))
 
 
 @lru_cache
@@ -627,21 +1212,96 @@ def get_usif_matcher() -> uSIF:
         Instantiation uSIF object.
     """
     embeddings = load_embeddings_model()
-    fdc_ingredients = load_fdc_ingredients()
-    return uSIF(embeddings, fdc_ingredients)
+    return uSIF.from_index(embeddings, load_fdc_index())
+
+
+# Maximum sizes of the caches owned by the FuzzyEmbeddingMatcher returned by
+# get_fuzzy_matcher. Set using set_fuzzy_matcher_cache_sizes.
+_FUZZY_MATCHER_CACHE_SIZES = {"token_similarity": 65536, "max_token_similarity": 65536}
 
 
 @lru_cache
 def get_fuzzy_matcher() -> FuzzyEmbeddingMatcher:
     """Cached function for returning instantiated FuzzyEmbeddingMatcher object.
 
+    The sizes of the matcher's caches are set by set_fuzzy_matcher_cache_sizes.
+
     Returns
     -------
     FuzzyEmbeddingMatcher
         Instantiation FuzzyEmbeddingMatcher object.
     """
     embeddings = load_embeddings_model()
-    return FuzzyEmbeddingMatcher(embeddings)
+    return FuzzyEmbeddingMatcher(
+        embeddings,
+        load_fdc_ingredients(),
+        token_similarity_cache_size=_FUZZY_MATCHER_CACHE_SIZES["token_similarity"],
+        max_token_similarity_cache_size=_FUZZY_MATCHER_CACHE_SIZES[
+            "max_token_similarity"
+        ],
+    )
+
+
+def set_fuzzy_matcher_cache_sizes(
+    token_similarity: int = 65536, max_token_similarity: int = 65536
+) -> None:
+    """Set the maximum sizes of the caches used by the fuzzy matcher when matching
+    foundation foods.
+
+    If the fuzzy matcher has already been created, its caches are replaced with empty
+    caches of the new sizes. Otherwise, the sizes are used when it is created.
+
+    Parameters
+    ----------
+    token_similarity : int, optional
+        Maximum number of similarities between pairs of tokens to cache.
+        Default is 65536.
+    max_token_similarity : int, optional
+        Maximum number of maximum token similarities to FDC ingredient descriptions to
+        cache.
+        Default is 65536.
+
+    Raises
+    ------
+    ValueError
+        Raised if either size is less than 1.
+
+    Examples
+    --------
+    >>> from ingredient_parser import set_fuzzy_matcher_cache_sizes
+    >>> set_fuzzy_matcher_cache_sizes(token_similarity=262144)
+    """
+    if token_similarity < 1 or max_token_similarity < 1:
+        raise ValueError("Cache sizes must be at least 1.")
+
+    _FUZZY_MATCHER_CACHE_SIZES["token_similarity"] = token_similarity
+    _FUZZY_MATCHER_CACHE_SIZES["max_token_similarity"] = max_token_similarity
+    if get_fuzzy_matcher.cache_info().currsize > 0:
+        matcher = get_fuzzy_matcher()
+        matcher.token_similarity_cache = LRUCache(token_similarity)
+        matcher.max_token_similarity_cache = LRUCache(max_token_similarity)
+
+
+def fuzzy_matcher_cache_info() -> dict[str, CacheInfo]:
+    """Return statistics for the caches used by the fuzzy matcher when matching
+    foundation foods.
+
+    This does not create the fuzzy matcher. If it has not been created yet, the
+    statistics are for empty caches of the sizes that will be used.
+
+    Returns
+    -------
+    dict[str, CacheInfo]
+        Cache hits, misses, maximum size and current size for the "token_similarity"
+        and "max_token_similarity" caches.
+    """
+    if get_fuzzy_matcher.cache_info().currsize > 0:
+        return get_fuzzy_matcher().cache_info()
+
+    return {
+        name: CacheInfo(hits=0, misses=0, maxsize=maxsize, currsize=0)
+        for name, maxsize in _FUZZY_MATCHER_CACHE_SIZES.items()
+    }
 
 
 # Phrase and token substitutions to normalise spelling of ingredient name tokens to the
@@ -678,6 +1338,218 @@ FDC_TOKEN_TO_PHRASE_SUBSTITUTIONS: dict[str, list[str]] = {
 }
 
 
+@lru_cache
+def fdc_data_hash() -> str:
+    """Return hash of the FDC data used for matching foundation foods.
+
+    This is the hash of fdc_index.npz if it is bundled with the package, otherwise of
+    fdc_ingredients.csv.gz. The FDC index contains the uSIF vectors calculated from the
+    embeddings, so it changes whenever the embeddings or FDC ingredients change.
+
+    Returns
+    -------
+    str
+        SHA256 hash of FDC data file.
+    """
+    index_file = files(__package__) / FDC_INDEX_FILE
+    if not index_file.is_file():
+        index_file = files(__package__) / "data/fdc_ingredients.csv.gz"
+    return hashlib.sha256(index_file.read_bytes()).hexdigest()
+
+
+class FoundationFoodCache(LRUCache):
+    """Cache of foundation food matches, keyed on the prepared and normalised ingredient
+    name tokens.
+
+    Names without a match are cached as None. When the cache is full, the least recently
+    used entry is evicted.
+
+    The cached FoundationFood objects are never returned. Each lookup that uses the
+    cache returns a new FoundationFood object with the caller's name_index, so modifying
+    a returned object never modifies the cached entry.
+
+    If a path is given, the cache is persistent. Entries are loaded from the file when
+    the cache is created and written to it by save(). The file records the version of
+    this library and a hash of the FDC data, and is ignored if either has changed.
+
+    The cache is safe to use from multiple threads.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of entries in cache.
+    path : Path | None
+        Path to JSON file the cache is saved to, or None if the cache is not persistent.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: str | os.PathLike | None = None):
+        """Initialise.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries in cache.
+            Default is 4096.
+        path : str | os.PathLike | None, optional
+            Path to JSON file to load entries from and save entries to.
+            Default is None, which does not persist the cache.
+        """
+        super().__init__(maxsize=maxsize)
+        self.path = Path(path).expanduser() if path is not None else None
+        if self.path is not None and self.path.is_file():
+            self._load()
+
+    def __repr__(self) -> str:
+        return f"FoundationFoodCache(maxsize={self.maxsize}, path={self.path})"
+
+    def __reduce__(self):
+        return (self.__class__, (self.maxsize, self.path))
+
+    def _load(self) -> None:
+        """Load entries from the cache file, unless it is stale."""
+        from .. import __version__
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if (
+            data.get("version") != __version__
+            or data.get("fdc_hash") != fdc_data_hash()
+        ):
+            logger.debug(f"Ignoring stale foundation food cache file: '{self.path}'.")
+            return
+
+        for tokens, ff in data["entries"]:
+            self.set(tuple(tokens), FoundationFood(**ff, name_index=0) if ff else None)
+        logger.debug(f"Loaded {len(self)} entries from '{self.path}'.")
+
+    def save(self) -> None:
+        """Save entries to the cache file.
+
+        The file is replaced in a single step, so a process reading it never sees a
+        partially written file.
+
+        Raises
+        ------
+        ValueError
+            Raised if the cache was created without a path.
+        """
+        from .. import __version__
+
+        if self.path is None:
+            raise ValueError("Cannot save foundation food cache without a path.")
+
+        with self._lock:
+            entries = [
+                [
+                    list(tokens),
+                    {
+                        "text": ff.text,
+                        "confidence": ff.confidence,
+                        "fdc_id": ff.fdc_id,
+                        "category": ff.category,
+                        "data_type": ff.data_type,
+                    }
+                    if ff is not None
+                    else None,
+                ]
+                for tokens, ff in self._entries.items()
+            ]
+
+        data = {"version": __version__, "fdc_hash": fdc_data_hash(), "entries": entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+# Default returned from the foundation food cache for names not in the cache, because
+# names without a match are cached as None.
+_NOT_CACHED = object()
+
+# Cache used when matching foundation foods. Caching is disabled when this is None.
+_FOUNDATION_FOOD_CACHE: FoundationFoodCache | None = FoundationFoodCache()
+
+
+def set_foundation_food_cache(cache: FoundationFoodCache | None) -> None:
+    """Set the cache used to store foundation food matches.
+
+    By default, an in-memory cache of 4096 entries is used.
+
+    Parameters
+    ----------
+    cache : FoundationFoodCache | None
+        Cache to use. If None, caching is disabled.
+
+    Examples
+    --------
+    >>> from ingredient_parser import FoundationFoodCache, set_foundation_food_cache
+    >>> cache = FoundationFoodCache(path="~/.cache/ingredient-parser/ff.json")
+    >>> set_foundation_food_cache(cache)
+    """
+    global _FOUNDATION_FOOD_CACHE
+    _FOUNDATION_FOOD_CACHE = cache
+
+
+def get_foundation_food_cache() -> FoundationFoodCache | None:
+    """Return the cache used to store foundation food matches.
+
+    Returns
+    -------
+    FoundationFoodCache | None
+        Cache in use, or None if caching is disabled.
+    """
+    return _FOUNDATION_FOOD_CACHE
+
+
+def set_fdc_ann_index(
+    index: str | os.PathLike | IVFIndex | None, n_probe: int | None = None
+) -> None:
+    """Set approximate nearest neighbour index used to find candidate foundation food
+    matches.
+
+    With an index, the uSIF matcher only calculates the distance to the FDC ingredients
+    in the lists searched by the index, instead of to every FDC ingredient. This is much
+    faster when there are a very large number of FDC ingredients, but the best
+    candidates might be missed. See IVFIndex for details.
+
+    The uSIF matcher is loaded if it has not been already, so the index can be checked
+    against the FDC ingredients. The foundation food cache is cleared, because the
+    cached matches might be different with the new index.
+
+    Parameters
+    ----------
+    index : str | os.PathLike | IVFIndex | None
+        Path to .npz file created by train/data/create_fdc_ann_index.py, or IVFIndex
+        object. If None, the distance to every FDC ingredient is calculated.
+    n_probe : int | None, optional
+        Number of lists to search for each ingredient name. Increasing this trades
+        speed for recall.
+        Default is None, which uses 8 for an index loaded from a path and the n_probe
+        attribute of an IVFIndex object.
+
+    Raises
+    ------
+    ValueError
+        Raised if the index does not have the same number of vectors as there are FDC
+        ingredients.
+
+    Examples
+    --------
+    >>> from ingredient_parser import set_fdc_ann_index
+    >>> set_fdc_ann_index("fdc_ann_index.npz", n_probe=16)
+    """
+    if isinstance(index, str | os.PathLike):
+        index = IVFIndex.load(index)
+    if index is not None and n_probe is not None:
+        index = replace(index, n_probe=n_probe)
+
+    get_usif_matcher().set_ann_index(index)
+    if _FOUNDATION_FOOD_CACHE is not None:
+        _FOUNDATION_FOOD_CACHE.clear()
+
+
 def normalise_spelling(tokens: list[str]) -> list[str]:
     """Normalise spelling in `tokens` to standard spellings used in FDC ingredient
     descriptions.
@@ -738,6 +1610,9 @@ def match_foundation_foods(tokens: list[str], name_idx: int) -> FoundationFood |
     accurate as off the shelf pre-trained general embeddings are for general tasks.
     Improving the quality of the embeddings might remove the need for the second stage.
 
+    The result for the normalised tokens is stored in the foundation food cache, so
+    matching the same name again only repeats the first stage.
+
     Parameters
     ----------
     tokens : list[str]
@@ -749,23 +1624,30 @@ def match_foundation_foods(tokens: list[str], name_idx: int) -> FoundationFood |
     -------
     FoundationFood | None
     """
-    logger.debug(f"Matching FDC ingredient for ingredient name tokens: {tokens}")
-    prepared_tokens = prepare_embeddings_tokens(tuple(tokens))
-    logger.debug(f"Prepared tokens: {prepared_tokens}.")
-    if not prepared_tokens:
-        logger.debug("Ingredient name has no tokens in embedding vocabulary.")
-        return None
+    return match_foundation_foods_batch([tokens], [name_idx])[0]
 
-    normalised_tokens = normalise_spelling(prepared_tokens)
 
-    if tuple(normalised_tokens) in FOUNDATION_FOOD_OVERRIDES:
-        logger.debug("Returning FDC ingredient from override list.")
-        match = FOUNDATION_FOOD_OVERRIDES[tuple(normalised_tokens)]
-        match.name_index = name_idx
-        return match
+def _select_best_match(
+    normalised_tokens: list[str],
+    candidate_matches: list[FDCIngredientMatch],
+    name_idx: int,
+) -> FoundationFood | None:
+    """Select best of candidate matching FDC ingredients using the fuzzy embedding
+    document metric, if it is a good enough match.
+
+    Parameters
+    ----------
+    normalised_tokens : list[str]
+        Prepared and normalised ingredient name tokens.
+    candidate_matches : list[FDCIngredientMatch]
+        Candidate matching FDC ingredients from uSIF matcher.
+    name_idx : int
+        Index of corresponding name in ParsedIngredient.names list.
 
-    u = get_usif_matcher()
-    candidate_matches = u.find_candidate_matches(normalised_tokens, n=50)
+    Returns
+    -------
+    FoundationFood | None
+    """
     if not candidate_matches:
         logger.debug("No matching FDC ingredients found with uSIF matcher.")
         return None
@@ -787,3 +1669,85 @@ def match_foundation_foods(tokens: list[str], name_idx: int) -> FoundationFood |
 
     logger.debug("No FDC ingredients found with good enough match.")
     return None
+
+
+def match_foundation_foods_batch(
+    names: list[list[str]], name_indices: list[int] | None = None
+) -> list[FoundationFood | None]:
+    """Match many ingredient names to foundation foods from FDC ingredients.
+
+    This gives the same results as calling match_foundation_foods for each name, but
+    names with the same prepared and normalised tokens are only matched once, and the
+    uSIF candidate matches for all names not in the foundation food cache are found
+    together in a single matrix-matrix product.
+
+    Parameters
+    ----------
+    names : list[list[str]]
+        List of ingredient name tokens for each name.
+    name_indices : list[int] | None, optional
+        Index of corresponding name in ParsedIngredient.names list for each name.
+        If None, every name is given an index of 0.
+
+    Returns
+    -------
+    list[FoundationFood | None]
+        Matching foundation food for each name, or None if there is no match.
+        Each FoundationFood is a new object.
+    """
+    if name_indices is None:
+        name_indices = [0] * len(names)
+
+    normalised_names: list[tuple[str, ...] | None] = []
+    for tokens in names:
+        logger.debug(f"Matching FDC ingredient for ingredient name tokens: {tokens}")
+        prepared_tokens = prepare_embeddings_tokens(tuple(tokens))
+        if prepared_tokens:
+            normalised_names.append(tuple(normalise_spelling(prepared_tokens)))
+        else:
+            logger.debug("Ingredient name has no tokens in embedding vocabulary.")
+            normalised_names.append(None)
+
+    cache = get_foundation_food_cache()
+    best_matches: dict[tuple[str, ...], FoundationFood | None] = {}
+    unmatched_names: list[tuple[str, ...]] = []
+    for normalised_tokens in dict.fromkeys(normalised_names):
+        if normalised_tokens is None:
+            continue
+        elif normalised_tokens in FOUNDATION_FOOD_OVERRIDES:
+            logger.debug("Returning FDC ingredient from override list.")
+            best_matches[normalised_tokens] = FOUNDATION_FOOD_OVERRIDES[
+                normalised_tokens
+            ]
+        elif (
+            cache is not None
+            and (cached := cache.get(normalised_tokens, _NOT_CACHED)) is not _NOT_CACHED
+        ):
+            logger.debug("Returning FDC ingredient from cache.")
+            best_matches[normalised_tokens] = cached
+        else:
+            unmatched_names.append(normalised_tokens)
+
+    if unmatched_names:
+        logger.debug(f"Matching FDC ingredients for {len(unmatched_names)} names.")
+        u = get_usif_matcher()
+        candidate_matches = u.find_candidate_matches_batch(
+            [list(normalised_tokens) for normalised_tokens in unmatched_names], n=50
+        )
+        for normalised_tokens, candidates in zip(unmatched_names, candidate_matches):
+            match = _select_best_match(list(normalised_tokens), candidates, 0)
+            best_matches[normalised_tokens] = match
+            if cache is not None:
+                cache.set(normalised_tokens, match)
+
+    # The matched FoundationFood objects are shared between names and with the
+    # overrides and cache, so return a new object for each name.
+    matches = []
+    for normalised_tokens, name_idx in zip(normalised_names, name_indices):
+        if normalised_tokens is None or best_matches[normalised_tokens] is None:
+            matches.append(None)
+        else:
+            match = best_matches[normalised_tokens]
+            matches.append(replace(match, name_index=name_idx))
+
+    return matches
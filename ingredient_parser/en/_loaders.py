@@ -1,14 +1,31 @@
 #!/usr/bin/env python3
 
+import asyncio
 import gzip
+import hashlib
 import json
 import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
 from functools import lru_cache
 from importlib.resources import as_file, files
+from importlib.resources.abc import Traversable
+from pathlib import Path
 
+import nltk
 import pycrfsuite
+from nltk.tag.perceptron import PerceptronTagger
 
+from .._common import get_cache_dir
 from ._embeddings import GloVeModel
+from ._pos_tagger import VectorisedPerceptronTagger
 
 logger = logging.getLogger("ingredient-parser")
 
@@ -20,6 +37,10 @@ def load_parser_model() -> pycrfsuite.Tagger:  # type: ignore
     This function is cached so that when the model has been loaded once, it does not
     need to be loaded again, the cached model is returned.
 
+    The returned Tagger object is shared and must not be used from multiple threads at
+    the same time. Use load_parser_model_pool to obtain a Tagger object for exclusive
+    use.
+
     Returns
     -------
     pycrfsuite.Tagger
@@ -32,10 +53,98 @@ def load_parser_model() -> pycrfsuite.Tagger:  # type: ignore
         return tagger
 
 
+class TaggerPool:
+    """Pool of Tagger objects for the parser model.
+
+    A pycrfsuite.Tagger object keeps the state of the last sentence it tagged so that
+    the marginal probabilities can be calculated for each label. This means a single
+    Tagger object cannot be shared between threads, because one thread can tag a
+    sentence between another thread tagging a sentence and calculating the marginals.
+
+    Tagger objects are checked out of the pool for exclusive use and returned when
+    finished with. A new Tagger object is created whenever there are no idle objects
+    in the pool, so the size of the pool grows to the maximum number of threads that
+    parse concurrently.
+
+    Attributes
+    ----------
+    model_file : str
+        Path to model file, relative to this package.
+    """
+
+    def __init__(self, model_file: str):
+        """Initialise.
+
+        Parameters
+        ----------
+        model_file : str
+            Path to model file, relative to this package.
+        """
+        self.model_file = model_file
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+
+    def __repr__(self) -> str:
+        return f"TaggerPool(model_file={self.model_file})"
+
+    def _create_tagger(self) -> pycrfsuite.Tagger:  # type: ignore
+        """Create new Tagger object with model loaded.
+
+        Returns
+        -------
+        pycrfsuite.Tagger
+            Parser model loaded into Tagger object.
+        """
+        logger.debug(f"Creating new Tagger for parser model: '{self.model_file}'.")
+        tagger = pycrfsuite.Tagger()  # type: ignore
+        with as_file(files(__package__) / self.model_file) as p:
+            tagger.open(str(p))
+            return tagger
+
+    @contextmanager
+    def checkout(self) -> Iterator[pycrfsuite.Tagger]:  # type: ignore
+        """Check out Tagger object for exclusive use by the caller.
+
+        The Tagger object is returned to the pool when the context manager exits.
+
+        Yields
+        ------
+        pycrfsuite.Tagger
+            Parser model loaded into Tagger object.
+        """
+        try:
+            tagger = self._idle.get_nowait()
+        except queue.Empty:
+            tagger = self._create_tagger()
+
+        try:
+            yield tagger
+        finally:
+            self._idle.put(tagger)
+
+
+@lru_cache
+def load_parser_model_pool() -> TaggerPool:
+    """Load pool of Tagger objects for the parser model.
+
+    This function is cached so that the same pool is returned every time.
+
+    Use this instead of load_parser_model when tagging sentences from multiple threads.
+
+    Returns
+    -------
+    TaggerPool
+        Pool of Tagger objects for parser model.
+    """
+    return TaggerPool("data/model.en.crfsuite")
+
+
 @lru_cache
 def load_embeddings_model() -> GloVeModel:  # type: ignore
     """Load embeddings model.
 
+    The embeddings are loaded from the binary format if it is bundled with the
+    package, otherwise from the gzipped text format.
+
     This function is cached so that when the model has been loaded once, it does not
     need to be loaded again, the cached model is returned.
 
@@ -44,8 +153,15 @@ def load_embeddings_model() -> GloVeModel:  # type: ignore
     GloVeModel
         Embeddings model.
     """
-    logger.debug("Loading embeddings model: 'ingredient_embeddings.25d.glove.txt.gz'.")
-    return GloVeModel("data/ingredient_embeddings.25d.glove.txt.gz")
+    for vec_file in [
+        "data/ingredient_embeddings.25d.glove.npy",
+        "data/ingredient_embeddings.25d.glove.txt.gz",
+    ]:
+        if (files(__package__) / vec_file).is_file():
+            break
+
+    logger.debug(f"Loading embeddings model: '{vec_file}'.")
+    return GloVeModel(vec_file)
 
 
 @lru_cache
@@ -66,3 +182,398 @@ def load_ingredient_tagdict() -> dict[str, str]:
             tagdict = json.load(f)
 
     return tagdict
+
+
+# Name of NLTK part of speech tagger resource.
+POS_TAGGER_NAME = "averaged_perceptron_tagger_eng"
+# Environment variable that can be set to the directory containing the part of speech
+# tagger files.
+POS_TAGGER_PATH_ENV = "INGREDIENT_PARSER_POS_TAGGER_PATH"
+# Directory set by set_pos_tagger_path.
+_POS_TAGGER_PATH: Path | None = None
+
+
+def set_pos_tagger_path(path: str | os.PathLike | None) -> None:
+    """Set directory to load the part of speech tagger from.
+
+    The directory must contain the three files of NLTK's averaged_perceptron_tagger_eng
+    resource: averaged_perceptron_tagger_eng.weights.json,
+    averaged_perceptron_tagger_eng.tagdict.json and
+    averaged_perceptron_tagger_eng.classes.json, or the same tagger converted to
+    averaged_perceptron_tagger_eng.npz by train/data/create_pos_tagger.py. The JSON
+    files are converted the first time they are loaded and the converted tagger is
+    saved to the cache directory, see load_pos_tagger.
+
+    This takes precedence over the INGREDIENT_PARSER_POS_TAGGER_PATH environment
+    variable. If the part of speech tagger has already been loaded, it is loaded again
+    from the new directory the next time it is used.
+
+    Parameters
+    ----------
+    path : str | os.PathLike | None
+        Directory containing part of speech tagger files. If None, the directory is
+        found automatically.
+    """
+    global _POS_TAGGER_PATH
+    _POS_TAGGER_PATH = Path(path).expanduser() if path is not None else None
+    load_pos_tagger.cache_clear()
+    load_ingredient_pos_tagger.cache_clear()
+
+
+def find_pos_tagger() -> Traversable:
+    """Find directory containing part of speech tagger files.
+
+    If a directory has been set using set_pos_tagger_path or the
+    INGREDIENT_PARSER_POS_TAGGER_PATH environment variable, only that directory is
+    used. Otherwise, the NLTK data directories are searched.
+
+    The network is never used. If the files cannot be found, they must be downloaded
+    beforehand, e.g. using nltk.download("averaged_perceptron_tagger_eng").
+
+    Returns
+    -------
+    Traversable
+        Directory containing part of speech tagger files.
+
+    Raises
+    ------
+    LookupError
+        Raised if the part of speech tagger files could not be found.
+    """
+    if _POS_TAGGER_PATH is not None:
+        candidates: list[Traversable] = [_POS_TAGGER_PATH]
+    elif env_path := os.environ.get(POS_TAGGER_PATH_ENV):
+        candidates = [Path(env_path).expanduser()]
+    else:
+        candidates = [
+            Path(nltk_path) / "taggers" / POS_TAGGER_NAME
+            for nltk_path in nltk.data.path
+        ]
+
+    for candidate in candidates:
+        if candidate.joinpath(f"{POS_TAGGER_NAME}.npz").is_file() or all(
+            candidate.joinpath(f"{POS_TAGGER_NAME}.{attr}.json").is_file()
+            for attr in ["weights", "tagdict", "classes"]
+        ):
+            return candidate
+
+    searched = "\n".join(f"  - {candidate}" for candidate in candidates)
+    raise LookupError(
+        f"Part of speech tagger resource '{POS_TAGGER_NAME}' not found.\n"
+        f"Download it with nltk.download('{POS_TAGGER_NAME}'), or set the directory "
+        f"containing it with set_pos_tagger_path or the {POS_TAGGER_PATH_ENV} "
+        f"environment variable.\nSearched in:\n{searched}"
+    )
+
+
+def load_nltk_pos_tagger(path: Traversable) -> PerceptronTagger:
+    """Load NLTK's averaged perceptron part of speech tagger from JSON files.
+
+    Parameters
+    ----------
+    path : Traversable
+        Directory containing the averaged_perceptron_tagger_eng JSON files.
+
+    Returns
+    -------
+    PerceptronTagger
+        NLTK part of speech tagger.
+    """
+    weights, tagdict, classes = (
+        json.loads(path.joinpath(f"{POS_TAGGER_NAME}.{attr}.json").read_text())
+        for attr in ["weights", "tagdict", "classes"]
+    )
+    tagger = PerceptronTagger(load=False)
+    tagger.model.weights = weights
+    tagger.tagdict = tagdict
+    tagger.classes = tagger.model.classes = set(classes)
+    return tagger
+
+
+def converted_pos_tagger_path(path: Traversable) -> Path:
+    """Return path of .npz file in the cache directory for converted tagger.
+
+    The file name includes a hash of NLTK's JSON files in path and the version of this
+    library, so a different or updated tagger is converted again instead of using a
+    stale file.
+
+    Parameters
+    ----------
+    path : Traversable
+        Directory containing the averaged_perceptron_tagger_eng JSON files.
+
+    Returns
+    -------
+    Path
+        Path to .npz file, which may not exist.
+    """
+    from .. import __version__
+
+    digest = hashlib.blake2b(__version__.encode("utf-8"), digest_size=16)
+    for attr in ["weights", "tagdict", "classes"]:
+        digest.update(path.joinpath(f"{POS_TAGGER_NAME}.{attr}.json").read_bytes())
+
+    return get_cache_dir() / f"{POS_TAGGER_NAME}.{digest.hexdigest()}.npz"
+
+
+def save_converted_pos_tagger(tagger: VectorisedPerceptronTagger, path: Path) -> None:
+    """Save converted part of speech tagger to path in the cache directory.
+
+    The tagger is written to a temporary file which is then renamed, so processes
+    loading the tagger at the same time never see a partially written file. Failing to
+    save the tagger, for example because the cache directory is read only, is logged
+    and otherwise ignored.
+
+    Parameters
+    ----------
+    tagger : VectorisedPerceptronTagger
+        Converted part of speech tagger.
+    path : Path
+        Path to save .npz file to.
+    """
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=".npz", delete=False
+        ) as f:
+            tmp_path = Path(f.name)
+        tagger.save(tmp_path)
+        os.replace(tmp_path, path)
+        logger.debug(f"Saved converted part of speech tagger to '{path}'.")
+    except OSError as e:
+        logger.debug(f"Could not save converted part of speech tagger to '{path}': {e}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+@lru_cache
+def load_pos_tagger() -> VectorisedPerceptronTagger:
+    """Load averaged perceptron part of speech tagger.
+
+    The tagger is loaded from the directory returned by find_pos_tagger, without using
+    the network. If the directory contains the tagger converted to a .npz file, that is
+    loaded. Otherwise, the tagger converted from NLTK's JSON files by a previous
+    process is loaded from the cache directory returned by get_cache_dir. If there is
+    no converted tagger in the cache directory either, NLTK's JSON files are loaded and
+    converted, and the converted tagger is saved to the cache directory so the
+    conversion only happens once.
+
+    This function is cached so that when the tagger has been loaded once, it does not
+    need to be loaded again, the cached tagger is returned.
+
+    Returns
+    -------
+    VectorisedPerceptronTagger
+        Part of speech tagger.
+    """
+    path = find_pos_tagger()
+    logger.debug(f"Loading part of speech tagger from '{path}'.")
+    if (npz := path.joinpath(f"{POS_TAGGER_NAME}.npz")).is_file():
+        return VectorisedPerceptronTagger.load(npz)
+
+    converted_path = converted_pos_tagger_path(path)
+    if converted_path.is_file():
+        logger.debug(f"Loading converted part of speech tagger '{converted_path}'.")
+        try:
+            return VectorisedPerceptronTagger.load(converted_path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            logger.debug(f"Could not load converted part of speech tagger: {e}")
+
+    tagger = VectorisedPerceptronTagger.from_perceptron(load_nltk_pos_tagger(path))
+    save_converted_pos_tagger(tagger, converted_path)
+    return tagger
+
+
+class IngredientPOSTagger:
+    """Part of speech tagger for ingredient sentences.
+
+    This wraps the averaged perceptron tagger, with the tagger's tagdict extended with
+    ingredient sentence specific entries. The tagdict is a dict of token:tag pairs
+    which bypass the part of speech tagging model.
+
+    The extended tagdict is built once, when the object is created. The object is not
+    modified by tagging, so it can be used from multiple threads.
+
+    Attributes
+    ----------
+    tagdict : dict[str, str]
+        Dict of token:tag pairs that bypass the part of speech tagging model.
+    """
+
+    def __init__(
+        self,
+        tagger: VectorisedPerceptronTagger,
+        ingredient_tagdict: dict[str, str],
+    ):
+        """Initialise.
+
+        Parameters
+        ----------
+        tagger : VectorisedPerceptronTagger
+            Averaged perceptron tagger. The tagger is not modified.
+        ingredient_tagdict : dict[str, str]
+            Dict of ingredient specific token:tag pairs. These take precedence over
+            the tagger's tagdict.
+        """
+        self._tagger = tagger.with_tagdict({**tagger.tagdict, **ingredient_tagdict})
+
+    @property
+    def tagdict(self) -> dict[str, str]:
+        return self._tagger.tagdict
+
+    def tag(self, tokens: list[str]) -> list[tuple[str, str]]:
+        """Tag tokens with parts of speech.
+
+        Parameters
+        ----------
+        tokens : list[str]
+            List of tokens.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            List of (token, tag) pairs.
+        """
+        return self._tagger.tag(tokens)
+
+    def tag_many(self, sentences: Iterable[list[str]]) -> list[list[tuple[str, str]]]:
+        """Tag tokens of multiple sentences with parts of speech.
+
+        Parameters
+        ----------
+        sentences : Iterable[list[str]]
+            List of tokens for each sentence.
+
+        Returns
+        -------
+        list[list[tuple[str, str]]]
+            List of (token, tag) pairs for each sentence.
+        """
+        return self._tagger.tag_many(sentences)
+
+
+@lru_cache
+def load_ingredient_pos_tagger() -> IngredientPOSTagger:
+    """Load part of speech tagger for ingredient sentences.
+
+    This function is cached so that when the tagger has been loaded once, it does not
+    need to be loaded again, the cached tagger is returned.
+
+    Returns
+    -------
+    IngredientPOSTagger
+        Part of speech tagger, with tagdict extended with ingredient specific entries.
+    """
+    return IngredientPOSTagger(load_pos_tagger(), load_ingredient_tagdict())
+
+
+def load_models(
+    foundation_foods: bool = False, unit_registry: bool = False
+) -> dict[str, float]:
+    """Load all models required for parsing sentences.
+
+    Each model is loaded in turn and the time taken to load it is recorded. Models that
+    have already been loaded are not loaded again, so take almost no time.
+
+    Parameters
+    ----------
+    foundation_foods : bool, optional
+        If True, also load the models used for foundation food matching.
+        Default is False.
+    unit_registry : bool, optional
+        If True, also create the pint unit registry used for units that are not
+        returned as strings.
+        Default is False.
+
+    Returns
+    -------
+    dict[str, float]
+        Time, in seconds, taken to load each model.
+    """
+    # Imported here to avoid circular imports, because these modules import the
+    # loader functions from this module.
+    from .._common import get_unit_registry
+    from ._foundationfoods import (
+        get_fuzzy_matcher,
+        get_usif_matcher,
+        load_fdc_ingredients,
+    )
+
+    def load_parser_model_into_pool() -> None:
+        # Check out a Tagger so the pool contains a Tagger with the model loaded.
+        with load_parser_model_pool().checkout():
+            pass
+
+    loaders = {
+        "parser_model": load_parser_model_into_pool,
+        "ingredient_tagdict": load_ingredient_tagdict,
+        "pos_tagger": load_pos_tagger,
+        "ingredient_pos_tagger": load_ingredient_pos_tagger,
+    }
+    if unit_registry:
+        loaders["unit_registry"] = get_unit_registry
+    if foundation_foods:
+        # The embeddings and FDC ingredients are loaded before the matchers that use
+        # them, so the time for each matcher only includes creating the matcher.
+        loaders["embeddings"] = load_embeddings_model
+        loaders["fdc_ingredients"] = load_fdc_ingredients
+        loaders["usif_matcher"] = get_usif_matcher
+        loaders["fuzzy_matcher"] = get_fuzzy_matcher
+
+    timings = {}
+    for name, loader in loaders.items():
+        start = time.perf_counter()
+        loader()
+        timings[name] = time.perf_counter() - start
+        logger.debug(f"Loaded {name} in {timings[name]:.3f} s.")
+
+    return timings
+
+
+# Futures for models being loaded by aload_models, keyed by the foundation_foods
+# argument.
+_MODELS_LOADED: dict[bool, Future] = {}
+_MODELS_LOADED_LOCK = threading.Lock()
+
+
+async def aload_models(
+    foundation_foods: bool = False, executor: Executor | None = None
+) -> None:
+    """Load all models required for parsing sentences without blocking the event loop.
+
+    The models are loaded in the executor. The first call starts loading the models
+    and any calls made whilst the models are loading wait for the same load to
+    complete, rather than each starting their own load.
+
+    Parameters
+    ----------
+    foundation_foods : bool, optional
+        If True, also load the models used for foundation food matching.
+        Default is False.
+    executor : Executor | None, optional
+        Executor to load models in.
+        Default is None, which uses the event loop's default executor.
+    """
+    with _MODELS_LOADED_LOCK:
+        loaded = _MODELS_LOADED.get(foundation_foods) or _MODELS_LOADED.get(True)
+        owner = loaded is None
+        if loaded is None:
+            loaded = Future()
+            _MODELS_LOADED[foundation_foods] = loaded
+
+    if not owner:
+        await asyncio.wrap_future(loaded)
+        return
+
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(executor, load_models, foundation_foods)
+    except BaseException as e:
+        # Allow a later call to try again.
+        with _MODELS_LOADED_LOCK:
+            del _MODELS_LOADED[foundation_foods]
+        loaded.set_exception(e)
+        raise
+
+    loaded.set_result(None)
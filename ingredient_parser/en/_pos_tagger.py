@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+
+import copy
+import os
+from collections import defaultdict
+from collections.abc import Iterable
+from importlib.resources import as_file
+from importlib.resources.abc import Traversable
+from typing import Self
+
+import numpy as np
+from nltk.tag.perceptron import PerceptronTagger
+
+from .._common import decode_strings, encode_strings
+
+
+class VectorisedPerceptronTagger:
+    """Averaged perceptron part of speech tagger with weights stored in NumPy arrays.
+
+    This uses the same features and model as NLTK's PerceptronTagger, but the weights
+    are stored as a sparse matrix in compressed sparse row format, with a row for each
+    feature and a column for each class. Each feature is interned to the index of its
+    row and the features that depend on the previous tags are looked up from tables
+    indexed by tag.
+
+    Sentences tagged together are decoded one token position at a time, across all
+    sentences, so the features of every sentence at a position are scored with a
+    single set of array operations.
+
+    The weights of each token's features are summed in the same order as NLTK, so the
+    scores are identical, including the rounding errors that decide between classes
+    whose scores only differ in the last decimal place. Ties between classes with the
+    same score are broken in the same way as NLTK, by selecting the class that sorts
+    last alphabetically. The tags are therefore the same as NLTK's.
+
+    Attributes
+    ----------
+    classes : list[str]
+        Classes predicted by the model, sorted in reverse alphabetical order.
+    tagdict : dict[str, str]
+        Dict of token:tag pairs that bypass the model.
+    """
+
+    START = ("-START-", "-START2-")
+    END = ("-END-", "-END2-")
+
+    def __init__(
+        self,
+        features: list[str],
+        classes: list[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        tagdict: dict[str, str],
+    ):
+        """Initialise.
+
+        Parameters
+        ----------
+        features : list[str]
+            Feature for each row of the weights matrix.
+        classes : list[str]
+            Class for each column of the weights matrix.
+        indptr : np.ndarray
+            Weights matrix index pointers. The weights of feature i are
+            weights[indptr[i]:indptr[i+1]].
+        indices : np.ndarray
+            Weights matrix column indices.
+        weights : np.ndarray
+            Weights matrix values.
+        tagdict : dict[str, str]
+            Dict of token:tag pairs that bypass the model.
+        """
+        self._features = features
+        self._feature_ids = {feature: i for i, feature in enumerate(features)}
+        self._indptr = indptr.astype(np.intp)
+        self._weights = weights.astype(np.float64, copy=False)
+
+        # Sort the classes in reverse order so that, for tied scores, argmax selects
+        # the class that sorts last. This matches the tie breaking used by NLTK.
+        self.classes = sorted(classes, reverse=True)
+        order = np.array([self.classes.index(c) for c in classes], dtype=np.intp)
+        self._indices = order[indices.astype(np.intp)]
+
+        self.tagdict = tagdict
+        self._build_tag_features()
+
+    def __repr__(self) -> str:
+        return (
+            f"VectorisedPerceptronTagger(features={len(self._features)}, "
+            f"classes={len(self.classes)})"
+        )
+
+    @classmethod
+    def from_perceptron(cls, tagger: PerceptronTagger) -> Self:
+        """Create from NLTK PerceptronTagger.
+
+        Parameters
+        ----------
+        tagger : PerceptronTagger
+            NLTK averaged perceptron tagger.
+
+        Returns
+        -------
+        Self
+        """
+        classes = sorted(tagger.classes)
+        class_ids = {c: i for i, c in enumerate(classes)}
+
+        features = list(tagger.model.weights.keys())
+        # Labels that are not classes can never be predicted, so are left out.
+        rows = [
+            [
+                (class_ids[label], weight)
+                for label, weight in w.items()
+                if label in class_ids
+            ]
+            for w in tagger.model.weights.values()
+        ]
+        indptr = np.zeros(len(features) + 1, dtype=np.intp)
+        np.cumsum([len(row) for row in rows], out=indptr[1:])
+        entries = np.array(
+            [entry for row in rows for entry in row], dtype=np.float64
+        ).reshape(-1, 2)
+        return cls(
+            features,
+            classes,
+            indptr,
+            entries[:, 0].astype(np.intp),
+            entries[:, 1],
+            dict(tagger.tagdict),
+        )
+
+    @classmethod
+    def load(cls, path: str | os.PathLike | Traversable) -> Self:
+        """Load from .npz file created by save.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | Traversable
+            Path to .npz file.
+
+        Returns
+        -------
+        Self
+        """
+        if not isinstance(path, str | os.PathLike):
+            with as_file(path) as p:
+                return cls.load(p)
+
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                decode_strings(data["features"]),
+                decode_strings(data["classes"]),
+                data["indptr"],
+                data["indices"],
+                data["weights"],
+                dict(
+                    zip(
+                        decode_strings(data["tagdict_tokens"]),
+                        decode_strings(data["tagdict_tags"]),
+                        strict=True,
+                    )
+                ),
+            )
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save to compressed .npz file.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path to save .npz file to.
+        """
+        np.savez_compressed(
+            path,
+            features=encode_strings(self._features),
+            classes=encode_strings(self.classes),
+            indptr=self._indptr.astype(np.uint32),
+            indices=self._indices.astype(
+                np.uint8 if len(self.classes) <= 256 else np.uint16
+            ),
+            weights=self._weights,
+            tagdict_tokens=encode_strings(self.tagdict.keys()),
+            tagdict_tags=encode_strings(self.tagdict.values()),
+        )
+
+    def with_tagdict(self, tagdict: dict[str, str]) -> Self:
+        """Return copy of tagger with a different tagdict.
+
+        The weights are shared with this tagger, which is not modified.
+
+        Parameters
+        ----------
+        tagdict : dict[str, str]
+            Dict of token:tag pairs that bypass the model.
+
+        Returns
+        -------
+        Self
+        """
+        tagger = copy.copy(self)
+        tagger.tagdict = tagdict
+        tagger._build_tag_features()
+        return tagger
+
+    def _build_tag_features(self) -> None:
+        """Look up the IDs of the features that depend on the previous tags.
+
+        The previous tags can be any class, any tag in the tagdict or the start
+        markers. Each tag is given an index into tables of the IDs of the "i-1 tag" and
+        "i-2 tag" features for that tag, and the "i tag+i-2 tag" feature for each pair
+        of tags. Features not in the model have an ID of -1.
+        """
+        tags = list(dict.fromkeys([*self.classes, *self.START, *self.tagdict.values()]))
+        self._tag_ids = {tag: i for i, tag in enumerate(tags)}
+
+        get = self._feature_ids.get
+        self._prev_feature_ids = [get(f"i-1 tag {prev}", -1) for prev in tags]
+        self._prev2_feature_ids = [get(f"i-2 tag {prev2}", -1) for prev2 in tags]
+        self._prev_prev2_feature_ids = [
+            [get(f"i tag+i-2 tag {prev} {prev2}", -1) for prev2 in tags]
+            for prev in tags
+        ]
+
+    def _scores(
+        self, rows: list[int], feature_ids: list[int], n_rows: int
+    ) -> np.ndarray:
+        """Calculate the score of each class from the features of each token.
+
+        The weights are accumulated in the order the features are given, so the
+        scores are identical to NLTK's when each token's features are given in the
+        same order as NLTK's features.
+
+        Parameters
+        ----------
+        rows : list[int]
+            Row of the scores array for each feature.
+        feature_ids : list[int]
+            Feature IDs.
+        n_rows : int
+            Number of rows in the scores array.
+
+        Returns
+        -------
+        np.ndarray
+            Scores, with a row for each of n_rows and a column for each class.
+        """
+        ids = np.array(feature_ids, dtype=np.intp)
+        starts = self._indptr[ids]
+        lengths = self._indptr[ids + 1] - starts
+        # Index into the weights array of each weight of each feature.
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        offsets += np.arange(offsets.size)
+
+        # np.bincount accumulates the weights in order, so each score is the sum of
+        # the weights in the order of the features.
+        n_classes = len(self.classes)
+        scores = np.bincount(
+            np.repeat(np.array(rows, dtype=np.intp) * n_classes, lengths)
+            + self._indices[offsets],
+            weights=self._weights[offsets],
+            minlength=n_rows * n_classes,
+        )
+        return scores.reshape(n_rows, n_classes)
+
+    @staticmethod
+    def normalize(word: str) -> str:
+        """Normalise word, in the same way as NLTK's PerceptronTagger.
+
+        Parameters
+        ----------
+        word : str
+            Word to normalise.
+
+        Returns
+        -------
+        str
+            Normalised word.
+        """
+        if "-" in word and word[0] != "-":
+            return "!HYPHEN"
+        if word.isdigit() and len(word) == 4:
+            return "!YEAR"
+        if word and word[0].isdigit():
+            return "!DIGITS"
+        return word.lower()
+
+    def tag(self, tokens: list[str]) -> list[tuple[str, str]]:
+        """Tag tokens with parts of speech.
+
+        Parameters
+        ----------
+        tokens : list[str]
+            List of tokens.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            List of (token, tag) pairs.
+        """
+        return self.tag_many([tokens])[0]
+
+    def tag_many(self, sentences: Iterable[list[str]]) -> list[list[tuple[str, str]]]:
+        """Tag tokens of multiple sentences with parts of speech.
+
+        Parameters
+        ----------
+        sentences : Iterable[list[str]]
+            List of tokens for each sentence.
+
+        Returns
+        -------
+        list[list[tuple[str, str]]]
+            List of (token, tag) pairs for each sentence.
+        """
+        sentences = [list(tokens) for tokens in sentences]
+        contexts = [
+            [*self.START, *(self.normalize(w) for w in tokens), *self.END]
+            for tokens in sentences
+        ]
+        # The tag of token i is tags[s][i + 2], after the start markers, so the
+        # previous two tags are always tags[s][i + 1] and tags[s][i].
+        tags: list[list[str | None]] = [
+            [*self.START[::-1], *(self.tagdict.get(w) or None for w in tokens)]
+            for tokens in sentences
+        ]
+
+        # Look up the features that do not depend on the previous tags, for every
+        # token not in the tagdict. Features not in the model are left out. The
+        # tokens at each position are grouped so they can be scored together.
+        get = self._feature_ids.get
+        bias = get("bias", -1)
+        positions: dict[int, list[tuple[int, list[int], int, list[int]]]] = defaultdict(
+            list
+        )
+        for s, (tokens, context) in enumerate(zip(sentences, contexts)):
+            for i, word in enumerate(tokens):
+                if tags[s][i + 2] is not None:
+                    continue
+                c = i + 2
+                before = [
+                    bias,
+                    get(f"i suffix {word[-3:]}", -1),
+                    get(f"i pref1 {word[0] if word else ''}", -1),
+                ]
+                after = [
+                    get(f"i-1 word {context[c - 1]}", -1),
+                    get(f"i-1 suffix {context[c - 1][-3:]}", -1),
+                    get(f"i-2 word {context[c - 2]}", -1),
+                    get(f"i+1 word {context[c + 1]}", -1),
+                    get(f"i+1 suffix {context[c + 1][-3:]}", -1),
+                    get(f"i+2 word {context[c + 2]}", -1),
+                ]
+                positions[i].append(
+                    (
+                        s,
+                        [f for f in before if f >= 0],
+                        get(f"i word {context[c]}", -1),
+                        [f for f in after if f >= 0],
+                    )
+                )
+
+        # Decode one token position at a time, because the remaining features depend
+        # on the tags predicted for the previous tokens.
+        tag_ids = self._tag_ids
+        prev_feature_ids = self._prev_feature_ids
+        prev2_feature_ids = self._prev2_feature_ids
+        prev_prev2_feature_ids = self._prev_prev2_feature_ids
+        for i in sorted(positions):
+            active = positions[i]
+            rows, feature_ids = [], []
+            for row, (s, before, word_id, after) in enumerate(active):
+                prev, prev2 = tags[s][i + 1], tags[s][i]
+                p, p2 = tag_ids[prev], tag_ids[prev2]
+                # Features in the same order as NLTK's PerceptronTagger._get_features.
+                ids = [
+                    *before,
+                    prev_feature_ids[p],
+                    prev2_feature_ids[p2],
+                    prev_prev2_feature_ids[p][p2],
+                    word_id,
+                    get(f"i-1 tag+i word {prev} {contexts[s][i + 2]}", -1),
+                ]
+                ids = [f for f in ids if f >= 0]
+                ids.extend(after)
+                rows.extend([row] * len(ids))
+                feature_ids.extend(ids)
+
+            best = self._scores(rows, feature_ids, len(active)).argmax(axis=1)
+            for (s, *_), b in zip(active, best.tolist()):
+                tags[s][i + 2] = self.classes[b]
+
+        return [
+            list(zip(tokens, sentence_tags[2:]))  # type: ignore
+            for tokens, sentence_tags in zip(sentences, tags)
+        ]
@@ -5,14 +5,16 @@ import string
 from fractions import Fraction
 from functools import lru_cache
 from itertools import chain
+from typing import TYPE_CHECKING
 
 import nltk.stem.porter as nsp
-import pint
-from nltk.tag import _get_tagger, _pos_tag
 
-from ingredient_parser.en._loaders import load_embeddings_model, load_ingredient_tagdict
+from ingredient_parser.en._loaders import (
+    load_embeddings_model,
+    load_ingredient_pos_tagger,
+)
 
-from .._common import UREG, consume, download_nltk_resources, is_float, is_range
+from .._common import UREG, consume, is_float, is_range
 from ..dataclasses import IngredientAmount
 from ._constants import (
     FLATTENED_UNITS_LIST,
@@ -26,6 +28,9 @@ from ._regex import (
     STRING_RANGE_PATTERN,
 )
 
+if TYPE_CHECKING:
+    import pint
+
 # Dict mapping certain units to their imperial version in pint
 IMPERIAL_UNITS = {
     "cup": "imperial_cup",
@@ -72,7 +77,6 @@ UNIT_REPLACEMENTS = [
     (re.compile(r"\b(Tb)\b"), "tablespoon"),
 ]
 
-download_nltk_resources()
 STEMMER = nsp.PorterStemmer()
 
 # Define regular expressions used by tokenizer.
@@ -144,10 +148,15 @@ def tokenize(sentence: str) -> list[str]:
 def pos_tag(tokens: list[str]) -> list[tuple[str, str]]:
     """Tag tokens with parts of speech.
 
-    This is a modification of NLTK's default part of speech tagging functionality which
-    extends the tagdict with additional, ingredient sentence specific entries.
-    The tagdict is a dict of token:tag pairs which bypass the part of speech tagging
-    model.
+    This uses the IngredientPOSTagger returned by load_ingredient_pos_tagger, which
+    wraps a VectorisedPerceptronTagger. This is an averaged perceptron tagger with the
+    same features and weights as NLTK's, stored in NumPy arrays, which gives the same
+    tags as NLTK's tagger. Its tagdict, a dict of token:tag pairs which bypass the part
+    of speech tagging model, is extended with ingredient sentence specific entries
+    once, when the tagger is loaded.
+
+    The tagger is loaded the first time this function is called. See find_pos_tagger
+    for where the tagger is loaded from.
 
     Parameters
     ----------
@@ -159,10 +168,7 @@ def pos_tag(tokens: list[str]) -> list[tuple[str, str]]:
     list[tuple[str, str]]
         List of (token, tag) pairs.
     """
-    tagger = _get_tagger("eng")
-    ingredient_tagdict = load_ingredient_tagdict()
-    tagger.tagdict.update(ingredient_tagdict)
-    return _pos_tag(tokens=tokens, tagset=None, tagger=tagger, lang="eng")
+    return load_ingredient_pos_tagger().tag(tokens)
 
 
 def combine_and_or(tokens: list[str]) -> list[str]:
@@ -258,7 +264,7 @@ def pluralise_units(sentence: str) -> str:
 
 
 @lru_cache(maxsize=512)
-def convert_to_pint_unit(unit: str, imperial_units: bool = False) -> str | pint.Unit:
+def convert_to_pint_unit(unit: str, imperial_units: bool = False) -> "str | pint.Unit":
     """Convert a unit to a pint.Unit object, if possible.
 
     If the unit is not found in the pint Unit Registry, just return the input unit.
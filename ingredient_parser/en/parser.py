@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
+import hashlib
 import logging
+from itertools import islice
 
+from .._cache import LRUCache, get_parse_cache
 from .._common import group_consecutive_idx
 from ..dataclasses import ParsedIngredient, ParserDebugInfo
-from ._loaders import load_parser_model
+from ._loaders import load_parser_model, load_parser_model_pool
 from ._utils import pluralise_units
 from .postprocess import PostProcessor
 from .preprocess import PreProcessor
@@ -12,6 +15,68 @@ from .preprocess import PreProcessor
 logger = logging.getLogger("ingredient-parser")
 
 
+class TagCache(LRUCache):
+    """Cache of labels and scores output by the parser model, keyed on a hash of the
+    sentence features.
+
+    Many sentences differ only in their numbers, which are all replaced by the same
+    token when calculating features, so they share an entry. When the cache is full,
+    the least recently used entry is evicted.
+
+    The cache is safe to use from multiple threads.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of entries in cache.
+    """
+
+    def __init__(self, maxsize: int = 16384):
+        """Initialise.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries in cache.
+            Default is 16384.
+        """
+        super().__init__(maxsize=maxsize)
+
+
+# Cache used by tag_sentence. Caching is disabled when this is None.
+_TAG_CACHE: TagCache | None = TagCache()
+
+
+def set_tag_cache(cache: TagCache | None) -> None:
+    """Set the cache used to store the labels and scores output by the parser model.
+
+    By default, an in-memory cache of 16384 entries is used.
+
+    Parameters
+    ----------
+    cache : TagCache | None
+        Cache to use. If None, caching is disabled.
+
+    Examples
+    --------
+    >>> from ingredient_parser import TagCache, set_tag_cache
+    >>> set_tag_cache(TagCache(maxsize=65536))
+    """
+    global _TAG_CACHE
+    _TAG_CACHE = cache
+
+
+def get_tag_cache() -> TagCache | None:
+    """Return the cache used to store the labels and scores output by the parser model.
+
+    Returns
+    -------
+    TagCache | None
+        Cache in use, or None if caching is disabled.
+    """
+    return _TAG_CACHE
+
+
 def parse_ingredient_en(
     sentence: str,
     separate_names: bool = True,
@@ -63,20 +128,196 @@ def parse_ingredient_en(
         ParsedIngredient object of structured data parsed from input string.
     """
     logger.debug(f'Parsing sentence "{sentence}" using "en" parser.')
-    TAGGER = load_parser_model()
+    cache = get_parse_cache()
+    if cache is not None:
+        cache_key = _parse_cache_key(
+            sentence,
+            separate_names=separate_names,
+            discard_isolated_stop_words=discard_isolated_stop_words,
+            expect_name_in_output=expect_name_in_output,
+            string_units=string_units,
+            imperial_units=imperial_units,
+            foundation_foods=foundation_foods,
+        )
+        if (cached := cache.get(cache_key)) is not None:
+            logger.debug("Returning parsed sentence from cache.")
+            return cached
+
+    postprocessed_sentence = _postprocess_sentence(
+        sentence,
+        separate_names=separate_names,
+        discard_isolated_stop_words=discard_isolated_stop_words,
+        expect_name_in_output=expect_name_in_output,
+        string_units=string_units,
+        imperial_units=imperial_units,
+        foundation_foods=foundation_foods,
+    )
+    parsed = postprocessed_sentence.parsed
+
+    if cache is not None:
+        cache.set(cache_key, parsed)
+
+    return parsed
+
 
+def parse_ingredients_en(
+    sentences: list[str],
+    separate_names: bool = True,
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    foundation_foods: bool = False,
+) -> list[ParsedIngredient]:
+    """Parse many English language ingredient sentences to return structured data.
+
+    This gives the same results as calling parse_ingredient_en for each sentence. If
+    foundation_foods is True, the foundation foods for the names in all sentences are
+    matched together once every sentence has been parsed, so names that appear in more
+    than one sentence are only matched once.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Ingredient sentences to parse.
+    separate_names : bool, optional
+        If True and the sentence contains multiple alternative ingredients, return an
+        IngredientText object for each ingredient name, otherwise return a single
+        IngredientText object.
+        Default is True.
+    discard_isolated_stop_words : bool, optional
+        If True, any isolated stop words in the name, preparation, or comment fields
+        are discarded.
+        Default is True.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label. Note that this does guarantee the output
+        contains a name.
+        Default is True.
+    string_units : bool, optional
+        If True, return all IngredientAmount units as strings.
+        If False, convert IngredientAmount units to pint.Unit objects where possible.
+        Default is False.
+    imperial_units : bool, optional
+        If True, use imperial units instead of US customary units for pint.Unit objects
+        for the the following units: fluid ounce, cup, pint, quart, gallon.
+        Default is False, which results in US customary units being used.
+        This has no effect if string_units=True.
+    foundation_foods : bool, optional
+        If True, extract foundation foods from ingredient name. Foundation foods are
+        the fundamental foods without any descriptive terms, e.g. 'cucumber' instead
+        of 'organic cucumber'.
+        Default is False.
+
+    Returns
+    -------
+    list[ParsedIngredient]
+        ParsedIngredient object of structured data for each sentence.
+    """
+    options = {
+        "separate_names": separate_names,
+        "discard_isolated_stop_words": discard_isolated_stop_words,
+        "expect_name_in_output": expect_name_in_output,
+        "string_units": string_units,
+        "imperial_units": imperial_units,
+    }
+    if not foundation_foods:
+        return [parse_ingredient_en(sentence, **options) for sentence in sentences]
+
+    cache = get_parse_cache()
+    parsed: list[ParsedIngredient] = []
+    # Index in parsed, parse cache key and the tokens of each name for each sentence
+    # that still needs its foundation foods matching.
+    pending: list[tuple[int, tuple, list[list[str]]]] = []
+    for sentence in sentences:
+        logger.debug(f'Parsing sentence "{sentence}" using "en" parser.')
+        cache_key = _parse_cache_key(sentence, **options, foundation_foods=True)
+        if cache is not None and (cached := cache.get(cache_key)) is not None:
+            logger.debug("Returning parsed sentence from cache.")
+            parsed.append(cached)
+            continue
+
+        postprocessed_sentence = _postprocess_sentence(
+            sentence, **options, foundation_foods=False
+        )
+        # The name tokens are only known once the sentence has been post-processed.
+        parsed_sentence = postprocessed_sentence.parsed
+        pending.append((len(parsed), cache_key, postprocessed_sentence.name_tokens))
+        parsed.append(parsed_sentence)
+
+    # Imported here so the foundation food matching code is only imported when
+    # foundation foods are used.
+    from ._foundationfoods import match_foundation_foods_batch
+
+    names = [tokens for *_, name_tokens in pending for tokens in name_tokens]
+    name_indices = [i for *_, name_tokens in pending for i in range(len(name_tokens))]
+    matches = iter(match_foundation_foods_batch(names, name_indices))
+    for idx, cache_key, name_tokens in pending:
+        parsed[idx].foundation_foods = [
+            ff for ff in islice(matches, len(name_tokens)) if ff is not None
+        ]
+        if cache is not None:
+            cache.set(cache_key, parsed[idx])
+
+    return parsed
+
+
+def _parse_cache_key(
+    sentence: str,
+    separate_names: bool = True,
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    foundation_foods: bool = False,
+) -> tuple:
+    """Return key for sentence and parsing options in the parse cache.
+
+    See parse_ingredient_en for a description of the parameters.
+
+    Returns
+    -------
+    tuple
+        Parse cache key.
+    """
+    return (
+        "en",
+        sentence,
+        separate_names,
+        discard_isolated_stop_words,
+        expect_name_in_output,
+        string_units,
+        imperial_units,
+        foundation_foods,
+    )
+
+
+def _postprocess_sentence(
+    sentence: str,
+    separate_names: bool = True,
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    foundation_foods: bool = False,
+) -> PostProcessor:
+    """Prepare, tag and return PostProcessor for an English language ingredient
+    sentence.
+
+    See parse_ingredient_en for a description of the parameters.
+
+    Returns
+    -------
+    PostProcessor
+        PostProcessor object for sentence.
+    """
     processed_sentence = PreProcessor(sentence)
     tokens = [t.text for t in processed_sentence.tokenized_sentence]
     pos_tags = [t.pos_tag for t in processed_sentence.tokenized_sentence]
     features = processed_sentence.sentence_features()
-    labels = TAGGER.tag(features)
-    scores = [TAGGER.marginal(label, i) for i, label in enumerate(labels)]
-    logger.debug(f"Sentence token labels: {labels}.")
 
-    if expect_name_in_output and all("NAME" not in label for label in labels):
-        # No tokens were assigned the NAME label, so guess if there's a name
-        logger.debug("No tokens found where name is most probable label.")
-        labels, scores = guess_ingredient_name(TAGGER, labels, scores)
+    labels, scores = tag_sentence(features, expect_name_in_output)
 
     # Re-pluralise tokens that were singularised if the label isn't UNIT
     # For tokens with UNIT label, we'll deal with them below
@@ -86,7 +327,7 @@ def parse_ingredient_en(
         if label != "UNIT":
             tokens[idx] = pluralise_units(token)
 
-    postprocessed_sentence = PostProcessor(
+    return PostProcessor(
         sentence,
         tokens,
         pos_tags,
@@ -98,9 +339,78 @@ def parse_ingredient_en(
         imperial_units=imperial_units,
         foundation_foods=foundation_foods,
     )
-    parsed = postprocessed_sentence.parsed
 
-    return parsed
+
+def dedupe_key_en(sentence: str) -> str:
+    """Return key used to identify duplicate sentences when parsing in bulk.
+
+    The key is the normalised sentence with consecutive whitespace collapsed. The
+    normalised sentence is split on whitespace during tokenisation, so sentences with
+    the same key have identical tokens and are parsed identically.
+
+    Parameters
+    ----------
+    sentence : str
+        Ingredient sentence.
+
+    Returns
+    -------
+    str
+        Key for sentence.
+    """
+    return " ".join(PreProcessor._normalise(sentence).split())
+
+
+def tag_sentence(
+    features: list[dict[str, str | bool]], expect_name_in_output: bool = True
+) -> tuple[list[str], list[float]]:
+    """Return labels and scores for sentence features using the parser model.
+
+    The labels and scores only depend on the features, so they are cached in the cache
+    set by set_tag_cache, using a hash of the features as the key. Sentences that only
+    differ in ways that do not change the features, for example "2 cups flour" and
+    "3 cups flour", reuse the cached labels and scores without running the parser model
+    again.
+
+    Parameters
+    ----------
+    features : list[dict[str, str | bool]]
+        List of feature dicts for each token in sentence.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label.
+        Default is True.
+
+    Returns
+    -------
+    tuple[list[str], list[float]]
+        Labels and scores for each token.
+    """
+    cache = _TAG_CACHE
+    digest = hashlib.blake2b(repr(features).encode("utf-8"), digest_size=16).digest()
+    cache_key = (digest, expect_name_in_output)
+    if cache is not None and (cached := cache.get(cache_key)) is not None:
+        logger.debug("Using cached labels and scores for sentence features.")
+        labels, scores = cached
+        return list(labels), list(scores)
+
+    # The Tagger keeps state between tagging and calculating marginals, so check out a
+    # Tagger for exclusive use until we have finished with the marginals.
+    with load_parser_model_pool().checkout() as TAGGER:
+        labels = TAGGER.tag(features)
+        scores = [TAGGER.marginal(label, i) for i, label in enumerate(labels)]
+        logger.debug(f"Sentence token labels: {labels}.")
+
+        if expect_name_in_output and all("NAME" not in label for label in labels):
+            # No tokens were assigned the NAME label, so guess if there's a name
+            logger.debug("No tokens found where name is most probable label.")
+            labels, scores = guess_ingredient_name(TAGGER, labels, scores)
+
+    if cache is not None:
+        # Store tuples so that modifying the returned lists cannot modify the cache.
+        cache.set(cache_key, (tuple(labels), tuple(scores)))
+    return labels, scores
 
 
 def inspect_parser_en(
@@ -9,8 +9,6 @@ from itertools import chain, pairwise
 from statistics import mean
 from typing import Any
 
-from ingredient_parser.en._foundationfoods import match_foundation_foods
-
 from .._common import consume, group_consecutive_idx
 from ..dataclasses import (
     CompositeIngredientAmount,
@@ -120,6 +118,9 @@ class PostProcessor:
     consumed : list[int]
         List of indices of tokens consumed as part of setting the APPROXIMATE and
         SINGULAR flags. These tokens should not end up in the parsed output.
+    name_tokens : list[list[str]]
+        List of tokens for each ingredient name, in the same order as the name field of
+        ParsedIngredient. This is populated when the name field is processed.
     """
 
     def __init__(
@@ -146,6 +147,7 @@ class PostProcessor:
         self.imperial_units = imperial_units
         self.foundation_foods = foundation_foods
         self.consumed = []
+        self.name_tokens = []
 
     def __repr__(self) -> str:
         """__repr__ method.
@@ -201,16 +203,17 @@ class PostProcessor:
             # Process NAME labels as any other label, but return as a list
             if processed_name := self._postprocess("NAME"):
                 name = [processed_name]
-                if self.foundation_foods:
-                    # Extract name tokens. We can only return a single foundation food,
-                    # but we still need to return a list.
-                    name_tokens = [
+                # Extract name tokens. We can only return a single foundation food,
+                # but we still need to return a list.
+                self.name_tokens = [
+                    [
                         token
                         for token, label in zip(self.tokens, self.labels)
                         if label == "NAME"
                     ]
-                    if ff := match_foundation_foods(name_tokens, 0):
-                        foundationfoods = [ff]
+                ]
+                if self.foundation_foods:
+                    foundationfoods = self._match_foundation_foods()
             else:
                 name = []
 
@@ -539,7 +542,7 @@ class PostProcessor:
 
         # Build IngredientText objects, merging duplicate names where found.
         names = []
-        foundation_foods = []
+        self.name_tokens = []
         for token_idx in merged_name_idx:
             ing_text = self._postprocess_indices(token_idx, "NAME")
             if not ing_text:
@@ -551,17 +554,37 @@ class PostProcessor:
                 names[dupe_idx[0]] = merged
             else:
                 names.append(ing_text)
+                # We don't keep the tokens of duplicate names because we will have
+                # already found any foundation food match for the first instance of
+                # the name.
+                self.name_tokens.append([self.tokens[i] for i in token_idx])
 
-                if self.foundation_foods:
-                    # We don't match foundation foods for duplicate names because we
-                    # will have already found any match for the first instance of the
-                    # name.
-                    tokens = [self.tokens[i] for i in token_idx]
-                    if ff := match_foundation_foods(tokens, len(names) - 1):
-                        foundation_foods.append(ff)
+        foundation_foods = []
+        if self.foundation_foods:
+            foundation_foods = self._match_foundation_foods()
 
         return names, foundation_foods
 
+    def _match_foundation_foods(self) -> list[FoundationFood]:
+        """Match foundation foods for each ingredient name in name_tokens.
+
+        All names are matched together, so names that are the same after normalisation
+        are only matched once.
+
+        Returns
+        -------
+        list[FoundationFood]
+            List of matching foundation foods. Names without a match are skipped.
+        """
+        # Imported here so the foundation food matching code is only imported when
+        # foundation foods are used.
+        from ._foundationfoods import match_foundation_foods_batch
+
+        matches = match_foundation_foods_batch(
+            self.name_tokens, list(range(len(self.name_tokens)))
+        )
+        return [ff for ff in matches if ff is not None]
+
     def _last_non_punc_token_pos(self, token_idx: list[int]) -> str:
         """Return the POS tag at the last index in token_idx.
 
@@ -155,7 +155,8 @@ class PreProcessor:
         ]
         return "\n".join(_str)
 
-    def _normalise(self, sentence: str) -> str:
+    @classmethod
+    def _normalise(cls, sentence: str) -> str:
         """Normalise sentence prior to feature extraction.
 
         Parameters
@@ -171,18 +172,18 @@ class PreProcessor:
         # List of functions to apply to sentence
         # Note that the order matters
         funcs = [
-            self._remove_price_annotations,
-            self._replace_en_em_dash,
-            self._replace_html_fractions,
-            self._replace_unicode_fractions,
+            cls._remove_price_annotations,
+            cls._replace_en_em_dash,
+            cls._replace_html_fractions,
+            cls._replace_unicode_fractions,
             combine_quantities_split_by_and,
-            self._identify_fractions,
-            self._split_quantity_and_units,
-            self._remove_unit_trailing_period,
+            cls._identify_fractions,
+            cls._split_quantity_and_units,
+            cls._remove_unit_trailing_period,
             replace_string_range,
-            self._replace_dupe_units_ranges,
-            self._merge_quantity_x,
-            self._collapse_ranges,
+            cls._replace_dupe_units_ranges,
+            cls._merge_quantity_x,
+            cls._collapse_ranges,
         ]
 
         for func in funcs:
@@ -191,7 +192,8 @@ class PreProcessor:
 
         return sentence.strip()
 
-    def _remove_price_annotations(self, sentence: str) -> str:
+    @staticmethod
+    def _remove_price_annotations(sentence: str) -> str:
         """Remove price annotations like ($0.20), (£1.50), etc. from the sentence.
 
         Allows whitespace to occur after openining parenthesis, after currency symbol
@@ -209,7 +211,8 @@ class PreProcessor:
         """
         return CURRENCY_PATTERN.sub("", sentence)
 
-    def _replace_en_em_dash(self, sentence: str) -> str:
+    @staticmethod
+    def _replace_en_em_dash(sentence: str) -> str:
         """Replace en-dashes and em-dashes with hyphens.
 
         Parameters
@@ -234,7 +237,8 @@ class PreProcessor:
         """
         return sentence.replace("–", "-").replace("—", " - ")
 
-    def _replace_html_fractions(self, sentence: str) -> str:
+    @staticmethod
+    def _replace_html_fractions(sentence: str) -> str:
         """Replace html fractions e.g. &frac12; with unicode equivalents.
 
         Parameters
@@ -255,7 +259,8 @@ class PreProcessor:
         """
         return unescape(sentence)
 
-    def _identify_fractions(self, sentence: str) -> str:
+    @staticmethod
+    def _identify_fractions(sentence: str) -> str:
         """Identify and modify fractions so that they do not get split by the tokenizer.
 
         This looks for fractions with the format of 1/2, 1/4, 1 1/2 etc. and replaces
@@ -315,7 +320,8 @@ class PreProcessor:
 
         return sentence
 
-    def _replace_unicode_fractions(self, sentence: str) -> str:
+    @staticmethod
+    def _replace_unicode_fractions(sentence: str) -> str:
         """Replace unicode fractions with a 'fake' ascii equivalent.
 
         The ascii equivalent is used because the replace_fake_fractions function can
@@ -350,7 +356,8 @@ class PreProcessor:
 
         return sentence
 
-    def _split_quantity_and_units(self, sentence: str) -> str:
+    @staticmethod
+    def _split_quantity_and_units(sentence: str) -> str:
         """Insert space between quantity and unit.
 
         This currently finds any instances of a number followed directly by a letter
@@ -390,7 +397,8 @@ class PreProcessor:
         sentence = UNITS_HYPHEN_QUANTITY_PATTERN.sub(r"\1 - \2", sentence)
         return STRING_QUANTITY_HYPHEN_PATTERN.sub(r"\1 \2", sentence)
 
-    def _remove_unit_trailing_period(self, sentence: str) -> str:
+    @staticmethod
+    def _remove_unit_trailing_period(sentence: str) -> str:
         """Remove trailing periods from units e.g. tsp. -> tsp.
 
         Parameters
@@ -431,7 +439,8 @@ class PreProcessor:
 
         return sentence
 
-    def _replace_dupe_units_ranges(self, sentence: str) -> str:
+    @staticmethod
+    def _replace_dupe_units_ranges(sentence: str) -> str:
         """Replace ranges where the unit appears twice with standard range then unit.
 
         This assumes that the _split_quantity_and_units has already been run on
@@ -480,7 +489,8 @@ class PreProcessor:
 
         return sentence
 
-    def _merge_quantity_x(self, sentence: str) -> str:
+    @staticmethod
+    def _merge_quantity_x(sentence: str) -> str:
         """Merge any quantity followed by "x" into a single token.
 
         Parameters
@@ -505,7 +515,8 @@ class PreProcessor:
         """
         return QUANTITY_X_PATTERN.sub(r"\1x ", sentence)
 
-    def _collapse_ranges(self, sentence: str) -> str:
+    @staticmethod
+    def _collapse_ranges(sentence: str) -> str:
         """Collapse any whites pace found in a range so the range has the standard form.
 
         Parameters
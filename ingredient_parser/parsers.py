@@ -1,9 +1,42 @@
 #!/usr/bin/env python3
 
-from ingredient_parser.en import inspect_parser_en, parse_ingredient_en
+import asyncio
+import copy
+import os
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+
+from ingredient_parser.en import (
+    dedupe_key_en,
+    inspect_parser_en,
+    parse_ingredient_en,
+    parse_ingredients_en,
+)
+from ingredient_parser.en._loaders import aload_models, load_models
 
 from . import SUPPORTED_LANGUAGES
-from .dataclasses import ParsedIngredient, ParserDebugInfo
+from ._cache import get_parse_cache
+from ._parallel import (
+    STREAM_CHUNKSIZE,
+    initialise_worker,
+    parallel_map,
+    rebind_units,
+    stream_map,
+)
+from .dataclasses import (
+    ParsedIngredient,
+    ParsedIngredientList,
+    ParserDebugInfo,
+    WarmupReport,
+)
 
 
 def parse_ingredient(
@@ -87,14 +120,28 @@ def parse_multiple_ingredients(
     string_units: bool = False,
     imperial_units: bool = False,
     foundation_foods: bool = False,
-) -> list[ParsedIngredient]:
+    workers: int | None = None,
+    executor: Executor | None = None,
+    dedupe: bool = False,
+) -> ParsedIngredientList:
     """Parse multiple ingredient sentences in one go.
 
     This function accepts a list of sentences, with element of the list representing
     one ingredient sentence.
-    A list of dictionaries is returned, with optional confidence values.
-    This function is a simple for-loop that iterates through each element of the
-    input list.
+    A list of ParsedIngredient objects is returned, in the same order as the input
+    sentences.
+
+    If ``dedupe`` is True, sentences that are identical after normalisation, ignoring
+    differences in whitespace, are only parsed once. Each duplicate is given its own
+    copy of the result, with the ``sentence`` field set to the duplicate sentence. The
+    fraction of sentences that were duplicates is available from the ``dedupe_ratio``
+    attribute of the returned list.
+
+    By default, the sentences are parsed one after another in the calling process.
+    If ``workers`` or ``executor`` is given, the sentences are split into chunks and
+    parsed in parallel across a pool of processes. Each worker process loads the models
+    once when it starts. Batches that are too small to benefit from a pool are still
+    parsed in the calling process.
 
     Parameters
     ----------
@@ -132,25 +179,318 @@ def parse_multiple_ingredients(
         the fundamental foods without any descriptive terms, e.g. 'cucumber' instead
         of 'organic cucumber'.
         Default is False.
+    workers : int | None, optional
+        Number of worker processes to parse the sentences with.
+        If 0, use one worker process per CPU.
+        Default is None, which parses the sentences in the calling process.
+    executor : Executor | None, optional
+        Existing executor to parse the sentences with, e.g. a ProcessPoolExecutor that
+        is reused between calls. The executor is not shut down after use.
+        Default is None.
+    dedupe : bool, optional
+        If True, only parse each unique sentence once.
+        Default is False.
 
     Returns
     -------
-    list[ParsedIngredient]
+    ParsedIngredientList
         List of ParsedIngredient objects of structured data parsed from input sentences.
     """
-    return [
-        parse_ingredient(
-            sentence,
+    if dedupe:
+        unique_sentences, positions = _dedupe_sentences(sentences, lang)
+    else:
+        unique_sentences, positions = sentences, []
+
+    kwargs = {
+        "separate_names": separate_names,
+        "discard_isolated_stop_words": discard_isolated_stop_words,
+        "expect_name_in_output": expect_name_in_output,
+        "string_units": string_units,
+        "imperial_units": imperial_units,
+        "foundation_foods": foundation_foods,
+    }
+    if workers is not None or executor is not None:
+        parsed = parallel_map(
+            parse_ingredient,
+            _parse_sequential,
+            unique_sentences,
             lang=lang,
-            separate_names=separate_names,
-            discard_isolated_stop_words=discard_isolated_stop_words,
-            expect_name_in_output=expect_name_in_output,
-            string_units=string_units,
-            imperial_units=imperial_units,
-            foundation_foods=foundation_foods,
+            workers=workers,
+            executor=executor,
+            **kwargs,
+        )
+    else:
+        parsed = _parse_sequential(unique_sentences, lang, **kwargs)
+
+    if not dedupe:
+        return ParsedIngredientList(parsed)
+
+    return ParsedIngredientList(
+        _fan_out(parsed, sentences, positions),
+        unique_sentences=len(unique_sentences),
+    )
+
+
+def _parse_sequential(
+    sentences: list[str], lang: str, **kwargs
+) -> list[ParsedIngredient]:
+    """Parse sentences one after another in the calling process.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Sentences to parse.
+    lang : str
+        Language of sentences.
+    **kwargs
+        Keyword arguments passed to the parser for lang.
+
+    Returns
+    -------
+    list[ParsedIngredient]
+        ParsedIngredient object for each sentence.
+
+    Raises
+    ------
+    ValueError
+        Raised if lang is not supported.
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    match lang:
+        case "en":
+            return parse_ingredients_en(sentences, **kwargs)
+        case _:
+            raise ValueError(f'Unrecognised value "{lang}"')
+
+
+def _dedupe_sentences(
+    sentences: Iterable[str], lang: str
+) -> tuple[list[str], list[int]]:
+    """Remove duplicate sentences.
+
+    Sentences are duplicates if they are identical after normalisation, ignoring
+    differences in whitespace. The first occurrence of each sentence is kept.
+
+    Parameters
+    ----------
+    sentences : Iterable[str]
+        Sentences to dedupe.
+    lang : str
+        Language of sentences.
+
+    Returns
+    -------
+    tuple[list[str], list[int]]
+        List of unique sentences, and the index in this list of the unique sentence
+        for each input sentence.
+
+    Raises
+    ------
+    ValueError
+        Raised if lang is not supported.
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    match lang:
+        case "en":
+            dedupe_key = dedupe_key_en
+        case _:
+            raise ValueError(f'Unrecognised value "{lang}"')
+
+    unique_sentences = []
+    positions = []
+    unique_indices: dict[str, int] = {}
+    for sentence in sentences:
+        key = dedupe_key(sentence)
+        if key not in unique_indices:
+            unique_indices[key] = len(unique_sentences)
+            unique_sentences.append(sentence)
+        positions.append(unique_indices[key])
+
+    return unique_sentences, positions
+
+
+def _fan_out(
+    parsed: list[ParsedIngredient], sentences: Iterable[str], positions: list[int]
+) -> Iterator[ParsedIngredient]:
+    """Yield parsed result for each sentence from the parsed unique sentences.
+
+    The first occurrence of each unique sentence is given the parsed object itself.
+    Every other occurrence is given a copy, with the sentence field set to the
+    occurrence's own sentence.
+
+    Parameters
+    ----------
+    parsed : list[ParsedIngredient]
+        ParsedIngredient objects for unique sentences.
+    sentences : Iterable[str]
+        All sentences, including duplicates.
+    positions : list[int]
+        Index in parsed of the result for each sentence.
+
+    Yields
+    ------
+    ParsedIngredient
+        ParsedIngredient object for each sentence.
+    """
+    used = [False] * len(parsed)
+    for sentence, position in zip(sentences, positions):
+        if used[position]:
+            duplicate = copy.deepcopy(parsed[position])
+            duplicate.sentence = sentence
+            yield duplicate
+        else:
+            used[position] = True
+            yield parsed[position]
+
+
+def iter_parse(
+    sentences: Iterable[str],
+    lang: str = "en",
+    separate_names: bool = True,
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    foundation_foods: bool = False,
+    threads: int = 0,
+    workers: int | None = None,
+    ordered: bool = True,
+) -> Iterator[tuple[int, ParsedIngredient]]:
+    """Lazily parse ingredient sentences from an iterable.
+
+    The sentences are read from the iterable only as they are needed, so memory use is
+    bounded regardless of the number of sentences. This makes it suitable for parsing
+    sentences read from a file object, one sentence per line.
+
+    Trailing newline characters are removed from each sentence. Blank lines are skipped,
+    but are still counted in the line numbers.
+
+    Each result is yielded as a tuple of the line number of the sentence in the input,
+    starting from 1, and the ParsedIngredient object. If parsing a sentence raises an
+    exception, the line number is added to the exception as a note.
+
+    Parameters
+    ----------
+    sentences : Iterable[str]
+        Iterable of sentences to parse, e.g. a list or file object.
+    lang : str
+        Language of sentence.
+        Currently supported options are: en.
+    separate_names : bool, optional
+        If True and the sentence contains multiple alternative ingredients, return an
+        IngredientText object for each ingredient name, otherwise return a single
+        IngredientText object.
+        Default is True.
+    discard_isolated_stop_words : bool, optional
+        If True, any isolated stop words in the name, preparation, or comment fields
+        are discarded.
+        Default is True.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label. Note that this does guarantee the output
+        contains a name.
+        Default is True.
+    string_units : bool
+        If True, return all IngredientAmount units as strings.
+        If False, convert IngredientAmount units to pint.Unit objects where possible.
+        Default is False.
+    imperial_units : bool
+        If True, use imperial units instead of US customary units for pint.Unit objects
+        for the the following units: fluid ounce, cup, pint, quart, gallon.
+        Default is False, which results in US customary units being used.
+        This has no effect if string_units=True.
+    foundation_foods : bool, optional
+        If True, extract foundation foods from ingredient name. Foundation foods are
+        the fundamental foods without any descriptive terms, e.g. 'cucumber' instead
+        of 'organic cucumber'.
+        Default is False.
+    threads : int, optional
+        If greater than 0, parse sentences in a pool of this many threads so the
+        preprocessing, tagging and postprocessing of consecutive sentences overlap.
+        No more than four sentences per thread are read ahead of the sentence being
+        yielded.
+        Default is 0, which parses each sentence in the calling thread.
+    workers : int | None, optional
+        Number of worker processes to parse the sentences with. Sentences are sent to
+        the workers in small batches, with no more than four batches per worker read
+        ahead of the sentence being yielded. If 0, use one worker process per CPU.
+        Takes precedence over threads.
+        Default is None, which does not use worker processes.
+    ordered : bool, optional
+        If True, yield results in the same order as the input sentences. If False,
+        yield results as soon as they are available, which avoids waiting for slow
+        sentences when parsing in threads or worker processes. Use the line number to
+        identify the input sentence for each result.
+        Default is True.
+
+    Yields
+    ------
+    tuple[int, ParsedIngredient]
+        Line number of sentence and ParsedIngredient object for sentence.
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    parse = partial(
+        parse_ingredient,
+        lang=lang,
+        separate_names=separate_names,
+        discard_isolated_stop_words=discard_isolated_stop_words,
+        expect_name_in_output=expect_name_in_output,
+        string_units=string_units,
+        imperial_units=imperial_units,
+        foundation_foods=foundation_foods,
+    )
+
+    numbered_sentences = (
+        (line_number, sentence.rstrip("\r\n"))
+        for line_number, sentence in enumerate(sentences, start=1)
+    )
+    numbered_sentences = (
+        (line_number, sentence)
+        for line_number, sentence in numbered_sentences
+        if sentence.strip()
+    )
+
+    if threads < 1 and workers is None:
+        for line_number, sentence in numbered_sentences:
+            try:
+                parsed = parse(sentence)
+            except Exception as e:
+                e.add_note(f"Raised whilst parsing line {line_number}: {sentence!r}")
+                raise
+            yield line_number, parsed
+        return
+
+    if workers is not None:
+        n_workers = workers if workers > 0 else os.cpu_count() or 1
+        executor: Executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=initialise_worker,
+            initargs=(lang, foundation_foods, get_parse_cache()),
+        )
+        chunksize = STREAM_CHUNKSIZE
+    else:
+        n_workers = threads
+        executor = ThreadPoolExecutor(max_workers=threads)
+        chunksize = 1
+
+    try:
+        yield from stream_map(
+            parse,
+            numbered_sentences,
+            executor,
+            chunksize=chunksize,
+            max_pending=4 * n_workers,
+            ordered=ordered,
         )
-        for sentence in sentences
-    ]
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
 def inspect_parser(
@@ -224,3 +564,294 @@ def inspect_parser(
             )
         case _:
             raise ValueError(f'Unrecognised value "{lang}"')
+
+
+async def aparse_ingredient(
+    sentence: str,
+    lang: str = "en",
+    separate_names: bool = True,
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    foundation_foods: bool = False,
+    executor: Executor | None = None,
+) -> ParsedIngredient:
+    """Parse an ingredient sentence without blocking the event loop.
+
+    The sentence is parsed in an executor. If the models have not been loaded yet, they
+    are loaded first. Concurrent calls wait for the same load to complete instead of
+    each loading the models.
+
+    Parameters
+    ----------
+    sentence : str
+        Ingredient sentence to parse.
+    lang : str
+        Language of sentence.
+        Currently supported options are: en.
+    separate_names : bool, optional
+        If True and the sentence contains multiple alternative ingredients, return an
+        IngredientText object for each ingredient name, otherwise return a single
+        IngredientText object.
+        Default is True.
+    discard_isolated_stop_words : bool, optional
+        If True, any isolated stop words in the name, preparation, or comment fields
+        are discarded.
+        Default is True.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label. Note that this does guarantee the output
+        contains a name.
+        Default is True.
+    string_units : bool
+        If True, return all IngredientAmount units as strings.
+        If False, convert IngredientAmount units to pint.Unit objects where possible.
+        Default is False.
+    imperial_units : bool
+        If True, use imperial units instead of US customary units for pint.Unit objects
+        for the the following units: fluid ounce, cup, pint, quart, gallon.
+        Default is False, which results in US customary units being used.
+        This has no effect if string_units=True.
+    foundation_foods : bool, optional
+        If True, extract foundation foods from ingredient name. Foundation foods are
+        the fundamental foods without any descriptive terms, e.g. 'cucumber' instead
+        of 'organic cucumber'.
+        Default is False.
+    executor : Executor | None, optional
+        Executor to parse the sentence in.
+        Default is None, which uses the event loop's default executor.
+
+    Returns
+    -------
+    ParsedIngredient
+        ParsedIngredient object of structured data parsed from input string.
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    if not isinstance(executor, ProcessPoolExecutor):
+        # Models only need loading in this process if parsing happens in this process.
+        await aload_models(foundation_foods=foundation_foods, executor=executor)
+
+    loop = asyncio.get_running_loop()
+    parsed = await loop.run_in_executor(
+        executor,
+        partial(
+            parse_ingredient,
+            sentence,
+            lang=lang,
+            separate_names=separate_names,
+            discard_isolated_stop_words=discard_isolated_stop_words,
+            expect_name_in_output=expect_name_in_output,
+            string_units=string_units,
+            imperial_units=imperial_units,
+            foundation_foods=foundation_foods,
+        ),
+    )
+
+    if isinstance(executor, ProcessPoolExecutor):
+        return rebind_units(parsed)
+
+    return parsed
+
+
+async def aparse_many(
+    sentences: Iterable[str],
+    lang: str = "en",
+    separate_names: bool = True,
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    foundation_foods: bool = False,
+    executor: Executor | None = None,
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[tuple[int, ParsedIngredient]]:
+    """Parse multiple ingredient sentences without blocking the event loop.
+
+    Sentences are parsed in an executor, with no more than ``concurrency`` sentences
+    being parsed at any one time. The sentences are read from the iterable as required,
+    so the iterable can be arbitrarily long.
+
+    Each result is yielded as a tuple of the index of the sentence in the input and
+    the ParsedIngredient object.
+
+    Parameters
+    ----------
+    sentences : Iterable[str]
+        Iterable of sentences to parse.
+    lang : str
+        Language of sentence.
+        Currently supported options are: en.
+    separate_names : bool, optional
+        If True and the sentence contains multiple alternative ingredients, return an
+        IngredientText object for each ingredient name, otherwise return a single
+        IngredientText object.
+        Default is True.
+    discard_isolated_stop_words : bool, optional
+        If True, any isolated stop words in the name, preparation, or comment fields
+        are discarded.
+        Default is True.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label. Note that this does guarantee the output
+        contains a name.
+        Default is True.
+    string_units : bool
+        If True, return all IngredientAmount units as strings.
+        If False, convert IngredientAmount units to pint.Unit objects where possible.
+        Default is False.
+    imperial_units : bool
+        If True, use imperial units instead of US customary units for pint.Unit objects
+        for the the following units: fluid ounce, cup, pint, quart, gallon.
+        Default is False, which results in US customary units being used.
+        This has no effect if string_units=True.
+    foundation_foods : bool, optional
+        If True, extract foundation foods from ingredient name. Foundation foods are
+        the fundamental foods without any descriptive terms, e.g. 'cucumber' instead
+        of 'organic cucumber'.
+        Default is False.
+    executor : Executor | None, optional
+        Executor to parse the sentences in.
+        Default is None, which uses the event loop's default executor.
+    concurrency : int, optional
+        Maximum number of sentences to parse concurrently.
+        Default is 8.
+    ordered : bool, optional
+        If True, yield results in the same order as the input sentences.
+        If False, yield results as soon as they are parsed.
+        Default is True.
+
+    Yields
+    ------
+    tuple[int, ParsedIngredient]
+        Index of sentence in input and ParsedIngredient object for sentence.
+
+    Raises
+    ------
+    ValueError
+        Raised if concurrency is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    parse = partial(
+        aparse_ingredient,
+        lang=lang,
+        separate_names=separate_names,
+        discard_isolated_stop_words=discard_isolated_stop_words,
+        expect_name_in_output=expect_name_in_output,
+        string_units=string_units,
+        imperial_units=imperial_units,
+        foundation_foods=foundation_foods,
+        executor=executor,
+    )
+
+    async def _parse(idx: int, sentence: str) -> tuple[int, ParsedIngredient]:
+        return idx, await parse(sentence)
+
+    isentences = enumerate(sentences)
+    pending: deque[asyncio.Task] = deque()
+
+    def _fill() -> None:
+        """Start tasks for the next sentences until concurrency limit is reached."""
+        while len(pending) < concurrency:
+            try:
+                idx, sentence = next(isentences)
+            except StopIteration:
+                return
+            pending.append(asyncio.ensure_future(_parse(idx, sentence)))
+
+    try:
+        _fill()
+        while pending:
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.remove(task)
+                for task in done:
+                    yield task.result()
+            _fill()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def warmup(
+    lang: str = "en",
+    string_units: bool = False,
+    foundation_foods: bool = False,
+    background: bool = False,
+) -> WarmupReport | Future[WarmupReport]:
+    """Load all resources used for parsing sentences.
+
+    Resources are otherwise loaded the first time they are needed, which makes the
+    first sentence parsed much slower than the rest. Calling this function when an
+    application starts moves that time out of the first request.
+
+    Parameters
+    ----------
+    lang : str
+        Language of sentences that will be parsed.
+        Currently supported options are: en.
+    string_units : bool
+        Set to the value that will be used when parsing. If False, the pint unit
+        registry is also created.
+        Default is False.
+    foundation_foods : bool, optional
+        If True, also load the resources used to extract foundation foods, which take
+        considerably longer to load than the other resources.
+        Default is False.
+    background : bool, optional
+        If True, load the resources in a background thread and return immediately with
+        a Future, which can be polled with Future.done() to check if loading has
+        finished.
+        Default is False.
+
+    Returns
+    -------
+    WarmupReport | Future[WarmupReport]
+        Time taken to load each resource. If background is True, a Future that
+        resolves to the WarmupReport once loading has finished.
+
+    Raises
+    ------
+    ValueError
+        Raised if lang is not supported.
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    def load() -> WarmupReport:
+        match lang:
+            case "en":
+                timings = load_models(
+                    foundation_foods=foundation_foods, unit_registry=not string_units
+                )
+            case _:
+                raise ValueError(f'Unrecognised value "{lang}"')
+
+        return WarmupReport(timings)
+
+    if not background:
+        return load()
+
+    future: Future[WarmupReport] = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(load())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="ingredient-parser-warmup", daemon=True).start()
+    return future
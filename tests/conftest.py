@@ -0,0 +1,11 @@
+import pytest
+
+from ingredient_parser._common import CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Set the cache directory to a temporary directory, so running the tests does not
+    write files to the user's cache directory."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    return tmp_path / "cache"
@@ -0,0 +1,177 @@
+import numpy as np
+import pytest
+
+from ingredient_parser import get_foundation_food_cache, set_fdc_ann_index
+from ingredient_parser.en._ann import IVFIndex
+from ingredient_parser.en._foundationfoods import (
+    get_usif_matcher,
+    match_foundation_foods_batch,
+)
+
+NAMES = [
+    ["red", "onion"],
+    ["chicken", "breast"],
+    ["brown", "sugar"],
+    ["chop", "tomato"],
+    ["sour", "cream"],
+]
+
+
+@pytest.fixture
+def ann_index():
+    """Set IVF index on the uSIF matcher for the duration of a test."""
+    matcher = get_usif_matcher()
+    index = IVFIndex.build(matcher.fdc_unit_vectors, n_lists=32)
+    matcher.set_ann_index(index)
+    yield index
+    matcher.set_ann_index(None)
+
+
+class Test_IVFIndex:
+    def test_build(self):
+        """
+        Test that every vector is in exactly one list.
+        """
+        vectors = get_usif_matcher().fdc_unit_vectors
+        index = IVFIndex.build(vectors, n_lists=32)
+
+        assert index.n_lists == 32
+        assert index.list_offsets[-1] == len(vectors)
+        assert sorted(index.list_ids.tolist()) == list(range(len(vectors)))
+        assert np.allclose(np.linalg.norm(index.centroids, axis=1), 1)
+
+    def test_build_deterministic(self):
+        """
+        Test that building the index with the same seed gives the same index.
+        """
+        vectors = get_usif_matcher().fdc_unit_vectors
+        index1 = IVFIndex.build(vectors, n_lists=32, seed=1)
+        index2 = IVFIndex.build(vectors, n_lists=32, seed=1)
+        assert np.array_equal(index1.list_ids, index2.list_ids)
+
+    def test_build_empty(self):
+        """
+        Test that a ValueError is raised if there are no vectors.
+        """
+        with pytest.raises(ValueError, match="without any vectors"):
+            IVFIndex.build(np.zeros((0, 25)))
+
+    def test_save_load(self, tmp_path):
+        """
+        Test that a saved index is the same when loaded.
+        """
+        index = IVFIndex.build(get_usif_matcher().fdc_unit_vectors, n_lists=32)
+        index.save(tmp_path / "index.npz")
+        loaded = IVFIndex.load(tmp_path / "index.npz", n_probe=4)
+
+        assert loaded.n_probe == 4
+        assert np.array_equal(loaded.centroids, index.centroids)
+        assert np.array_equal(loaded.list_offsets, index.list_offsets)
+        assert np.array_equal(loaded.list_ids, index.list_ids)
+
+    def test_search_minimum_size(self):
+        """
+        Test that enough lists are searched to return n vectors, even if n_probe lists
+        contain fewer.
+        """
+        vectors = get_usif_matcher().fdc_unit_vectors
+        index = IVFIndex.build(vectors, n_lists=32, n_probe=1)
+        ids = index.search(vectors[0], 2000)
+
+        assert len(ids) >= 2000
+        assert np.array_equal(ids, np.sort(ids))
+
+    def test_search_all_lists(self):
+        """
+        Test that every vector is returned if every list is searched.
+        """
+        vectors = get_usif_matcher().fdc_unit_vectors
+        index = IVFIndex.build(vectors, n_lists=32, n_probe=32)
+        assert np.array_equal(index.search(vectors[0], 50), np.arange(len(vectors)))
+
+
+class Test_uSIF_ann_index:
+    def test_exact_when_all_lists_searched(self, ann_index):
+        """
+        Test that the candidate matches are the same as the exact search when every
+        list is searched.
+        """
+        matcher = get_usif_matcher()
+        ann_index.n_probe = ann_index.n_lists
+        approx = matcher.find_candidate_matches_batch(NAMES, n=50)
+
+        matcher.set_ann_index(None)
+        exact = matcher.find_candidate_matches_batch(NAMES, n=50)
+        assert approx == exact
+
+    def test_recall(self, ann_index):
+        """
+        Test that most of the exact best candidates are found with the default n_probe.
+        """
+        matcher = get_usif_matcher()
+        approx = matcher.find_candidate_matches_batch(NAMES, n=50)
+
+        matcher.set_ann_index(None)
+        exact = matcher.find_candidate_matches_batch(NAMES, n=50)
+        for a, e in zip(approx, exact):
+            found = {m.fdc.fdc_id for m in a} & {m.fdc.fdc_id for m in e}
+            assert len(found) >= 0.8 * len(e)
+
+    def test_batch_same_as_single(self, ann_index):
+        """
+        Test that the candidate matches for each name are the same in a batch as on
+        their own.
+        """
+        matcher = get_usif_matcher()
+        batch = matcher.find_candidate_matches_batch(NAMES, n=50)
+        for tokens, matches in zip(NAMES, batch):
+            assert matches == matcher.find_candidate_matches(tokens, n=50)
+
+    def test_wrong_size(self):
+        """
+        Test that a ValueError is raised if the index is not of the FDC ingredients.
+        """
+        vectors = get_usif_matcher().fdc_unit_vectors[:100]
+        with pytest.raises(ValueError, match="FDC ingredients"):
+            get_usif_matcher().set_ann_index(IVFIndex.build(vectors))
+
+
+class Test_set_fdc_ann_index:
+    def test_load_from_path(self, tmp_path):
+        """
+        Test that the index is loaded from the path with the given n_probe and set on
+        the uSIF matcher.
+        """
+        matcher = get_usif_matcher()
+        IVFIndex.build(matcher.fdc_unit_vectors, n_lists=32).save(tmp_path / "ann.npz")
+        try:
+            set_fdc_ann_index(tmp_path / "ann.npz", n_probe=4)
+            assert matcher.ann_index is not None
+            assert matcher.ann_index.n_lists == 32
+            assert matcher.ann_index.n_probe == 4
+        finally:
+            set_fdc_ann_index(None)
+
+        assert matcher.ann_index is None
+
+    def test_n_probe_does_not_modify_index(self):
+        """
+        Test that setting n_probe for an IVFIndex object does not modify the object.
+        """
+        index = IVFIndex.build(get_usif_matcher().fdc_unit_vectors, n_lists=32)
+        try:
+            set_fdc_ann_index(index, n_probe=2)
+            assert get_usif_matcher().ann_index.n_probe == 2
+            assert index.n_probe == 8
+        finally:
+            set_fdc_ann_index(None)
+
+    def test_clears_foundation_food_cache(self):
+        """
+        Test that the foundation food cache is cleared when the index is set.
+        """
+        match_foundation_foods_batch([["red", "onion"]], [0])
+        assert len(get_foundation_food_cache()) > 0
+
+        set_fdc_ann_index(None)
+        assert len(get_foundation_food_cache()) == 0
@@ -0,0 +1,137 @@
+from unittest.mock import patch
+
+from ingredient_parser import (
+    ParseCache,
+    parse_ingredient,
+    parse_multiple_ingredients,
+    set_parse_cache,
+)
+from ingredient_parser.en._foundationfoods import (
+    FOUNDATION_FOOD_OVERRIDES,
+    match_foundation_foods,
+    match_foundation_foods_batch,
+)
+
+NAMES = [
+    ["red", "onion"],
+    ["chicken", "breast"],
+    ["egg"],
+    ["red", "onion"],
+    ["waxgourd"],
+    ["sour", "cream"],
+]
+
+SENTENCES = [
+    "1 lg yellow onion, chopped",
+    "salt and black pepper",
+    "24 fresh basil leaves or dried basil",
+    "1 cup waxgourd",
+    "2 eggs",
+    "1 lg yellow onion, chopped",
+    "250 ml hot beef or chicken stock",
+]
+
+
+def ff_tuple(ff):
+    """Return the fields of a FoundationFood that identify a match."""
+    return (ff.fdc_id, ff.confidence, ff.name_index)
+
+
+class Test_match_foundation_foods_batch:
+    def test_same_as_single(self):
+        """
+        Test that the match for each name is the same as matching each name on its own.
+        """
+        matches = match_foundation_foods_batch(NAMES, list(range(len(NAMES))))
+
+        assert len(matches) == len(NAMES)
+        for i, (tokens, match) in enumerate(zip(NAMES, matches)):
+            expected = match_foundation_foods(tokens, i)
+            if expected is None:
+                assert match is None
+            else:
+                assert ff_tuple(match) == ff_tuple(expected)
+
+    def test_default_name_index(self):
+        """
+        Test that each match has a name_index of 0 if name_indices are not given.
+        """
+        matches = match_foundation_foods_batch(NAMES)
+        assert all(m.name_index == 0 for m in matches if m is not None)
+
+    def test_duplicate_names_not_shared(self):
+        """
+        Test that duplicate names are given separate FoundationFood objects.
+        """
+        matches = match_foundation_foods_batch([["red", "onion"]] * 2, [0, 1])
+        assert matches[0] is not matches[1]
+        assert [m.name_index for m in matches] == [0, 1]
+
+    def test_override_not_modified(self):
+        """
+        Test that the FoundationFood objects in the override dict are not modified.
+        """
+        override = FOUNDATION_FOOD_OVERRIDES[("egg",)]
+        name_index = override.name_index
+        matches = match_foundation_foods_batch([["egg"], ["egg"]], [3, 4])
+
+        assert [m.name_index for m in matches] == [3, 4]
+        assert all(m is not override for m in matches)
+        assert override.name_index == name_index
+
+    def test_no_match(self):
+        """
+        Test that None is returned for names without any tokens in the embeddings.
+        """
+        assert match_foundation_foods_batch([["waxgourd"], []]) == [None, None]
+
+
+class Test_parse_multiple_ingredients_foundation_foods:
+    def test_same_as_single(self):
+        """
+        Test that the foundation foods from parsing many sentences are the same as
+        parsing each sentence on its own.
+        """
+        parsed = parse_multiple_ingredients(SENTENCES, foundation_foods=True)
+
+        for sentence, p in zip(SENTENCES, parsed):
+            expected = parse_ingredient(sentence, foundation_foods=True)
+            assert [ff_tuple(ff) for ff in p.foundation_foods] == [
+                ff_tuple(ff) for ff in expected.foundation_foods
+            ]
+
+    def test_separate_names_false(self):
+        """
+        Test that the foundation foods are the same as parsing each sentence on its own
+        when names are not separated.
+        """
+        parsed = parse_multiple_ingredients(
+            SENTENCES, foundation_foods=True, separate_names=False
+        )
+
+        for sentence, p in zip(SENTENCES, parsed):
+            expected = parse_ingredient(
+                sentence, foundation_foods=True, separate_names=False
+            )
+            assert [ff_tuple(ff) for ff in p.foundation_foods] == [
+                ff_tuple(ff) for ff in expected.foundation_foods
+            ]
+
+    def test_shares_parse_cache_with_single(self):
+        """
+        Test that sentences parsed on their own are returned from the parse cache when
+        parsing many sentences with foundation foods, because both use the same key.
+        """
+        set_parse_cache(ParseCache())
+        try:
+            for sentence in SENTENCES:
+                parse_ingredient(sentence, foundation_foods=True, string_units=True)
+
+            with patch("ingredient_parser.en.parser._postprocess_sentence") as mock:
+                parse_multiple_ingredients(
+                    SENTENCES, foundation_foods=True, string_units=True
+                )
+        finally:
+            set_parse_cache(None)
+
+        mock.assert_not_called()
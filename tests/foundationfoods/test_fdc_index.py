@@ -0,0 +1,55 @@
+import numpy as np
+
+from ingredient_parser.en._foundationfoods import (
+    FDCIndex,
+    get_usif_matcher,
+    load_fdc_index,
+    load_fdc_ingredients,
+    read_fdc_ingredients_csv,
+    uSIF,
+)
+from ingredient_parser.en._loaders import load_embeddings_model
+
+
+def assert_same_index(index: FDCIndex, expected: FDCIndex) -> None:
+    """Assert that two FDC indexes contain exactly the same data."""
+    assert index.fdc_ingredients == expected.fdc_ingredients
+    assert index.token_prob == expected.token_prob
+    assert index.a == expected.a
+    assert index.vectors.dtype == expected.vectors.dtype
+    assert np.array_equal(index.vectors, expected.vectors)
+
+
+class Test_FDCIndex:
+    def test_same_as_csv(self):
+        """
+        Test that the bundled FDC index is the same as the index calculated from
+        fdc_ingredients.csv.gz and the embeddings.
+        If this fails, run train/data/create_fdc_index.py.
+        """
+        expected = uSIF(load_embeddings_model(), read_fdc_ingredients_csv()).to_index()
+        assert_same_index(load_fdc_index(), expected)
+
+    def test_save_load(self, tmp_path):
+        """
+        Test that loading a saved FDC index returns the same index.
+        """
+        index = load_fdc_index()
+        index.save(tmp_path / "fdc_index.npz")
+        assert_same_index(FDCIndex.load(tmp_path / "fdc_index.npz"), index)
+
+    def test_load_fdc_ingredients(self):
+        """
+        Test that the FDC ingredients are loaded from the FDC index.
+        """
+        assert load_fdc_ingredients() is load_fdc_index().fdc_ingredients
+
+    def test_usif_matcher_from_index(self):
+        """
+        Test that the uSIF matcher created from the FDC index is the same as the
+        matcher calculated from the FDC ingredients.
+        """
+        matcher = get_usif_matcher()
+        expected = uSIF(load_embeddings_model(), load_fdc_ingredients())
+        assert matcher.min_prob == expected.min_prob
+        assert_same_index(matcher.to_index(), expected.to_index())
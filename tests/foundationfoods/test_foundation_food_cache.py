@@ -0,0 +1,149 @@
+import json
+import threading
+
+import pytest
+
+from ingredient_parser import (
+    FoundationFoodCache,
+    get_foundation_food_cache,
+    set_foundation_food_cache,
+)
+from ingredient_parser.en._foundationfoods import (
+    FOUNDATION_FOOD_OVERRIDES,
+    match_foundation_foods,
+)
+
+
+@pytest.fixture
+def ff_cache():
+    """Use an empty foundation food cache for the duration of a test."""
+    default = get_foundation_food_cache()
+    cache = FoundationFoodCache(maxsize=8)
+    set_foundation_food_cache(cache)
+    yield cache
+    set_foundation_food_cache(default)
+
+
+class Test_FoundationFoodCache:
+    def test_enabled_by_default(self):
+        """
+        Test that an in-memory cache is used by default.
+        """
+        cache = get_foundation_food_cache()
+        assert isinstance(cache, FoundationFoodCache)
+        assert cache.path is None
+
+    def test_cache_hit(self, ff_cache):
+        """
+        Test that matching the same name again uses the cache.
+        """
+        first = match_foundation_foods(["red", "onion"], 0)
+        second = match_foundation_foods(["red", "onions"], 1)
+
+        assert ff_cache.info().misses == 1
+        assert ff_cache.info().hits == 1
+        assert second.fdc_id == first.fdc_id
+        assert second.confidence == first.confidence
+
+    def test_no_match_cached(self, ff_cache):
+        """
+        Test that names without a match are cached.
+        """
+        assert match_foundation_foods(["bonbon"], 0) is None
+        assert match_foundation_foods(["bonbon"], 0) is None
+        assert ff_cache.info().hits == 1
+
+    def test_fresh_object(self, ff_cache):
+        """
+        Test that each match is a new object with the caller's name_index.
+        """
+        first = match_foundation_foods(["red", "onion"], 0)
+        second = match_foundation_foods(["red", "onion"], 2)
+
+        assert first is not second
+        assert (first.name_index, second.name_index) == (0, 2)
+
+    def test_disabled(self, ff_cache):
+        """
+        Test that names are matched without a cache if the cache is disabled.
+        """
+        set_foundation_food_cache(None)
+        match = match_foundation_foods(["red", "onion"], 0)
+
+        assert match is not None
+        assert ff_cache.info().misses == 0
+
+
+class Test_FoundationFoodCache_overrides:
+    def test_override_not_modified(self):
+        """
+        Test that the FoundationFood objects in the override dict are not modified or
+        returned.
+        """
+        override = FOUNDATION_FOOD_OVERRIDES[("egg",)]
+        name_index = override.name_index
+        match = match_foundation_foods(["egg"], 5)
+
+        assert match == override
+        assert match is not override
+        assert match.name_index == 5
+        assert override.name_index == name_index
+
+    def test_threads(self):
+        """
+        Test that overrides matched concurrently from many threads each get their own
+        name_index.
+        """
+        results = {}
+
+        def match(i):
+            results[i] = match_foundation_foods(["salt"], i).name_index
+
+        threads = [threading.Thread(target=match, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {i: i for i in range(16)}
+
+
+class Test_FoundationFoodCache_persistence:
+    def test_persistent(self, ff_cache, tmp_path):
+        """
+        Test that saved entries are loaded by a new cache object.
+        """
+        path = tmp_path / "ff.json"
+        cache = FoundationFoodCache(path=path)
+        set_foundation_food_cache(cache)
+        match = match_foundation_foods(["red", "onion"], 0)
+        match_foundation_foods(["bonbon"], 0)
+        cache.save()
+
+        new_cache = FoundationFoodCache(path=path)
+        assert len(new_cache) == 2
+        assert new_cache.get(("red", "onion")).confidence == match.confidence
+        assert ("bonbon",) in new_cache
+        assert new_cache.get(("bonbon",), "missing") is None
+
+    def test_stale_file_ignored(self, tmp_path):
+        """
+        Test that a file saved by a different library version is ignored.
+        """
+        path = tmp_path / "ff.json"
+        cache = FoundationFoodCache(path=path)
+        cache.set(("bonbon",), None)
+        cache.save()
+
+        data = json.loads(path.read_text())
+        data["version"] = "0.0.0"
+        path.write_text(json.dumps(data))
+
+        assert len(FoundationFoodCache(path=path)) == 0
+
+    def test_save_without_path(self):
+        """
+        Test that a ValueError is raised when saving a cache without a path.
+        """
+        with pytest.raises(ValueError, match="without a path"):
+            FoundationFoodCache().save()
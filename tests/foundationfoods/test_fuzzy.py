@@ -0,0 +1,191 @@
+import gc
+import weakref
+
+import pytest
+
+from ingredient_parser import fuzzy_matcher_cache_info, set_fuzzy_matcher_cache_sizes
+from ingredient_parser.en._foundationfoods import (
+    FDCIngredient,
+    FuzzyEmbeddingMatcher,
+    get_fuzzy_matcher,
+    get_usif_matcher,
+)
+from ingredient_parser.en._loaders import load_embeddings_model
+
+NAMES = [
+    ["red", "onion", "raw"],
+    ["chicken", "breast", "raw"],
+    ["brown", "sugar", "raw"],
+    ["chop", "tomato", "can"],
+    ["sour", "cream", "raw"],
+]
+
+
+def candidates(tokens: list[str]) -> list:
+    """Return uSIF candidate FDC ingredients for tokens."""
+    return [m.fdc for m in get_usif_matcher().find_candidate_matches(tokens, 50)]
+
+
+class Test_FuzzyEmbeddingMatcher:
+    def test_token_similarity_matrix(self):
+        """
+        Test that the token similarity matrix is identical to calculating the
+        similarity of each pair of tokens in turn.
+        """
+        fuzzy = get_fuzzy_matcher()
+        tokens = list(
+            dict.fromkeys(t for fdc in candidates(NAMES[0]) for t in fdc.tokens)
+        )
+        similarity = fuzzy._token_similarity_matrix(tokens)
+        for i, token1 in enumerate(tokens):
+            for j, token2 in enumerate(tokens):
+                assert similarity[i, j] == fuzzy._token_similarity(token1, token2)
+
+    @pytest.mark.parametrize("tokens", NAMES)
+    def test_fuzzy_document_distances(self, tokens):
+        """
+        Test that the fuzzy document distances are identical to calculating the
+        distance to each FDC ingredient in turn.
+        """
+        fuzzy = get_fuzzy_matcher()
+        fdc_ingredients = candidates(tokens)
+        distances = fuzzy._fuzzy_document_distances(tokens, fdc_ingredients)
+        assert distances.tolist() == [
+            fuzzy._fuzzy_document_distance(tokens, fdc.tokens)
+            for fdc in fdc_ingredients
+        ]
+
+    @pytest.mark.parametrize("tokens", NAMES)
+    def test_find_best_match(self, tokens):
+        """
+        Test that the best match is the first FDC ingredient with the smallest fuzzy
+        document distance.
+        """
+        fuzzy = get_fuzzy_matcher()
+        fdc_ingredients = candidates(tokens)
+        distances = [
+            fuzzy._fuzzy_document_distance(tokens, fdc.tokens)
+            for fdc in fdc_ingredients
+        ]
+        best = fuzzy.find_best_match(list(tokens), fdc_ingredients)
+        assert best.score == min(distances)
+        assert best.fdc == fdc_ingredients[distances.index(min(distances))]
+
+
+class Test_FuzzyEmbeddingMatcher_caches:
+    def test_fdc_token_similarity(self):
+        """
+        Test that the precalculated similarities between FDC ingredient tokens are the
+        same as calculating them separately.
+        """
+        fuzzy = get_fuzzy_matcher()
+        tokens = list(fuzzy.fdc_token_idx)[:200]
+        for token1 in tokens:
+            for token2 in tokens:
+                assert fuzzy._token_similarity(
+                    token1, token2
+                ) == fuzzy._calculate_token_similarity(token1, token2)
+
+    def test_fdc_tokens_not_cached(self):
+        """
+        Test that similarities between FDC ingredient tokens are not added to the
+        token similarity cache.
+        """
+        fuzzy = FuzzyEmbeddingMatcher(
+            load_embeddings_model(),
+            [FDCIngredient(1, "foundation_food", "Onions, red", "", ["onion", "red"])],
+        )
+        fuzzy._token_similarity("onion", "red")
+        assert fuzzy.cache_info()["token_similarity"].currsize == 0
+
+    def test_hits_and_misses(self):
+        """
+        Test that cache hits and misses are counted.
+        """
+        fuzzy = FuzzyEmbeddingMatcher(load_embeddings_model())
+        fuzzy._max_token_similarity("onion", ("red", "onion"))
+        fuzzy._max_token_similarity("onion", ("red", "onion"))
+
+        info = fuzzy.cache_info()
+        assert info["token_similarity"].misses == 2
+        assert info["max_token_similarity"].hits == 1
+        assert info["max_token_similarity"].misses == 1
+
+        fuzzy.clear_caches()
+        assert fuzzy.cache_info()["max_token_similarity"].currsize == 0
+
+    def test_cache_size(self):
+        """
+        Test that the cache sizes can be configured and are not exceeded.
+        """
+        fuzzy = FuzzyEmbeddingMatcher(
+            load_embeddings_model(),
+            token_similarity_cache_size=2,
+            max_token_similarity_cache_size=1,
+        )
+        fuzzy._max_token_similarity("onion", ("red", "onion", "raw"))
+        fuzzy._max_token_similarity("red", ("onion",))
+
+        info = fuzzy.cache_info()
+        assert info["token_similarity"].currsize == 2
+        assert info["max_token_similarity"].currsize == 1
+
+    def test_caches_owned_by_instance(self):
+        """
+        Test that caches are not shared between instances and do not keep the
+        instance alive.
+        """
+        fuzzy = FuzzyEmbeddingMatcher(load_embeddings_model())
+        fuzzy._max_token_similarity("onion", ("red", "onion"))
+        other = FuzzyEmbeddingMatcher(load_embeddings_model())
+        assert other.cache_info()["max_token_similarity"].currsize == 0
+
+        ref = weakref.ref(fuzzy)
+        del fuzzy
+        gc.collect()
+        assert ref() is None
+
+
+@pytest.fixture
+def default_cache_sizes():
+    """Restore the default fuzzy matcher cache sizes after the test."""
+    yield
+    set_fuzzy_matcher_cache_sizes()
+
+
+class Test_set_fuzzy_matcher_cache_sizes:
+    def test_before_matcher_created(self, default_cache_sizes):
+        """
+        Test that the sizes are used when the fuzzy matcher is created, and that the
+        cache info is returned without creating it.
+        """
+        get_fuzzy_matcher.cache_clear()
+        set_fuzzy_matcher_cache_sizes(token_similarity=8, max_token_similarity=4)
+
+        info = fuzzy_matcher_cache_info()
+        assert get_fuzzy_matcher.cache_info().currsize == 0
+        assert info["token_similarity"].maxsize == 8
+        assert info["max_token_similarity"].maxsize == 4
+
+        assert get_fuzzy_matcher().cache_info() == info
+
+    def test_after_matcher_created(self, default_cache_sizes):
+        """
+        Test that the caches of an existing fuzzy matcher are replaced.
+        """
+        fuzzy = get_fuzzy_matcher()
+        fuzzy._max_token_similarity("onion", ("red", "onion"))
+        set_fuzzy_matcher_cache_sizes(token_similarity=8, max_token_similarity=4)
+
+        assert get_fuzzy_matcher() is fuzzy
+        info = fuzzy_matcher_cache_info()
+        assert info["token_similarity"].maxsize == 8
+        assert info["max_token_similarity"].maxsize == 4
+        assert info["max_token_similarity"].currsize == 0
+
+    def test_invalid_size(self):
+        """
+        Test that a ValueError is raised if a size is less than 1.
+        """
+        with pytest.raises(ValueError, match="at least 1"):
+            set_fuzzy_matcher_cache_sizes(token_similarity=0)
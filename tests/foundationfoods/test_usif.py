@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from ingredient_parser.en._foundationfoods import get_usif_matcher
+from ingredient_parser.en._utils import prepare_embeddings_tokens
+
+NAMES = [
+    ["red", "onion"],
+    ["chicken", "breast"],
+    ["brown", "sugar"],
+    ["chop", "tomato"],
+    ["sour", "cream"],
+]
+
+
+def cosine_distances(tokens: list[str]) -> np.ndarray:
+    """Reference implementation of cosine distance to each FDC ingredient, one FDC
+    ingredient at a time."""
+    matcher = get_usif_matcher()
+    vec = matcher._embed(prepare_embeddings_tokens(tuple(tokens)))
+    return np.array(
+        [
+            1 - np.dot(vec, fdc_vec) / (np.linalg.norm(vec) * np.linalg.norm(fdc_vec))
+            for fdc_vec in matcher.fdc_vectors
+        ]
+    )
+
+
+class Test_uSIF_find_candidate_matches:
+    @pytest.mark.parametrize("tokens", NAMES)
+    def test_same_as_reference(self, tokens):
+        """
+        Test that the candidate matches are the best n by cosine distance, calculated
+        one FDC ingredient at a time.
+        """
+        matcher = get_usif_matcher()
+        distances = cosine_distances(tokens)
+        matches = matcher.find_candidate_matches(tokens, n=50)
+
+        assert len(matches) == 50
+        for match in matches:
+            idx = matcher.fdc_ingredients.index(match.fdc)
+            assert match.score == pytest.approx(distances[idx], abs=1e-6)
+        # No FDC ingredient that was not returned is better than the worst returned.
+        assert np.sum(distances < matches[-1].score - 1e-6) < 50
+
+    @pytest.mark.parametrize("tokens", NAMES)
+    def test_sorted(self, tokens):
+        """
+        Test that the candidate matches are sorted from best to worst.
+        """
+        scores = [
+            m.score for m in get_usif_matcher().find_candidate_matches(tokens, 50)
+        ]
+        assert scores == sorted(scores)
+
+    def test_n_larger_than_fdc_ingredients(self):
+        """
+        Test that every FDC ingredient is returned if n is larger than the number of
+        FDC ingredients.
+        """
+        matcher = get_usif_matcher()
+        n = len(matcher.fdc_ingredients) + 10
+        matches = matcher.find_candidate_matches(["red", "onion"], n)
+        assert len(matches) == len(matcher.fdc_ingredients)
+
+
+class Test_uSIF_find_candidate_matches_batch:
+    def test_same_as_single(self):
+        """
+        Test that the candidate matches for each name are the same as finding the
+        candidate matches for each name on its own.
+        """
+        matcher = get_usif_matcher()
+        batch = matcher.find_candidate_matches_batch(NAMES, n=50)
+
+        assert len(batch) == len(NAMES)
+        for tokens, matches in zip(NAMES, batch):
+            assert matches == matcher.find_candidate_matches(tokens, n=50)
+
+    def test_empty(self):
+        """
+        Test that an empty list is returned if there are no names.
+        """
+        assert get_usif_matcher().find_candidate_matches_batch([], n=50) == []
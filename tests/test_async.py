@@ -0,0 +1,103 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from ingredient_parser import aparse_ingredient, aparse_many, parse_ingredient
+from ingredient_parser.en import _loaders
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tsp salt",
+    "3 large eggs, beaten",
+    "200 ml beef or chicken stock",
+    "1 lb 2 oz potatoes, peeled",
+]
+
+
+async def collect(agen):
+    """Collect all values yielded by async generator into a list."""
+    return [item async for item in agen]
+
+
+class Test_aload_models:
+    def test_concurrent_calls_load_once(self):
+        """
+        Test that concurrent calls to aload_models only load the models once.
+        """
+
+        async def load_concurrently():
+            await asyncio.gather(*[_loaders.aload_models() for _ in range(10)])
+
+        with (
+            patch.object(_loaders, "_MODELS_LOADED", {}),
+            patch.object(_loaders, "load_models") as mock_load_models,
+        ):
+            asyncio.run(load_concurrently())
+            asyncio.run(load_concurrently())
+
+        mock_load_models.assert_called_once_with(False)
+
+    def test_failed_load_is_retried(self):
+        """
+        Test that if loading the models fails, a later call tries again.
+        """
+        with (
+            patch.object(_loaders, "_MODELS_LOADED", {}),
+            patch.object(
+                _loaders, "load_models", side_effect=[OSError("Model not found"), None]
+            ) as mock_load_models,
+        ):
+            with pytest.raises(OSError, match="Model not found"):
+                asyncio.run(_loaders.aload_models())
+            asyncio.run(_loaders.aload_models())
+
+        assert mock_load_models.call_count == 2
+
+
+class Test_aparse_ingredient:
+    def test_same_as_parse_ingredient(self):
+        """
+        Test that aparse_ingredient returns the same result as parse_ingredient.
+        """
+        parsed = asyncio.run(aparse_ingredient("2 cups flour", foundation_foods=True))
+        assert parsed == parse_ingredient("2 cups flour", foundation_foods=True)
+
+    def test_unsupported_language(self):
+        """
+        Test that a ValueError is raised for an unsupported language.
+        """
+        with pytest.raises(ValueError, match="Unsupported language"):
+            asyncio.run(aparse_ingredient("2 cups flour", lang="fr"))
+
+
+class Test_aparse_many:
+    def test_ordered(self):
+        """
+        Test that results are yielded in input order when ordered=True.
+        """
+        results = asyncio.run(collect(aparse_many(SENTENCES, concurrency=2)))
+        assert [idx for idx, _ in results] == list(range(len(SENTENCES)))
+        assert [p for _, p in results] == [parse_ingredient(s) for s in SENTENCES]
+
+    def test_unordered(self):
+        """
+        Test that all results are yielded with the index of their input sentence when
+        ordered=False.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = asyncio.run(
+                collect(aparse_many(SENTENCES, executor=executor, ordered=False))
+            )
+
+        assert sorted(idx for idx, _ in results) == list(range(len(SENTENCES)))
+        for idx, parsed in results:
+            assert parsed == parse_ingredient(SENTENCES[idx])
+
+    def test_invalid_concurrency(self):
+        """
+        Test that a ValueError is raised if concurrency is less than 1.
+        """
+        with pytest.raises(ValueError, match="concurrency"):
+            asyncio.run(collect(aparse_many(SENTENCES, concurrency=0)))
@@ -0,0 +1,324 @@
+import json
+import multiprocessing
+import pickle
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from ingredient_parser import (
+    ParseCache,
+    SQLiteParseCache,
+    get_parse_cache,
+    parse_ingredient,
+    set_parse_cache,
+)
+from ingredient_parser._common import UREG
+from ingredient_parser.dataclasses import IngredientText, ParsedIngredient
+from ingredient_parser.en._utils import ingredient_amount_factory
+
+
+def make_parsed(sentence: str) -> ParsedIngredient:
+    """Return ParsedIngredient object with name set to sentence."""
+    return ParsedIngredient(
+        name=[IngredientText(text=sentence, confidence=1, starting_index=0)],
+        size=None,
+        amount=[],
+        preparation=None,
+        comment=None,
+        purpose=None,
+        foundation_foods=[],
+        sentence=sentence,
+    )
+
+
+def read_write_cache(cache: SQLiteParseCache, worker: int) -> int:
+    """Write entries to cache and read back entries written by all workers.
+
+    Returns the number of entries found.
+    """
+    for i in range(50):
+        cache.set(("en", f"{worker} {i}"), make_parsed(f"{worker} {i}"))
+
+    found = 0
+    for other_worker in range(4):
+        for i in range(50):
+            if cache.get(("en", f"{other_worker} {i}")) is not None:
+                found += 1
+    return found
+
+
+@pytest.fixture
+def parse_cache():
+    """Enable parse cache for the duration of a test."""
+    cache = ParseCache(maxsize=8)
+    set_parse_cache(cache)
+    yield cache
+    set_parse_cache(None)
+
+
+class Test_ParseCache:
+    def test_get_miss(self):
+        """
+        Test that None is returned and a miss recorded for a key not in the cache.
+        """
+        cache = ParseCache()
+        assert cache.get("salt") is None
+        assert cache.info().misses == 1
+
+    def test_get_hit(self):
+        """
+        Test that an equal object is returned and a hit recorded for a key in the
+        cache.
+        """
+        cache = ParseCache()
+        cache.set("salt", make_parsed("salt"))
+        assert cache.get("salt") == make_parsed("salt")
+        assert cache.info().hits == 1
+
+    def test_defensive_copy(self):
+        """
+        Test that modifying the object added to the cache or returned from the cache
+        does not modify the cached entry.
+        """
+        cache = ParseCache()
+        parsed = make_parsed("salt")
+        cache.set("salt", parsed)
+        parsed.name[0].text = "pepper"
+
+        cached = cache.get("salt")
+        assert cached is not None
+        assert cached.name[0].text == "salt"
+
+        cached.name[0].text = "pepper"
+        assert cache.get("salt") == make_parsed("salt")
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used entry is evicted when the cache is full.
+        """
+        cache = ParseCache(maxsize=2)
+        cache.set("salt", make_parsed("salt"))
+        cache.set("pepper", make_parsed("pepper"))
+        cache.get("salt")
+        cache.set("sugar", make_parsed("sugar"))
+
+        assert "salt" in cache
+        assert "pepper" not in cache
+        assert "sugar" in cache
+        assert len(cache) == 2
+
+    def test_clear(self):
+        """
+        Test that clearing the cache removes all entries and resets statistics.
+        """
+        cache = ParseCache()
+        cache.set("salt", make_parsed("salt"))
+        cache.get("salt")
+        cache.get("pepper")
+        cache.clear()
+        assert cache.info() == (0, 0, 4096, 0)
+
+    def test_invalid_maxsize(self):
+        """
+        Test that a ValueError is raised if maxsize is less than 1.
+        """
+        with pytest.raises(ValueError, match="maxsize"):
+            ParseCache(maxsize=0)
+
+
+class Test_parse_ingredient_cache:
+    def test_disabled_by_default(self):
+        """
+        Test that caching is disabled by default.
+        """
+        assert get_parse_cache() is None
+
+    def test_cache_hit(self, parse_cache):
+        """
+        Test that parsing the same sentence twice returns the cached result.
+        """
+        first = parse_ingredient("2 cups flour")
+        second = parse_ingredient("2 cups flour")
+        assert first == second
+        assert first is not second
+        assert parse_cache.info().hits == 1
+        assert parse_cache.info().misses == 1
+
+    def test_options_in_key(self, parse_cache):
+        """
+        Test that parsing the same sentence with different options does not return
+        the cached result.
+        """
+        first = parse_ingredient("2 cups flour")
+        second = parse_ingredient("2 cups flour", string_units=True)
+        assert first != second
+        assert parse_cache.info().hits == 0
+        assert len(parse_cache) == 2
+
+
+class Test_SQLiteParseCache:
+    def test_persistent(self, tmp_path):
+        """
+        Test that entries are read from the database by a new cache object.
+        """
+        cache = SQLiteParseCache(tmp_path)
+        cache.set(("en", "salt"), make_parsed("salt"))
+
+        new_cache = SQLiteParseCache(tmp_path)
+        assert new_cache.get(("en", "salt")) == make_parsed("salt")
+        assert new_cache.info().hits == 1
+        assert new_cache.info().misses == 0
+
+    def test_units_bound_to_library_registry(self, tmp_path):
+        """
+        Test that pint units read from the database are bound to the library's unit
+        registry.
+        """
+        amount = ingredient_amount_factory(
+            quantity="2", unit="cup", text="2 cup", confidence=1, starting_index=0
+        )
+        parsed = make_parsed("2 cups")
+        parsed.amount = [amount]
+
+        SQLiteParseCache(tmp_path).set(("en", "2 cups"), parsed)
+        cached = SQLiteParseCache(tmp_path).get(("en", "2 cups"))
+        assert cached is not None
+        assert cached.amount[0].convert_to("g").unit == UREG("g").units
+
+    def test_other_version_entries_kept(self, tmp_path):
+        """
+        Test that entries created by a different library version are not returned, but
+        are not deleted when the database is opened.
+        """
+        cache = SQLiteParseCache(tmp_path)
+        cache.set(("en", "salt"), make_parsed("salt"))
+        with sqlite3.connect(tmp_path / SQLiteParseCache.DATABASE_NAME) as connection:
+            connection.execute("UPDATE parsed SET version = '0.0.0'")
+
+        new_cache = SQLiteParseCache(tmp_path)
+        assert new_cache.get(("en", "salt")) is None
+        with sqlite3.connect(tmp_path / SQLiteParseCache.DATABASE_NAME) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM parsed").fetchone() == (1,)
+
+    def test_clear(self, tmp_path):
+        """
+        Test that clearing the cache also clears the database.
+        """
+        cache = SQLiteParseCache(tmp_path)
+        cache.set(("en", "salt"), make_parsed("salt"))
+        cache.clear()
+        assert SQLiteParseCache(tmp_path).get(("en", "salt")) is None
+
+    def test_clear_other_version_entries_kept(self, tmp_path):
+        """
+        Test that clearing the cache does not delete entries created by a different
+        library version or parser model.
+        """
+        cache = SQLiteParseCache(tmp_path)
+        cache.set(("en", "salt"), make_parsed("salt"))
+        cache.set(("en", "pepper"), make_parsed("pepper"))
+        cache.set(("en", "sugar"), make_parsed("sugar"))
+        with sqlite3.connect(tmp_path / SQLiteParseCache.DATABASE_NAME) as connection:
+            connection.execute(
+                "UPDATE parsed SET version = '0.0.0' WHERE key = ?",
+                (cache._database_key(("en", "salt"))[0],),
+            )
+            connection.execute(
+                "UPDATE parsed SET model_hash = 'other' WHERE key = ?",
+                (cache._database_key(("en", "pepper"))[0],),
+            )
+
+        cache.clear()
+        with sqlite3.connect(tmp_path / SQLiteParseCache.DATABASE_NAME) as connection:
+            versions = connection.execute(
+                "SELECT version, model_hash FROM parsed ORDER BY version"
+            ).fetchall()
+        assert len(versions) == 2
+        assert versions[0][0] == "0.0.0"
+        assert versions[1][1] == "other"
+
+    def test_pickle(self, tmp_path):
+        """
+        Test that a pickled cache uses the same database.
+        """
+        cache = SQLiteParseCache(tmp_path, maxsize=16)
+        cache.set(("en", "salt"), make_parsed("salt"))
+
+        unpickled = pickle.loads(pickle.dumps(cache))
+        assert unpickled.maxsize == 16
+        assert unpickled.get(("en", "salt")) == make_parsed("salt")
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="Requires fork start method",
+    )
+    def test_process_pool(self, tmp_path):
+        """
+        Test that the cache can be written and read concurrently from multiple
+        processes.
+        """
+        cache = SQLiteParseCache(tmp_path)
+        with ProcessPoolExecutor(
+            max_workers=4, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            list(executor.map(read_write_cache, [cache] * 4, range(4)))
+
+        assert read_write_cache(SQLiteParseCache(tmp_path), 0) == 200
+
+    def test_stored_as_json(self, tmp_path):
+        """
+        Test that entries are stored in the database as JSON.
+        """
+        SQLiteParseCache(tmp_path).set(("en", "salt"), make_parsed("salt"))
+        with sqlite3.connect(tmp_path / SQLiteParseCache.DATABASE_NAME) as connection:
+            (value,) = connection.execute("SELECT value FROM parsed").fetchone()
+
+        assert json.loads(value) == make_parsed("salt").to_dict()
+
+    def test_invalid_entry_not_loaded(self, tmp_path):
+        """
+        Test that entries that are not valid JSON, e.g. pickled objects, are treated as
+        missing instead of being loaded.
+        """
+        cache = SQLiteParseCache(tmp_path)
+        cache.set(("en", "salt"), make_parsed("salt"))
+        with sqlite3.connect(tmp_path / SQLiteParseCache.DATABASE_NAME) as connection:
+            connection.execute(
+                "UPDATE parsed SET value = ?", (pickle.dumps(make_parsed("salt")),)
+            )
+
+        assert SQLiteParseCache(tmp_path).get(("en", "salt")) is None
+
+    def test_close(self, tmp_path):
+        """
+        Test that close() closes the connection opened by every thread, and that the
+        cache can still be used afterwards.
+        """
+        cache = SQLiteParseCache(tmp_path)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda i: cache.get(("en", str(i))), range(8)))
+
+        connections = [connection for _, connection in cache._connections]
+        assert len(connections) >= 2
+
+        cache.close()
+        for connection in connections:
+            with pytest.raises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+
+        cache.set(("en", "salt"), make_parsed("salt"))
+        assert SQLiteParseCache(tmp_path).get(("en", "salt")) == make_parsed("salt")
+
+    def test_context_manager(self, tmp_path):
+        """
+        Test that the connections are closed when the with block exits.
+        """
+        with SQLiteParseCache(tmp_path) as cache:
+            cache.set(("en", "salt"), make_parsed("salt"))
+            connections = [connection for _, connection in cache._connections]
+
+        assert cache._connections == []
+        for connection in connections:
+            with pytest.raises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from ingredient_parser import parse_ingredient
+from ingredient_parser.__main__ import main, read_sentences
+
+
+class Test_read_sentences:
+    def test_csv(self, tmp_path):
+        """
+        Test that sentences are read from the named CSV column, with an empty string
+        for empty values.
+        """
+        path = tmp_path / "sentences.csv"
+        path.write_text("id,sentence\n1,2 cups flour\n2,\n3,1 tsp salt\n")
+        with open(path, newline="") as f:
+            sentences = list(read_sentences(f, "csv", "sentence", "sentence"))
+
+        assert sentences == ["2 cups flour", "", "1 tsp salt"]
+
+    def test_csv_missing_column(self, tmp_path):
+        """
+        Test that a ValueError is raised if the column is not in the CSV header.
+        """
+        path = tmp_path / "sentences.csv"
+        path.write_text("id,text\n1,2 cups flour\n")
+        with open(path, newline="") as f, pytest.raises(ValueError, match="Column"):
+            list(read_sentences(f, "csv", "sentence", "sentence"))
+
+    def test_jsonl(self, tmp_path):
+        """
+        Test that sentences are read from the named JSONL field, with an empty string
+        for blank lines and records without the field.
+        """
+        path = tmp_path / "sentences.jsonl"
+        path.write_text('{"sentence": "2 cups flour"}\n\n{"id": 3}\n')
+        with open(path) as f:
+            sentences = list(read_sentences(f, "jsonl", "sentence", "sentence"))
+
+        assert sentences == ["2 cups flour", "", ""]
+
+    @pytest.mark.parametrize(
+        ("content", "match"),
+        [
+            ('{"sentence": "2 cups flour"}\n[1, 2]\n', "Line 2 is not a JSON object"),
+            ('{"sentence": 5}\n', 'Field "sentence" on line 1 is not a string'),
+            ('{"sentence": "2 cups flour"}\n{"sentence"\n', "Invalid JSON on line 2"),
+        ],
+    )
+    def test_jsonl_invalid(self, tmp_path, content, match):
+        """
+        Test that a ValueError with the line number is raised if a line is not valid
+        JSON, is not a JSON object, or its field is not a string.
+        """
+        path = tmp_path / "sentences.jsonl"
+        path.write_text(content)
+        with open(path) as f, pytest.raises(ValueError, match=match):
+            list(read_sentences(f, "jsonl", "sentence", "sentence"))
+
+
+class Test_parse_command:
+    def test_txt(self, tmp_path, capsys):
+        """
+        Test that a JSON record is written for each non-blank line, with the line number
+        of the sentence.
+        """
+        path = tmp_path / "sentences.txt"
+        path.write_text("2 cups flour\n\n1 tsp salt\n")
+        main(["parse", str(path), "--quiet"])
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["line"] for r in records] == [1, 3]
+        assert records[0]["sentence"] == "2 cups flour"
+        assert records[1] == {"line": 3, **parse_ingredient("1 tsp salt").to_dict()}
+
+    def test_summary(self, tmp_path, capsys):
+        """
+        Test that the number of sentences and throughput are written to stderr.
+        """
+        path = tmp_path / "sentences.txt"
+        path.write_text("2 cups flour\n1 tsp salt\n")
+        main(["parse", str(path), "--string-units"])
+
+        captured = capsys.readouterr()
+        assert "Parsed 2 sentences" in captured.err
+        assert json.loads(captured.out.splitlines()[0])["amount"][0]["unit"] == "cups"
+
+    def test_missing_file(self, tmp_path, capsys):
+        """
+        Test that the command exits with an error if the input file does not exist.
+        """
+        with pytest.raises(SystemExit) as excinfo:
+            main(["parse", str(tmp_path / "missing.txt")])
+
+        assert excinfo.value.code == 1
+        assert "error" in capsys.readouterr().err
+
+    def test_invalid_jsonl(self, tmp_path, capsys):
+        """
+        Test that the command exits with an error naming the line if a JSONL line is
+        not a JSON object.
+        """
+        path = tmp_path / "sentences.jsonl"
+        path.write_text('{"sentence": "2 cups flour"}\n[1, 2]\n')
+        with pytest.raises(SystemExit) as excinfo:
+            main(["parse", str(path), "--quiet"])
+
+        assert excinfo.value.code == 1
+        assert "Line 2 is not a JSON object" in capsys.readouterr().err
+
+    def test_compact(self, tmp_path, capsys):
+        """
+        Test that fields that are None or empty are left out with --compact.
+        """
+        path = tmp_path / "sentences.txt"
+        path.write_text("2 cups flour\n")
+        main(["parse", str(path), "--quiet", "--compact"])
+
+        record = json.loads(capsys.readouterr().out)
+        assert "comment" not in record
+        assert record["amount"][0]["quantity"] == "2"
@@ -1,9 +1,16 @@
+import subprocess
+import sys
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from ingredient_parser._common import (
+    UREG,
     consume,
+    decode_strings,
+    encode_strings,
+    get_unit_registry,
     group_consecutive_idx,
     is_float,
     is_range,
@@ -108,6 +115,45 @@ class Test_group_consecutive_indices:
         assert [list(g) for g in groups] == [[0, 1, 2], [4, 5, 6], [8, 9]]
 
 
+class Test_encode_strings:
+    def test_round_trip(self):
+        """
+        Test that decoding encoded strings returns the original strings.
+        """
+        strings = ["flour", "", "crème fraîche", "salt"]
+        assert decode_strings(encode_strings(strings)) == strings
+
+    def test_empty(self):
+        """
+        Test that encoding no strings gives an empty array, which decodes to an empty
+        list.
+        """
+        assert decode_strings(encode_strings([])) == []
+
+    @pytest.mark.parametrize("strings", [[""], ["", ""], ["flour", ""]])
+    def test_empty_strings(self, strings):
+        """
+        Test that empty strings are decoded exactly, and are not confused with an empty
+        list or dropped.
+        """
+        assert decode_strings(encode_strings(strings)) == strings
+
+    def test_not_terminated(self):
+        """
+        Test that a ValueError is raised if the encoded strings do not end with a
+        newline.
+        """
+        with pytest.raises(ValueError, match="newline"):
+            decode_strings(np.frombuffer(b"flour", dtype=np.uint8))
+
+    def test_newline(self):
+        """
+        Test that a ValueError is raised if a string contains a newline.
+        """
+        with pytest.raises(ValueError, match="newlines"):
+            encode_strings(["2 cups\nflour"])
+
+
 class Test_show_model_card:
     @patch("os.startfile", create=True)
     @patch("subprocess.call")
@@ -121,3 +167,86 @@ class Test_show_model_card:
             show_model_card("en")
         except FileNotFoundError:
             pytest.fail("Model card not found.")
+
+
+def run_python(code: str) -> str:
+    """Run code in a new Python interpreter and return stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+class Test_unit_registry:
+    def test_single_registry(self):
+        """
+        Test that the same registry is returned every time.
+        """
+        assert get_unit_registry() is get_unit_registry()
+
+    def test_proxy(self):
+        """
+        Test that UREG can be used in place of the registry.
+        """
+        assert UREG("g").units == get_unit_registry()("g").units
+        assert UREG.Unit("cup") == get_unit_registry().Unit("cup")
+        assert "cup" in UREG
+
+    def test_import_does_not_import_pint(self):
+        """
+        Test that importing the library does not import pint or create the registry.
+        """
+        output = run_python(
+            "import sys; import ingredient_parser; "
+            "from ingredient_parser import _common; "
+            "print('pint' in sys.modules, _common._UREG is None)"
+        )
+        assert output == "False True"
+
+    def test_string_units_does_not_create_registry(self):
+        """
+        Test that parsing a sentence with string_units=True does not import pint or
+        create the registry.
+        """
+        output = run_python(
+            "import sys; from ingredient_parser import parse_ingredient; "
+            "from ingredient_parser import _common; "
+            "parse_ingredient('2 cups flour', string_units=True); "
+            "print('pint' in sys.modules, _common._UREG is None)"
+        )
+        assert output == "False True"
+
+
+class Test_import:
+    def test_import_does_not_import_optional_modules(self):
+        """
+        Test that importing the library does not import pint or the foundation food
+        matching code, which are only needed for pint units and foundation foods.
+        """
+        output = run_python(
+            "import sys; import ingredient_parser; "
+            "print('pint' in sys.modules, "
+            "'ingredient_parser.en._foundationfoods' in sys.modules)"
+        )
+        assert output == "False False"
+
+    def test_foundation_foods_names_imported_on_use(self):
+        """
+        Test that the foundation food names exported by the library are imported when
+        first used.
+        """
+        output = run_python(
+            "from ingredient_parser import FoundationFoodCache; "
+            "from ingredient_parser.en import _foundationfoods; "
+            "print(FoundationFoodCache is _foundationfoods.FoundationFoodCache)"
+        )
+        assert output == "True"
+
+    def test_unknown_name(self):
+        """
+        Test that an AttributeError is raised for names the library does not export.
+        """
+        import ingredient_parser
+
+        with pytest.raises(AttributeError, match="no attribute"):
+            ingredient_parser.not_a_function
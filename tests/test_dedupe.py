@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from ingredient_parser import parse_multiple_ingredients
+from ingredient_parser.dataclasses import ParsedIngredientList
+from ingredient_parser.en import dedupe_key_en
+from ingredient_parser.en.parser import _postprocess_sentence
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tsp salt",
+    "2  cups flour ",
+    "2 cups flour",
+    "3 large eggs, beaten",
+    "1 tsp salt",
+]
+
+
+class Test_dedupe_key_en:
+    def test_whitespace(self):
+        """
+        Test that sentences that only differ in whitespace have the same key.
+        """
+        assert dedupe_key_en(" 2  cups\tflour ") == dedupe_key_en("2 cups flour")
+
+    def test_normalisation(self):
+        """
+        Test that sentences that are identical after normalisation have the same key.
+        """
+        assert dedupe_key_en("2cups flour") == dedupe_key_en("2 cups flour")
+
+    def test_case_sensitive(self):
+        """
+        Test that sentences that differ in case have different keys, because case
+        affects the features used by the parser model.
+        """
+        assert dedupe_key_en("2 Cups flour") != dedupe_key_en("2 cups flour")
+
+
+class Test_parse_multiple_ingredients_dedupe:
+    def test_parses_unique_sentences_once(self):
+        """
+        Test that each unique sentence is only parsed once.
+        """
+        with patch(
+            "ingredient_parser.en.parser._postprocess_sentence",
+            wraps=_postprocess_sentence,
+        ) as mock_postprocess:
+            parse_multiple_ingredients(SENTENCES, dedupe=True)
+
+        assert mock_postprocess.call_count == 3
+
+    def test_same_as_without_dedupe(self):
+        """
+        Test that the results are the same as parsing without dedupe, including the
+        sentence field of each result.
+        """
+        deduped = parse_multiple_ingredients(SENTENCES, dedupe=True)
+        assert deduped == parse_multiple_ingredients(SENTENCES)
+        assert [p.sentence for p in deduped] == SENTENCES
+
+    def test_duplicates_are_copies(self):
+        """
+        Test that modifying the result for one sentence does not modify the result for
+        its duplicates.
+        """
+        deduped = parse_multiple_ingredients(SENTENCES, dedupe=True)
+        deduped[0].name[0].text = "sugar"
+        assert deduped[3].name[0].text == "flour"
+
+    def test_dedupe_ratio(self):
+        """
+        Test that the returned list reports the number of unique sentences and the
+        dedupe ratio.
+        """
+        deduped = parse_multiple_ingredients(SENTENCES, dedupe=True)
+        assert isinstance(deduped, ParsedIngredientList)
+        assert deduped.total_sentences == 6
+        assert deduped.unique_sentences == 3
+        assert deduped.dedupe_ratio == 0.5
+
+    def test_dedupe_ratio_without_dedupe(self):
+        """
+        Test that the dedupe ratio is 0 when dedupe is not enabled.
+        """
+        parsed = parse_multiple_ingredients(SENTENCES)
+        assert parsed.unique_sentences == 6
+        assert parsed.dedupe_ratio == 0
@@ -0,0 +1,131 @@
+import numpy as np
+
+from ingredient_parser.en._embeddings import GloVeModel
+from ingredient_parser.en._loaders import load_embeddings_model
+
+TEXT_FILE = "data/ingredient_embeddings.25d.glove.txt.gz"
+NPY_FILE = "data/ingredient_embeddings.25d.glove.npy"
+
+
+class Test_GloVeModel_npy:
+    def test_same_as_text(self):
+        """
+        Test that the binary embeddings contain the same vectors as the text
+        embeddings.
+        """
+        text = GloVeModel(TEXT_FILE)
+        binary = GloVeModel(NPY_FILE)
+
+        assert binary.dimension == text.dimension
+        assert binary.vocab == text.vocab
+        assert np.array_equal(binary.matrix, text.matrix)
+
+    def test_memory_mapped(self):
+        """
+        Test that the binary embeddings are memory mapped rather than read into memory.
+        """
+        vector = GloVeModel(NPY_FILE)["cup"]
+        while not isinstance(vector, np.memmap):
+            vector = vector.base
+            assert vector is not None
+
+    def test_loader_uses_npy(self):
+        """
+        Test that the binary embeddings are loaded if bundled with the package.
+        """
+        assert load_embeddings_model().vec_file == NPY_FILE
+
+
+class Test_GloVeModel_matrix:
+    def test_matrix(self):
+        """
+        Test that the vectors are a float32 matrix with a row for each token.
+        """
+        model = GloVeModel(NPY_FILE)
+        assert model.matrix.dtype == np.float32
+        assert model.matrix.shape == (len(model.vocab), model.dimension)
+        assert len(model) == len(model.vocab)
+
+    def test_index(self):
+        """
+        Test that the index gives the row of the matrix for each token.
+        """
+        model = GloVeModel(NPY_FILE)
+        for row, token in enumerate(model.vocab[:1000]):
+            assert model.index[token] == row
+            assert np.array_equal(model[token], model.matrix[row])
+
+    def test_rows_for(self):
+        """
+        Test that rows_for returns the row of each token, and -1 for tokens not in the
+        vocabulary.
+        """
+        model = GloVeModel(NPY_FILE)
+        rows = model.rows_for(["cup", "not-a-token", "flour"])
+        assert rows.tolist() == [model.index["cup"], -1, model.index["flour"]]
+
+    def test_rows_for_empty(self):
+        """
+        Test that rows_for returns an empty integer array if there are no tokens.
+        """
+        model = GloVeModel(NPY_FILE)
+        rows = model.rows_for([])
+        assert rows.shape == (0,)
+        assert rows.dtype == np.intp
+
+    def test_get(self):
+        """
+        Test that get returns the default for tokens not in the vocabulary.
+        """
+        model = GloVeModel(NPY_FILE)
+        assert np.array_equal(model.get("cup", None), model["cup"])
+        assert model.get("not-a-token", None) is None
+
+    def test_norms(self):
+        """
+        Test that the norms are the euclidean norm of each vector.
+        """
+        model = GloVeModel(NPY_FILE)
+        assert model.norms.shape == (len(model),)
+        assert np.isclose(model.norms[model.index["cup"]], np.linalg.norm(model["cup"]))
+
+
+def binarize(vec: np.ndarray) -> list[str]:
+    """Reference implementation of vector binarization, one element at a time."""
+    positive_avg = np.mean(vec[vec > 0])
+    negative_avg = np.mean(vec[vec < 0])
+    binarised_vec = []
+    for value in vec:
+        if value < negative_avg:
+            binarised_vec.append("VNEG")
+        elif value > positive_avg:
+            binarised_vec.append("VPOS")
+        else:
+            binarised_vec.append("V0")
+    return binarised_vec
+
+
+class Test_GloVeModel_binarized_vectors:
+    def test_lazy(self):
+        """
+        Test that the binarized vectors are not calculated when the model is loaded.
+        """
+        model = GloVeModel(NPY_FILE)
+        assert "binarized_vectors" not in model.__dict__
+
+    def test_matrix(self):
+        """
+        Test that the binarized vectors are an int8 matrix with a row for each vector.
+        """
+        model = GloVeModel(NPY_FILE)
+        assert model.binarized_vectors.dtype == np.int8
+        assert model.binarized_vectors.shape == (len(model), model.dimension)
+
+    def test_same_as_reference(self):
+        """
+        Test that the binarized vectors are the same as calculating them one element
+        at a time.
+        """
+        model = GloVeModel(NPY_FILE)
+        for token in model.vocab[:1000]:
+            assert model.binarized_vector(token) == binarize(model[token])
@@ -0,0 +1,88 @@
+import io
+from types import GeneratorType
+from unittest.mock import patch
+
+import pytest
+
+from ingredient_parser import iter_parse, parse_ingredient
+
+FILE_CONTENTS = """2 cups flour
+1 tsp salt
+
+3 large eggs, beaten\r
+200 ml beef or chicken stock
+"""
+
+
+class Test_iter_parse:
+    def test_lazy(self):
+        """
+        Test that iter_parse returns a generator and does not consume the input until
+        iterated.
+        """
+        sentences = iter(["2 cups flour", "1 tsp salt"])
+        result = iter_parse(sentences)
+        assert isinstance(result, GeneratorType)
+        assert next(sentences) == "2 cups flour"
+
+    def test_file_object(self):
+        """
+        Test that sentences are read from a file object, with blank lines skipped and
+        line numbers counted from 1.
+        """
+        results = list(iter_parse(io.StringIO(FILE_CONTENTS)))
+        assert [line_number for line_number, _ in results] == [1, 2, 4, 5]
+        assert results[2][1] == parse_ingredient("3 large eggs, beaten")
+
+    @pytest.mark.parametrize("threads", [1, 4])
+    def test_threads(self, threads):
+        """
+        Test that parsing in threads gives the same results, in the same order, as
+        parsing in the calling thread.
+        """
+        sentences = FILE_CONTENTS.splitlines() * 10
+        expected = list(iter_parse(sentences))
+        assert list(iter_parse(sentences, threads=threads)) == expected
+
+    @pytest.mark.parametrize("threads", [0, 2])
+    def test_exception_note(self, threads):
+        """
+        Test that the line number is added to any exception raised whilst parsing.
+        """
+
+        def fail_on_eggs(sentence, **kwargs):
+            if "eggs" in sentence:
+                raise RuntimeError("Parsing failed")
+            return sentence
+
+        with (
+            patch("ingredient_parser.parsers.parse_ingredient", fail_on_eggs),
+            pytest.raises(RuntimeError) as excinfo,
+        ):
+            list(iter_parse(io.StringIO(FILE_CONTENTS), threads=threads))
+
+        assert "Raised whilst parsing line 4" in excinfo.value.__notes__[0]
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_workers(self, ordered):
+        """
+        Test that parsing in worker processes gives the same results as parsing in the
+        calling process, in the same order if ordered=True.
+        """
+        sentences = FILE_CONTENTS.splitlines() * 20
+        expected = list(iter_parse(sentences))
+        results = list(iter_parse(sentences, workers=2, ordered=ordered))
+
+        if not ordered:
+            results.sort(key=lambda result: result[0])
+        assert results == expected
+
+    def test_unordered_threads(self):
+        """
+        Test that all results are yielded with their line numbers when parsing in
+        threads with ordered=False.
+        """
+        sentences = FILE_CONTENTS.splitlines() * 10
+        expected = list(iter_parse(sentences))
+        results = list(iter_parse(sentences, threads=4, ordered=False))
+        assert sorted(results, key=lambda result: result[0]) == expected
@@ -0,0 +1,113 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from ingredient_parser import parse_multiple_ingredients
+from ingredient_parser._common import UREG
+from ingredient_parser._parallel import calculate_chunksize, rebind_units
+from ingredient_parser.dataclasses import ParsedIngredient
+from ingredient_parser.en import _foundationfoods
+from ingredient_parser.en._utils import ingredient_amount_factory
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tsp salt",
+    "3 large eggs, beaten",
+    "200 ml beef or chicken stock",
+    "1 lb 2 oz potatoes, peeled",
+] * 20
+
+
+class Test_calculate_chunksize:
+    def test_small_batch(self):
+        """
+        Test that a small batch gives a chunk size of at least 1.
+        """
+        assert calculate_chunksize(2, 8) == 1
+
+    def test_balanced(self):
+        """
+        Test that each worker is given approximately four chunks.
+        """
+        assert calculate_chunksize(100, 4) == 7
+
+    def test_max_chunksize(self):
+        """
+        Test that the chunk size is capped for very large batches.
+        """
+        assert calculate_chunksize(1_000_000, 4) == 256
+
+
+class Test_rebind_units:
+    def test_unpickled_units_use_library_registry(self):
+        """
+        Test that units unpickled into the application registry are rebound to the
+        library's unit registry, so density conversions still work.
+        """
+        amount = ingredient_amount_factory(
+            quantity="2", unit="cup", text="2 cup", confidence=1, starting_index=0
+        )
+        parsed = ParsedIngredient(
+            name=[],
+            size=None,
+            amount=[amount],
+            preparation=None,
+            comment=None,
+            purpose=None,
+            foundation_foods=[],
+            sentence="2 cups",
+        )
+        unpickled = rebind_units(pickle.loads(pickle.dumps(parsed)))
+        assert unpickled.amount[0].unit == UREG("cup").units
+        assert unpickled.amount[0].convert_to("g").unit == UREG("g").units
+
+
+class Test_parse_multiple_ingredients_parallel:
+    def test_workers_preserve_order(self):
+        """
+        Test that parsing with a process pool returns the same results, in the same
+        order, as parsing serially.
+        """
+        serial = parse_multiple_ingredients(SENTENCES)
+        parallel = parse_multiple_ingredients(SENTENCES, workers=2)
+        assert parallel == serial
+
+    @pytest.mark.parametrize("workers", [2, 4])
+    def test_small_batch(self, workers):
+        """
+        Test that a batch too small for a pool is still parsed correctly.
+        """
+        serial = parse_multiple_ingredients(SENTENCES[:3])
+        parallel = parse_multiple_ingredients(SENTENCES[:3], workers=workers)
+        assert parallel == serial
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_small_batch_foundation_foods(self, workers):
+        """
+        Test that a batch parsed in the calling process matches foundation foods for all
+        sentences in a single batch, the same as parsing serially.
+        """
+        serial = parse_multiple_ingredients(SENTENCES[:3], foundation_foods=True)
+        with patch.object(
+            _foundationfoods,
+            "match_foundation_foods_batch",
+            wraps=_foundationfoods.match_foundation_foods_batch,
+        ) as mock_match:
+            parallel = parse_multiple_ingredients(
+                SENTENCES[:3], workers=workers, foundation_foods=True
+            )
+
+        assert parallel == serial
+        mock_match.assert_called_once()
+
+    def test_executor(self):
+        """
+        Test that parsing with a user supplied executor returns the same results as
+        parsing serially.
+        """
+        serial = parse_multiple_ingredients(SENTENCES)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = parse_multiple_ingredients(SENTENCES, executor=executor)
+        assert parallel == serial
@@ -0,0 +1,297 @@
+import json
+import random
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from nltk.tag.perceptron import PerceptronTagger
+
+from ingredient_parser import set_pos_tagger_path
+from ingredient_parser._common import CACHE_DIR_ENV
+from ingredient_parser.en._loaders import (
+    POS_TAGGER_NAME,
+    POS_TAGGER_PATH_ENV,
+    IngredientPOSTagger,
+    converted_pos_tagger_path,
+    find_pos_tagger,
+    load_ingredient_pos_tagger,
+    load_pos_tagger,
+)
+from ingredient_parser.en._pos_tagger import VectorisedPerceptronTagger
+
+
+@pytest.fixture
+def tagger_dir(tmp_path, monkeypatch):
+    """Directory containing a minimal part of speech tagger that tags every token not
+    in the tagdict as NN. The cache directory is set to a temporary directory."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    files = {
+        "weights": {},
+        "tagdict": {"the": "DT"},
+        "classes": ["NN", "DT"],
+    }
+    for attr, content in files.items():
+        (tmp_path / f"{POS_TAGGER_NAME}.{attr}.json").write_text(json.dumps(content))
+
+    yield tmp_path
+    set_pos_tagger_path(None)
+
+
+@pytest.fixture(scope="module")
+def nltk_tagger():
+    """NLTK perceptron tagger trained on a small corpus of ingredient sentences."""
+    rng = random.Random(0)
+    quantities = ["1", "2", "1/2", "250", "3-4"]
+    units = [("cup", "NN"), ("cups", "NNS"), ("g", "NN"), ("tsp", "NN")]
+    adjectives = ["large", "fresh", "red", "small", "ground"]
+    nouns = [("onion", "NN"), ("flour", "NN"), ("eggs", "NNS"), ("garlic", "NN")]
+    preparations = ["chopped", "sliced", "peeled", "ground"]
+    corpus = []
+    for _ in range(200):
+        sentence = [(rng.choice(quantities), "CD"), rng.choice(units)]
+        if rng.random() < 0.5:
+            sentence.append((rng.choice(adjectives), "JJ"))
+        sentence.append(rng.choice(nouns))
+        if rng.random() < 0.5:
+            sentence.extend([(",", ","), (rng.choice(preparations), "VBN")])
+        corpus.append(sentence)
+
+    random.seed(0)
+    tagger = PerceptronTagger(load=False)
+    tagger.train(corpus, nr_iter=3)
+    return tagger
+
+
+SENTENCES = [
+    ["2", "cups", "flour"],
+    ["1", "large", "onion", ",", "chopped"],
+    ["1990", "g", "ground", "garlic", ",", "ground"],
+    ["2-3", "Tbsp", "unknown", "words", "only"],
+    ["a", "b"],
+    [],
+]
+
+
+class Test_VectorisedPerceptronTagger:
+    def test_same_tags_as_nltk(self, nltk_tagger):
+        """
+        Test that the tags are the same as NLTK's PerceptronTagger, including for
+        tokens without any known features, where the tie between classes is broken by
+        selecting the class that sorts last.
+        """
+        tagger = VectorisedPerceptronTagger.from_perceptron(nltk_tagger)
+        for tokens in SENTENCES:
+            assert tagger.tag(tokens) == nltk_tagger.tag(tokens)
+
+    def test_tag_many(self, nltk_tagger):
+        """
+        Test that tagging multiple sentences gives the same result as tagging each
+        sentence in turn.
+        """
+        tagger = VectorisedPerceptronTagger.from_perceptron(nltk_tagger)
+        assert tagger.tag_many(SENTENCES) == [tagger.tag(s) for s in SENTENCES]
+
+    def test_same_scores_as_nltk(self):
+        """
+        Test that the weights of each feature are summed in the same order as NLTK,
+        so classes whose scores differ only by rounding error are selected in the same
+        way.
+        """
+        nltk_tagger = PerceptronTagger(load=False)
+        nltk_tagger.classes = nltk_tagger.model.classes = {"JJ", "NN"}
+        # 0.1 + 0.2 + 0.3 != 0.3 + 0.2 + 0.1 in floating point arithmetic.
+        nltk_tagger.model.weights = {
+            "bias": {"NN": 0.3, "JJ": 0.1},
+            "i suffix alt": {"NN": 0.2, "JJ": 0.2},
+            "i word salt": {"NN": 0.1, "JJ": 0.3},
+        }
+        tagger = VectorisedPerceptronTagger.from_perceptron(nltk_tagger)
+        assert nltk_tagger.tag(["salt"]) == [("salt", "JJ")]
+        assert tagger.tag(["salt"]) == [("salt", "JJ")]
+
+    def test_tagdict(self, nltk_tagger):
+        """
+        Test that tokens in the tagdict are given the tag in the tagdict, and that
+        with_tagdict does not modify the original tagger.
+        """
+        tagger = VectorisedPerceptronTagger.from_perceptron(nltk_tagger)
+        extended = tagger.with_tagdict({"flour": "XX"})
+        assert extended.tag(["2", "cups", "flour"])[-1] == ("flour", "XX")
+        assert tagger.tag(["2", "cups", "flour"])[-1] == ("flour", "NN")
+
+    def test_save_load(self, nltk_tagger, tmp_path):
+        """
+        Test that a saved tagger gives the same tags when loaded.
+        """
+        tagger = VectorisedPerceptronTagger.from_perceptron(nltk_tagger)
+        tagger.save(tmp_path / "tagger.npz")
+        loaded = VectorisedPerceptronTagger.load(tmp_path / "tagger.npz")
+        assert loaded.tagdict == tagger.tagdict
+        assert loaded.tag_many(SENTENCES) == tagger.tag_many(SENTENCES)
+
+
+class Test_find_pos_tagger:
+    def test_set_path(self, tagger_dir):
+        """
+        Test that the directory set using set_pos_tagger_path is used.
+        """
+        set_pos_tagger_path(tagger_dir)
+        assert find_pos_tagger() == tagger_dir
+
+    def test_npz(self, tagger_dir):
+        """
+        Test that a directory only containing the tagger converted to a .npz file is
+        used.
+        """
+        set_pos_tagger_path(tagger_dir)
+        load_pos_tagger().save(tagger_dir / f"{POS_TAGGER_NAME}.npz")
+        for path in tagger_dir.glob("*.json"):
+            path.unlink()
+
+        assert find_pos_tagger() == tagger_dir
+        assert load_pos_tagger().tag(["the", "salt"]) == [("the", "DT"), ("salt", "NN")]
+
+    def test_environment_variable(self, tagger_dir, monkeypatch):
+        """
+        Test that the directory set using the environment variable is used.
+        """
+        monkeypatch.setenv(POS_TAGGER_PATH_ENV, str(tagger_dir))
+        assert find_pos_tagger() == tagger_dir
+
+    def test_not_found(self, tmp_path):
+        """
+        Test that a LookupError is raised, without attempting to download the tagger,
+        if the directory does not contain the tagger files.
+        """
+        set_pos_tagger_path(tmp_path)
+        try:
+            with (
+                patch("nltk.download") as mock_download,
+                pytest.raises(LookupError, match=POS_TAGGER_NAME),
+            ):
+                find_pos_tagger()
+        finally:
+            set_pos_tagger_path(None)
+
+        mock_download.assert_not_called()
+
+
+class Test_load_pos_tagger:
+    def test_load(self, tagger_dir):
+        """
+        Test that the tagger is loaded from the set directory.
+        """
+        set_pos_tagger_path(tagger_dir)
+        tagger = load_pos_tagger()
+        assert tagger.tag(["the", "salt"]) == [("the", "DT"), ("salt", "NN")]
+
+    def test_set_path_reloads(self, tagger_dir):
+        """
+        Test that setting the path causes the tagger to be loaded again.
+        """
+        set_pos_tagger_path(tagger_dir)
+        first = load_pos_tagger()
+        set_pos_tagger_path(tagger_dir)
+        assert load_pos_tagger() is not first
+
+    def test_converted_tagger_saved(self, tagger_dir):
+        """
+        Test that the tagger converted from the JSON files is saved to the cache
+        directory and loaded from there, without converting it again, next time.
+        """
+        set_pos_tagger_path(tagger_dir)
+        load_pos_tagger()
+        converted_path = converted_pos_tagger_path(tagger_dir)
+        assert converted_path.parent == tagger_dir / "cache"
+        assert converted_path.is_file()
+
+        set_pos_tagger_path(tagger_dir)
+        with patch.object(
+            VectorisedPerceptronTagger, "from_perceptron"
+        ) as mock_convert:
+            tagger = load_pos_tagger()
+
+        mock_convert.assert_not_called()
+        assert tagger.tag(["the", "salt"]) == [("the", "DT"), ("salt", "NN")]
+
+    def test_converted_tagger_changed(self, tagger_dir):
+        """
+        Test that the converted tagger is not used if the JSON files change.
+        """
+        set_pos_tagger_path(tagger_dir)
+        first_path = converted_pos_tagger_path(tagger_dir)
+        load_pos_tagger()
+
+        tagdict = tagger_dir / f"{POS_TAGGER_NAME}.tagdict.json"
+        tagdict.write_text(json.dumps({"the": "XX"}))
+        set_pos_tagger_path(tagger_dir)
+        assert converted_pos_tagger_path(tagger_dir) != first_path
+        assert load_pos_tagger().tag(["the"]) == [("the", "XX")]
+
+    def test_cache_dir_not_writable(self, tagger_dir, monkeypatch):
+        """
+        Test that the tagger is still loaded if it cannot be saved to the cache
+        directory.
+        """
+        cache_file = tagger_dir / "not_a_directory"
+        cache_file.write_text("")
+        monkeypatch.setenv(CACHE_DIR_ENV, str(cache_file))
+        set_pos_tagger_path(tagger_dir)
+        assert load_pos_tagger().tag(["the"]) == [("the", "DT")]
+
+    def test_lazy(self):
+        """
+        Test that importing the library does not load the tagger or attempt to
+        download it.
+        """
+        code = (
+            "import nltk; nltk.download = None; import ingredient_parser; "
+            "from ingredient_parser.en._loaders import load_pos_tagger; "
+            "print(load_pos_tagger.cache_info().currsize)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"NLTK_DATA": "/nonexistent"},
+        )
+        assert result.stdout.strip() == "0"
+
+
+class Test_IngredientPOSTagger:
+    def test_ingredient_tagdict(self, tagger_dir):
+        """
+        Test that the ingredient tagdict takes precedence over the tagger's tagdict.
+        """
+        set_pos_tagger_path(tagger_dir)
+        tagger = IngredientPOSTagger(load_pos_tagger(), {"the": "NN", "salt": "NN"})
+        assert tagger.tag(["the", "salt"]) == [("the", "NN"), ("salt", "NN")]
+
+    def test_base_tagger_unchanged(self, tagger_dir):
+        """
+        Test that the tagdict of the wrapped tagger is not modified.
+        """
+        set_pos_tagger_path(tagger_dir)
+        base = load_pos_tagger()
+        IngredientPOSTagger(base, {"the": "NN"})
+        assert base.tagdict == {"the": "DT"}
+
+    def test_tag_many(self):
+        """
+        Test that tagging multiple sentences gives the same result as tagging each
+        sentence in turn.
+        """
+        tagger = load_ingredient_pos_tagger()
+        sentences = [["2", "cups", "flour"], ["1", "large", "onion", ",", "chopped"]]
+        assert tagger.tag_many(sentences) == [tagger.tag(s) for s in sentences]
+
+    def test_set_path_reloads(self, tagger_dir):
+        """
+        Test that setting the path causes the ingredient tagger to be built again.
+        """
+        set_pos_tagger_path(tagger_dir)
+        first = load_ingredient_pos_tagger()
+        set_pos_tagger_path(tagger_dir)
+        assert load_ingredient_pos_tagger() is not first
@@ -0,0 +1,159 @@
+import json
+from fractions import Fraction
+
+import pytest
+
+from ingredient_parser import parse_ingredient
+from ingredient_parser._common import UREG
+from ingredient_parser.dataclasses import (
+    CompositeIngredientAmount,
+    FoundationFood,
+    IngredientAmount,
+    IngredientText,
+    ParsedIngredient,
+)
+
+SENTENCES = [
+    "2 cups flour",
+    "1 lb 2 oz potatoes, peeled",
+    "1-2 large onions, finely chopped",
+    "salt and pepper, to taste",
+    "a pinch of sugar",
+]
+
+
+@pytest.fixture
+def amount():
+    """IngredientAmount object with a Fraction quantity and pint unit."""
+    return IngredientAmount(
+        quantity=Fraction(3, 2),
+        quantity_max=Fraction(3, 2),
+        unit=UREG.Unit("cup"),
+        text="1 1/2 cups",
+        confidence=0.9,
+        starting_index=0,
+        APPROXIMATE=True,
+    )
+
+
+class Test_IngredientAmount_serialisation:
+    def test_to_dict(self, amount):
+        """
+        Test that Fractions are encoded as strings and pint units by name, with the
+        original types recorded.
+        """
+        d = amount.to_dict()
+        assert d["quantity"] == "3/2"
+        assert d["quantity_type"] == "fraction"
+        assert d["unit"] == "cup"
+        assert d["unit_type"] == "pint"
+        assert d["APPROXIMATE"] is True
+
+    def test_compact(self, amount):
+        """
+        Test that fields with default values are left out in compact mode.
+        """
+        assert amount.to_dict(compact=True) == {
+            "quantity": "3/2",
+            "unit": "cup",
+            "text": "1 1/2 cups",
+            "confidence": 0.9,
+            "starting_index": 0,
+            "APPROXIMATE": True,
+        }
+
+    @pytest.mark.parametrize("compact", [True, False])
+    def test_round_trip(self, amount, compact):
+        """
+        Test that from_dict recreates the original object, with the same types.
+        """
+        restored = IngredientAmount.from_dict(amount.to_dict(compact))
+        assert restored == amount
+        assert isinstance(restored.quantity, Fraction)
+        assert restored.convert_to("ml").unit == UREG.Unit("ml")
+
+    @pytest.mark.parametrize("compact", [True, False])
+    def test_round_trip_string_types(self, compact):
+        """
+        Test that string quantities and units are not converted by from_dict.
+        """
+        amount = IngredientAmount(
+            quantity="2",
+            quantity_max="2",
+            unit="handful",
+            text="2 handful",
+            confidence=0.8,
+            starting_index=0,
+        )
+        restored = IngredientAmount.from_dict(amount.to_dict(compact))
+        assert restored == amount
+        assert isinstance(restored.quantity, str)
+        assert isinstance(restored.unit, str)
+
+
+class Test_ParsedIngredient_serialisation:
+    @pytest.mark.parametrize("compact", [True, False])
+    @pytest.mark.parametrize("sentence", SENTENCES)
+    def test_round_trip(self, sentence, compact):
+        """
+        Test that ParsedIngredient objects are recreated from their JSON
+        representation.
+        """
+        parsed = parse_ingredient(sentence)
+        restored = ParsedIngredient.from_dict(json.loads(parsed.to_json(compact)))
+        assert restored == parsed
+
+    def test_composite_amount(self):
+        """
+        Test that CompositeIngredientAmount objects are identified and recreated.
+        """
+        parsed = parse_ingredient("1 lb 2 oz potatoes, peeled")
+        restored = ParsedIngredient.from_dict(parsed.to_dict())
+        assert isinstance(restored.amount[0], CompositeIngredientAmount)
+        assert restored.amount[0].combined() == parsed.amount[0].combined()
+
+    def test_does_not_copy(self):
+        """
+        Test that to_dict does not modify or copy the object.
+        """
+        parsed = parse_ingredient("2 cups flour")
+        d = parsed.to_dict()
+        assert d["name"][0]["text"] == "flour"
+        d["name"][0]["text"] = "sugar"
+        assert parsed.name[0].text == "flour"
+
+    def test_compact_omits_empty_fields(self):
+        """
+        Test that None and empty fields are left out in compact mode.
+        """
+        parsed = ParsedIngredient(
+            name=[IngredientText(text="salt", confidence=0.99, starting_index=0)],
+            size=None,
+            amount=[],
+            preparation=None,
+            comment=None,
+            purpose=None,
+            foundation_foods=[],
+            sentence="salt",
+        )
+        assert json.loads(parsed.to_json(compact=True)) == {
+            "name": [{"text": "salt", "confidence": 0.99, "starting_index": 0}],
+            "sentence": "salt",
+        }
+
+    def test_foundation_food(self):
+        """
+        Test that FoundationFood objects are recreated, including the url.
+        """
+        ff = FoundationFood(
+            text="Salt, table",
+            confidence=0.9,
+            fdc_id=746776,
+            category="Spices and Herbs",
+            data_type="foundation_food",
+            name_index=0,
+        )
+        for compact in [True, False]:
+            restored = FoundationFood.from_dict(ff.to_dict(compact))
+            assert restored.url == ff.url
+            assert restored.name_index == 0
@@ -0,0 +1,127 @@
+from unittest.mock import patch
+
+import pytest
+
+from ingredient_parser import TagCache, get_tag_cache, parse_ingredient, set_tag_cache
+from ingredient_parser._cache import LRUCache
+from ingredient_parser.en import parser
+from ingredient_parser.en.preprocess import PreProcessor
+
+
+@pytest.fixture
+def tag_cache():
+    """Replace the tag cache with an empty cache for the duration of a test."""
+    default = get_tag_cache()
+    cache = TagCache(maxsize=8)
+    set_tag_cache(cache)
+    yield cache
+    set_tag_cache(default)
+
+
+class Test_LRUCache:
+    def test_default(self):
+        """
+        Test that the default value is returned for a key not in the cache.
+        """
+        cache = LRUCache()
+        sentinel = object()
+        assert cache.get("salt", sentinel) is sentinel
+
+    def test_stores_value(self):
+        """
+        Test that the cached object itself is returned, not a copy.
+        """
+        cache = LRUCache()
+        value = ["salt"]
+        cache.set("salt", value)
+        assert cache.get("salt") is value
+
+
+class Test_tag_sentence:
+    def test_cache_hit_skips_model(self, tag_cache):
+        """
+        Test that the parser model is not used when tagging features that are already
+        in the cache.
+        """
+        features = PreProcessor("2 cups flour").sentence_features()
+        expected = parser.tag_sentence(features)
+
+        with patch.object(parser, "load_parser_model_pool") as mock_pool:
+            assert parser.tag_sentence(features) == expected
+
+        mock_pool.assert_not_called()
+        assert tag_cache.info().hits == 1
+
+    def test_returned_lists_are_copies(self, tag_cache):
+        """
+        Test that modifying the returned labels and scores does not modify the cached
+        entry.
+        """
+        features = PreProcessor("2 cups flour").sentence_features()
+        labels, scores = parser.tag_sentence(features)
+        labels[0], scores[0] = "COMMENT", 0.0
+
+        assert parser.tag_sentence(features) != (labels, scores)
+
+    def test_expect_name_in_output_in_key(self, tag_cache):
+        """
+        Test that the same features tagged with a different expect_name_in_output
+        value do not use the cached entry.
+        """
+        features = PreProcessor("2 cups flour").sentence_features()
+        parser.tag_sentence(features, expect_name_in_output=True)
+        parser.tag_sentence(features, expect_name_in_output=False)
+        assert tag_cache.info().hits == 0
+        assert len(tag_cache) == 2
+
+
+class Test_set_tag_cache:
+    def test_default(self):
+        """
+        Test that a tag cache is used by default.
+        """
+        assert isinstance(get_tag_cache(), TagCache)
+        assert get_tag_cache().maxsize == 16384
+
+    def test_disabled(self, tag_cache):
+        """
+        Test that the parser model is used every time if the tag cache is disabled.
+        """
+        features = PreProcessor("2 cups flour").sentence_features()
+        set_tag_cache(None)
+        expected = parser.tag_sentence(features)
+
+        with patch.object(
+            parser, "load_parser_model_pool", wraps=parser.load_parser_model_pool
+        ) as mock_pool:
+            assert parser.tag_sentence(features) == expected
+
+        mock_pool.assert_called_once()
+        assert len(tag_cache) == 0
+
+
+class Test_parse_ingredient_tag_cache:
+    def test_same_features_different_quantity(self, tag_cache):
+        """
+        Test that sentences that only differ by their quantity share a cache entry, but
+        are still parsed using their own tokens.
+        """
+        first = parse_ingredient("2 cups flour")
+        second = parse_ingredient("3 cups flour")
+
+        assert tag_cache.info().hits == 1
+        assert first.amount[0].quantity == 2
+        assert second.amount[0].quantity == 3
+        assert second.sentence == "3 cups flour"
+
+    def test_same_result_as_uncached(self, tag_cache):
+        """
+        Test that a sentence parsed using cached labels and scores is identical to the
+        same sentence parsed by the model.
+        """
+        parse_ingredient("1 large onion, finely chopped")
+        cached = parse_ingredient("2 large onion, finely chopped")
+
+        tag_cache.clear()
+        assert cached == parse_ingredient("2 large onion, finely chopped")
+        assert tag_cache.info().hits == 0
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from ingredient_parser import TagCache, get_tag_cache, parse_ingredient, set_tag_cache
+from ingredient_parser.en._loaders import TaggerPool, load_parser_model_pool
+
+# Feature sequences that result in different labels and marginals.
+FEATURE_SEQUENCES = [
+    [
+        {"stem": "!num", "is_numeric": True},
+        {"stem": "cup", "is_unit": True},
+        {"stem": "flour"},
+    ],
+    [
+        {"stem": "salt"},
+        {"stem": "and"},
+        {"stem": "pepper"},
+        {"stem": ","},
+        {"stem": "to"},
+        {"stem": "tast"},
+    ],
+    [
+        {"stem": "!num", "is_numeric": True},
+        {"stem": "larg"},
+        {"stem": "onion"},
+        {"stem": ","},
+        {"stem": "fine"},
+        {"stem": "chop"},
+    ],
+    [{"stem": "butter"}],
+]
+
+SENTENCES = [
+    "2 cups flour",
+    "salt and pepper, to taste",
+    "1 large onion, finely chopped",
+    "200 ml beef or chicken stock",
+    "1 lb 2 oz potatoes, peeled",
+    "3 large eggs, beaten",
+    "a pinch of sugar",
+    "24 fresh basil leaves or dried basil",
+]
+
+
+@pytest.fixture
+def no_tag_cache():
+    """Disable the tag cache for the duration of a test, so every sentence is tagged
+    using a Tagger checked out from the pool."""
+    default = get_tag_cache()
+    set_tag_cache(None)
+    yield
+    set_tag_cache(default)
+
+
+@pytest.fixture
+def tag_cache():
+    """Replace the tag cache with an empty cache for the duration of a test."""
+    default = get_tag_cache()
+    cache = TagCache(maxsize=4)
+    set_tag_cache(cache)
+    yield cache
+    set_tag_cache(default)
+
+
+def tag_with_pool(pool: TaggerPool, features: list[dict]):
+    """Tag features using a Tagger checked out from the pool and return the labels
+    and marginals.
+    """
+    with pool.checkout() as tagger:
+        labels = tagger.tag(features)
+        scores = [tagger.marginal(label, i) for i, label in enumerate(labels)]
+    return labels, scores
+
+
+class Test_TaggerPool:
+    def test_checkout_reuses_tagger(self):
+        """
+        Test that a Tagger returned to the pool is reused by the next checkout.
+        """
+        pool = TaggerPool("data/model.en.crfsuite")
+        with pool.checkout() as tagger1:
+            pass
+        with pool.checkout() as tagger2:
+            pass
+        assert tagger1 is tagger2
+
+    def test_nested_checkout_creates_new_tagger(self):
+        """
+        Test that a checked out Tagger is never given to another caller.
+        """
+        pool = TaggerPool("data/model.en.crfsuite")
+        with pool.checkout() as tagger1:
+            with pool.checkout() as tagger2:
+                assert tagger1 is not tagger2
+
+    def test_concurrent_tagging(self):
+        """
+        Test that labels and scores calculated concurrently from multiple threads are
+        identical to those calculated serially.
+        """
+        pool = load_parser_model_pool()
+        expected = [tag_with_pool(pool, f) for f in FEATURE_SEQUENCES]
+
+        jobs = FEATURE_SEQUENCES * 500
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda f: tag_with_pool(pool, f), jobs))
+
+        for i, result in enumerate(results):
+            assert result == expected[i % len(FEATURE_SEQUENCES)]
+
+
+class Test_parse_ingredient_thread_safety:
+    def test_concurrent_parsing(self, no_tag_cache):
+        """
+        Test that parsing sentences concurrently from multiple threads gives identical
+        results to parsing them serially, with every sentence tagged by the parser
+        model.
+        """
+        expected = [parse_ingredient(s) for s in SENTENCES]
+
+        pool = load_parser_model_pool()
+        jobs = SENTENCES * 50
+        with (
+            patch.object(pool, "checkout", wraps=pool.checkout) as mock_checkout,
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            results = list(executor.map(parse_ingredient, jobs))
+
+        assert mock_checkout.call_count == len(jobs)
+        for i, result in enumerate(results):
+            assert result == expected[i % len(SENTENCES)]
+
+    def test_concurrent_parsing_tag_cache(self, tag_cache):
+        """
+        Test that parsing sentences concurrently from multiple threads gives identical
+        results to parsing them serially when using a tag cache that is too small to
+        hold every sentence, so entries are added and evicted concurrently.
+        """
+        expected = [parse_ingredient(s) for s in SENTENCES]
+
+        jobs = SENTENCES * 50
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse_ingredient, jobs))
+
+        for i, result in enumerate(results):
+            assert result == expected[i % len(SENTENCES)]
+
+        info = tag_cache.info()
+        assert info.hits > 0
+        assert info.currsize <= tag_cache.maxsize
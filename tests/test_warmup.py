@@ -0,0 +1,69 @@
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+from ingredient_parser import warmup
+from ingredient_parser.dataclasses import WarmupReport
+from ingredient_parser.en import _loaders
+
+
+class Test_warmup:
+    def test_report(self):
+        """
+        Test that a time is reported for each resource.
+        """
+        report = warmup()
+        assert isinstance(report, WarmupReport)
+        assert list(report.timings) == [
+            "parser_model",
+            "ingredient_tagdict",
+            "pos_tagger",
+            "ingredient_pos_tagger",
+            "unit_registry",
+        ]
+        assert all(t >= 0 for t in report.timings.values())
+        assert report.total == sum(report.timings.values())
+
+    def test_string_units(self):
+        """
+        Test that the unit registry is not created when string_units is True.
+        """
+        report = warmup(string_units=True)
+        assert "unit_registry" not in report.timings
+
+    def test_foundation_foods(self):
+        """
+        Test that the foundation foods resources are loaded when foundation_foods is
+        True.
+        """
+        report = warmup(foundation_foods=True)
+        for name in ["embeddings", "fdc_ingredients", "usif_matcher", "fuzzy_matcher"]:
+            assert name in report.timings
+
+    def test_background(self):
+        """
+        Test that a Future is returned that resolves to the report.
+        """
+        future = warmup(background=True)
+        assert isinstance(future, Future)
+        assert isinstance(future.result(timeout=60), WarmupReport)
+
+    def test_background_exception(self):
+        """
+        Test that an exception raised whilst loading in the background is raised by
+        the Future.
+        """
+        with patch.object(
+            _loaders, "load_ingredient_tagdict", side_effect=OSError("Not found")
+        ):
+            future = warmup(background=True)
+            with pytest.raises(OSError, match="Not found"):
+                future.result(timeout=60)
+
+    def test_unsupported_language(self):
+        """
+        Test that a ValueError is raised for an unsupported language.
+        """
+        with pytest.raises(ValueError, match="Unsupported language"):
+            warmup(lang="fr")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import argparse
+import gzip
+from pathlib import Path
+
+import numpy as np
+
+
+def read_text_embeddings(path: str) -> tuple[list[str], np.ndarray]:
+    """Read embeddings from gzipped text file in word2vec format.
+
+    The header on the first line is skipped. Every vector in the file is read, even
+    if there are more vectors than the vocabulary size given in the header.
+
+    Parameters
+    ----------
+    path : str
+        Path to gzipped text embeddings file.
+
+    Returns
+    -------
+    tuple[list[str], np.ndarray]
+        List of tokens and float32 matrix with the vector for each token in the same
+        order.
+    """
+    vocab, vectors = [], []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        f.readline()
+        for line in f:
+            token, *values = line.rstrip().split()
+            vocab.append(token)
+            vectors.append([float(v) for v in values])
+
+    return vocab, np.array(vectors, dtype=np.float32)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert gzipped text embeddings to a .npy matrix and a vocabulary "
+        "file, which GloVeModel can memory map."
+    )
+    parser.add_argument(
+        "--input",
+        default="ingredient_parser/en/data/ingredient_embeddings.25d.glove.txt.gz",
+        help="Path to gzipped text embeddings file.",
+    )
+    parser.add_argument(
+        "--output",
+        default="ingredient_parser/en/data/ingredient_embeddings.25d.glove.npy",
+        help="Path to save .npy file to. The vocabulary is saved alongside it, "
+        "with the suffix .vocab.txt.",
+    )
+    args = parser.parse_args()
+
+    vocab, matrix = read_text_embeddings(args.input)
+
+    output = Path(args.output)
+    np.save(output, matrix)
+    output.with_suffix(".vocab.txt").write_text("\n".join(vocab) + "\n", "utf-8")
+    print(f"Saved {matrix.shape[0]} vectors of {matrix.shape[1]} dimensions.")
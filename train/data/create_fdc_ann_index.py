@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure the local ingredient_parser package can be found
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ingredient_parser.en._ann import IVFIndex
+from ingredient_parser.en._foundationfoods import get_usif_matcher
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Create an approximate nearest neighbour index of the FDC "
+        "ingredient vectors, for use with set_fdc_ann_index. This must be run again "
+        "whenever the FDC index changes."
+    )
+    parser.add_argument(
+        "--output",
+        default="fdc_ann_index.npz",
+        help="Path to save .npz file to.",
+    )
+    parser.add_argument(
+        "--lists",
+        type=int,
+        default=None,
+        help="Number of lists to cluster the FDC ingredients into. "
+        "Default is the square root of the number of FDC ingredients.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=20,
+        help="Number of iterations of k-means.",
+    )
+    args = parser.parse_args()
+
+    matcher = get_usif_matcher()
+    index = IVFIndex.build(
+        matcher.fdc_unit_vectors, n_lists=args.lists, n_iter=args.iterations
+    )
+    index.save(args.output)
+    print(
+        f"Saved index of {len(index)} FDC ingredients in {index.n_lists} lists "
+        f"to {args.output}."
+    )
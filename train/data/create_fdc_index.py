@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure the local ingredient_parser package can be found
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ingredient_parser.en._foundationfoods import (
+    FDC_INDEX_FILE,
+    read_fdc_ingredients_csv,
+    uSIF,
+)
+from ingredient_parser.en._loaders import load_embeddings_model
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Create the FDC index loaded by the foundation food matchers from "
+        "fdc_ingredients.csv.gz and the embeddings. This must be run again whenever "
+        "either of them change."
+    )
+    parser.add_argument(
+        "--output",
+        default=f"ingredient_parser/en/{FDC_INDEX_FILE}",
+        help="Path to save .npz file to.",
+    )
+    args = parser.parse_args()
+
+    index = uSIF(load_embeddings_model(), read_fdc_ingredients_csv()).to_index()
+    index.save(args.output)
+    print(f"Saved {len(index.fdc_ingredients)} FDC ingredients to {args.output}.")
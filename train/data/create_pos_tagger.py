@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+from nltk.tag.perceptron import PerceptronTagger
+
+# Ensure the local ingredient_parser package can be found
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from ingredient_parser.en import PreProcessor
+from ingredient_parser.en._loaders import (
+    POS_TAGGER_NAME,
+    POS_TAGGER_PATH_ENV,
+    find_pos_tagger,
+    load_ingredient_tagdict,
+    load_nltk_pos_tagger,
+)
+from ingredient_parser.en._pos_tagger import VectorisedPerceptronTagger
+from ingredient_parser.en._utils import tokenize
+
+CSV_FILES = sorted(str(path) for path in Path("train/data").glob("*/*.csv"))
+
+
+def load_sentence_tokens(paths: list[str]) -> list[list[str]]:
+    """Load training sentences from csv files and tokenize them.
+
+    The tokens are the same as those tagged by the PreProcessor.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Paths to csv files of training sentences, with the sentences in the "input"
+        column.
+
+    Returns
+    -------
+    list[list[str]]
+        List of tokens for each sentence.
+    """
+    sentences = []
+    for path in paths:
+        with open(path, "r") as f:
+            sentences.extend(row["input"] for row in csv.DictReader(f))
+
+    return [tokenize(PreProcessor._normalise(sentence)) for sentence in sentences]
+
+
+def validate(
+    tagger: VectorisedPerceptronTagger,
+    nltk_tagger: PerceptronTagger,
+    sentences: list[list[str]],
+) -> int:
+    """Compare tags from converted tagger with NLTK's tagger.
+
+    Both taggers use the ingredient tagdict, as used by the PreProcessor.
+
+    Parameters
+    ----------
+    tagger : VectorisedPerceptronTagger
+        Converted tagger.
+    nltk_tagger : PerceptronTagger
+        NLTK tagger.
+    sentences : list[list[str]]
+        List of tokens for each sentence.
+
+    Returns
+    -------
+    int
+        Number of sentences with different tags.
+    """
+    ingredient_tagdict = load_ingredient_tagdict()
+    tagger = tagger.with_tagdict({**tagger.tagdict, **ingredient_tagdict})
+    nltk_tagger.tagdict.update(ingredient_tagdict)
+
+    start = time.perf_counter()
+    expected = [nltk_tagger.tag(tokens) for tokens in sentences]
+    nltk_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tagged = tagger.tag_many(sentences)
+    tag_many_time = time.perf_counter() - start
+
+    mismatches = 0
+    for tokens, nltk_tags, tags in zip(sentences, expected, tagged):
+        if tags != nltk_tags:
+            mismatches += 1
+            print(f"Mismatch: {' '.join(tokens)}")
+            print(f"  NLTK:      {nltk_tags}")
+            print(f"  Converted: {tags}")
+
+    n_tokens = sum(len(tokens) for tokens in sentences)
+    print(f"{len(sentences) - mismatches}/{len(sentences)} sentences agree.")
+    print(f"NLTK: {1e6 * nltk_time / n_tokens:.2f} us/token")
+    print(f"tag_many: {1e6 * tag_many_time / n_tokens:.2f} us/token")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert NLTK's averaged perceptron part of speech tagger to the "
+        ".npz format loaded by VectorisedPerceptronTagger, and check that it gives "
+        "the same tags as NLTK on the training sentences. The converted tagger is "
+        f"saved as {POS_TAGGER_NAME}.npz in the output directory. To use it, set the "
+        "output directory with set_pos_tagger_path or the "
+        f"{POS_TAGGER_PATH_ENV} environment variable, or use the directory "
+        "containing NLTK's JSON files as the output directory."
+    )
+    parser.add_argument(
+        "--input",
+        help="Directory containing NLTK's averaged_perceptron_tagger_eng JSON files. "
+        "Default is the directory found by find_pos_tagger.",
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help=f"Directory to save {POS_TAGGER_NAME}.npz to.",
+    )
+    parser.add_argument(
+        "--csv",
+        nargs="+",
+        default=CSV_FILES,
+        help="Paths to csv files of training sentences, for checking the converted "
+        "tagger. Default is every csv file in the train/data subdirectories.",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Do not check the converted tagger against NLTK's tagger.",
+    )
+    args = parser.parse_args()
+
+    input_dir = Path(args.input) if args.input else find_pos_tagger()
+    nltk_tagger = load_nltk_pos_tagger(input_dir)
+    tagger = VectorisedPerceptronTagger.from_perceptron(nltk_tagger)
+
+    if not args.no_validate:
+        sentences = load_sentence_tokens(args.csv)
+        if validate(tagger, nltk_tagger, sentences) > 0:
+            sys.exit("Converted tagger does not agree with NLTK, not saving.")
+
+    output = Path(args.output) / f"{POS_TAGGER_NAME}.npz"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tagger.save(output)
+    print(f"Saved {tagger} to {output}.")